@@ -1,78 +1,55 @@
+import importlib
 import json
 import os
 import re
 from collections import namedtuple
 from datetime import datetime, timedelta, time
-from typing import Optional, Tuple, Union
+from functools import lru_cache, partial
+from threading import Lock
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional, Tuple, Union
 
-import dateparser # fallback parser
-from dateparser.search import search_dates
-from ovos_config import Configuration
 from ovos_utils.log import LOG
 from ovos_utils.time import now_local
 
-from ovos_date_parser.common import nice_duration_generic, nice_relative_time_generic
-from ovos_date_parser.dates_az import (
-    extract_datetime_az, extract_duration_az, nice_duration_az, nice_time_az,
-)
-from ovos_date_parser.dates_ca import (
-    TimeVariantCA, extract_datetime_ca, nice_time_ca, extract_duration_ca
-)
-from ovos_date_parser.dates_cs import (
-    extract_duration_cs, extract_datetime_cs, nice_time_cs
-)
-from ovos_date_parser.dates_da import (
-    extract_datetime_da, extract_duration_da, nice_time_da,
-)
-from ovos_date_parser.dates_de import (
-    extract_datetime_de, extract_duration_de, nice_time_de,
-)
-from ovos_date_parser.dates_en import (
-    extract_datetime_en, extract_duration_en, nice_time_en
-)
-from ovos_date_parser.dates_es import (
-    extract_datetime_es, extract_duration_es, nice_time_es, nice_date_time_es, nice_date_es,
-    nice_weekday_es, nice_day_es, nice_year_es, nice_month_es
-)
-from ovos_date_parser.dates_eu import (
-    extract_datetime_eu, nice_time_eu, nice_relative_time_eu,
-)
-from ovos_date_parser.dates_fa import (
-    extract_datetime_fa, nice_time_fa, extract_duration_fa,
-)
-from ovos_date_parser.dates_fr import (
-    extract_datetime_fr, nice_time_fr
-)
-from ovos_date_parser.dates_gl import (
-    extract_duration_gl, nice_year_gl, nice_weekday_gl, nice_month_gl,
-    nice_day_gl, nice_date_time_gl, nice_date_gl, nice_time_gl
-)
-from ovos_date_parser.dates_hu import nice_time_hu
-from ovos_date_parser.dates_it import (
-    extract_datetime_it, nice_time_it
-)
-from ovos_date_parser.dates_nl import (
-    extract_datetime_nl, nice_part_of_day_nl, extract_duration_nl, nice_time_nl
+from ovos_date_parser.anchors import extract_datetime_many
+from ovos_date_parser.bulk import nice_duration_batch, nice_relative_time_batch
+from ovos_date_parser.cache import (
+    cached_extract_datetime, cached_extract_duration, cached_format, disable_extract_cache,
+    disable_format_cache, enable_extract_cache, enable_format_cache, extract_cache_info, format_cache_info,
+    prewarm_nice_time
 )
-from ovos_date_parser.dates_pl import (
-    extract_datetime_pl, extract_duration_pl, nice_time_pl, nice_duration_pl
-)
-from ovos_date_parser.dates_pt import (
-    extract_datetime_pt, extract_duration_pt, nice_time_pt, nice_date_pt, nice_year_pt, nice_date_time_pt,
-    nice_month_pt, nice_weekday_pt, nice_day_pt
-)
-from ovos_date_parser.dates_ru import (
-    extract_datetime_ru, extract_duration_ru, nice_time_ru, nice_duration_ru
-)
-from ovos_date_parser.dates_sl import (
-    nice_time_sl
-)
-from ovos_date_parser.dates_sv import (
-    extract_datetime_sv, extract_duration_sv, nice_time_sv
+from ovos_date_parser.common import nice_duration_generic, nice_relative_time_generic
+from ovos_date_parser.parallel import parallel_extract
+from ovos_date_parser.prefilter import has_datetime, has_duration, skip_extract
+from ovos_date_parser.prepared import PreparedText, prepare
+from ovos_date_parser.registry import (
+    LANG_MODULES, closest_resource_lang, get_implementation, get_capabilities, get_supported_langs,
+    is_supported, normalize_lang, preload
 )
-from ovos_date_parser.dates_uk import (
-    extract_datetime_uk, extract_duration_uk, nice_time_uk, nice_duration_uk
+from ovos_date_parser.spans import (
+    DateTimeMatch, DurationMatch, _DURATIONS, _without_durations, extract_datetime_span, extract_datetimes
 )
+from ovos_date_parser.years import _stored_year
+
+if TYPE_CHECKING:
+    from ovos_date_parser.dates_ca import TimeVariantCA
+
+# language specific names historically importable from the package root,
+# resolved lazily so importing ovos_date_parser does not load every language
+_LAZY_ATTRS = {
+    "TimeVariantCA": "ca",
+    "nice_part_of_day_nl": "nl",
+}
+
+
+def __getattr__(name):
+    code = _LAZY_ATTRS.get(name) or name.rsplit("_", 1)[-1]
+    if code in LANG_MODULES:
+        module = importlib.import_module(f"ovos_date_parser.dates_{code}")
+        if hasattr(module, name):
+            return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def nice_time(
@@ -81,7 +58,7 @@ def nice_time(
         speech: bool = True,
         use_24hour: bool = False,
         use_ampm: bool = False,
-        variant: Optional[TimeVariantCA] = None,
+        variant: Optional["TimeVariantCA"] = None,
 ) -> str:
     """
     Format a time to a comfortable human format.
@@ -97,47 +74,16 @@ def nice_time(
     Returns:
         The formatted time string.
     """
-    if lang.startswith("az"):
-        return nice_time_az(dt, speech, use_24hour, use_ampm)
-    if lang.startswith("gl"):
-        return nice_time_gl(dt, speech, use_24hour, use_ampm)
-    if lang.startswith("ca"):
-        return nice_time_ca(dt, speech, use_24hour, use_ampm, variant=variant)
-    if lang.startswith("cs"):
-        return nice_time_cs(dt, speech, use_24hour, use_ampm)
-    if lang.startswith("da"):
-        return nice_time_da(dt, speech, use_24hour, use_ampm)
-    if lang.startswith("de"):
-        return nice_time_de(dt, speech, use_24hour, use_ampm)
-    if lang.startswith("en"):
-        return nice_time_en(dt, speech, use_24hour, use_ampm)
-    if lang.startswith("es"):
-        return nice_time_es(dt, speech, use_24hour, use_ampm)
-    if lang.startswith("eu"):
-        return nice_time_eu(dt, speech, use_24hour, use_ampm)
-    if lang.startswith("fa"):
-        return nice_time_fa(dt, speech, use_24hour, use_ampm)
-    if lang.startswith("fr"):
-        return nice_time_fr(dt, speech, use_24hour, use_ampm)
-    if lang.startswith("hu"):
-        return nice_time_hu(dt, speech, use_24hour, use_ampm)
-    if lang.startswith("it"):
-        return nice_time_it(dt, speech, use_24hour, use_ampm)
-    if lang.startswith("nl"):
-        return nice_time_nl(dt, speech, use_24hour, use_ampm)
-    if lang.startswith("pl"):
-        return nice_time_pl(dt, speech, use_24hour, use_ampm)
-    if lang.startswith("pt"):
-        return nice_time_pt(dt, speech, use_24hour, use_ampm)
-    if lang.startswith("ru"):
-        return nice_time_ru(dt, speech, use_24hour, use_ampm)
-    if lang.startswith("sv"):
-        return nice_time_sv(dt, speech, use_24hour, use_ampm)
-    if lang.startswith("sl"):
-        return nice_time_sl(dt, speech, use_24hour, use_ampm)
-    if lang.startswith("uk"):
-        return nice_time_uk(dt, speech, use_24hour, use_ampm)
-    raise NotImplementedError(f"Unsupported language: {lang}")
+    impl = get_implementation("nice_time", lang)
+    if impl is None:
+        raise NotImplementedError(f"Unsupported language: {lang}")
+    code = normalize_lang(lang)
+    # NOTE: output only depends on the hour and minute of dt
+    if code == "ca":
+        return cached_format(("nice_time", code, dt.hour, dt.minute, speech, use_24hour, use_ampm, variant),
+                             impl, dt, speech, use_24hour, use_ampm, variant=variant)
+    return cached_format(("nice_time", code, dt.hour, dt.minute, speech, use_24hour, use_ampm, None),
+                         impl, dt, speech, use_24hour, use_ampm)
 
 
 def nice_relative_time(when, relative_to, lang):
@@ -152,8 +98,9 @@ def nice_relative_time(when, relative_to, lang):
     Returns:
         str: Relative description of the given time
     """
-    if lang.startswith("eu"):
-        return nice_relative_time_eu(when, relative_to)
+    impl = get_implementation("nice_relative_time", lang)
+    if impl is not None:
+        return impl(when, relative_to)
     return nice_relative_time_generic(lang, when, relative_to)
 
 
@@ -171,14 +118,20 @@ def nice_duration(
     Returns:
         Timespan as a string.
     """
-    if lang.startswith("az"):
-        return nice_duration_az(duration, speech)
-    if lang.startswith("pl"):
-        return nice_duration_pl(duration, speech)
-    if lang.startswith("ru"):
-        return nice_duration_ru(duration, speech)
-    if lang.startswith("uk"):
-        return nice_duration_uk(duration, speech)
+    impl = get_implementation("nice_duration", lang)
+    # only whole seconds are memoized, 5 and 5.0 hash the same but may not
+    # format the same
+    if type(duration) is int or (isinstance(duration, timedelta) and not duration.microseconds):
+        if impl is not None:
+            return cached_format(("nice_duration", normalize_lang(lang), duration, speech),
+                                 impl, duration, speech)
+        # number words depend on the region ("pt-br" and "pt-pt" differ),
+        # only case and separator are normalized
+        tag = lang.lower().replace("_", "-")
+        return cached_format(("nice_duration", tag, duration, speech),
+                             nice_duration_generic, tag, duration, speech)
+    if impl is not None:
+        return impl(duration, speech)
     return nice_duration_generic(lang, duration, speech)
 
 
@@ -189,43 +142,19 @@ def extract_duration(
     Convert a phrase into a number of seconds and return the remainder text.
 
     Args:
-        text: String containing a duration.
+        text: String containing a duration, can be a PreparedText.
         lang: A BCP-47 language code.
 
     Returns:
         A tuple containing the duration as timedelta and the remaining text.
     """
-    if lang.startswith("az"):
-        return extract_duration_az(text)
-    if lang.startswith("ca"):
-        return extract_duration_ca(text)
-    if lang.startswith("cs"):
-        return extract_duration_cs(text)
-    if lang.startswith("da"):
-        return extract_duration_da(text)
-    if lang.startswith("de"):
-        return extract_duration_de(text)
-    if lang.startswith("en"):
-        return extract_duration_en(text)
-    if lang.startswith("es"):
-        return extract_duration_es(text)
-    if lang.startswith("gl"):
-        return extract_duration_gl(text)
-    if lang.startswith("fa"):
-        return extract_duration_fa(text)
-    if lang.startswith("nl"):
-        return extract_duration_nl(text)
-    if lang.startswith("pl"):
-        return extract_duration_pl(text)
-    if lang.startswith("pt"):
-        return extract_duration_pt(text)
-    if lang.startswith("ru"):
-        return extract_duration_ru(text)
-    if lang.startswith("sv"):
-        return extract_duration_sv(text)
-    if lang.startswith("uk"):
-        return extract_duration_uk(text)
-    raise NotImplementedError(f"Unsupported language: {lang}")
+    impl = get_implementation("extract_duration", lang)
+    if impl is None:
+        raise NotImplementedError(f"Unsupported language: {lang}")
+    code = normalize_lang(lang)
+    if skip_extract("extract_duration", text, code):
+        return None
+    return cached_extract_duration(impl, text, code)
 
 
 def extract_datetime(
@@ -238,7 +167,7 @@ def extract_datetime(
     Extract date and time information from a sentence.
 
     Args:
-        text: The text to be interpreted.
+        text: The text to be interpreted, can be a PreparedText.
         lang: The BCP-47 code for the language to use.
         anchorDate: Date to use for relative dating.
         default_time: Time to use if none was found in the input string.
@@ -247,41 +176,24 @@ def extract_datetime(
         A tuple with the extracted date as datetime and the leftover string,
         or None if no date or time related text is found.
     """
-    if lang.startswith("az"):
-        return extract_datetime_az(text, anchorDate=anchorDate, default_time=default_time)
-    if lang.startswith("ca"):
-        return extract_datetime_ca(text, anchorDate=anchorDate, default_time=default_time)
-    if lang.startswith("cs"):
-        return extract_datetime_cs(text, anchorDate=anchorDate, default_time=default_time)
-    if lang.startswith("da"):
-        return extract_datetime_da(text, anchorDate=anchorDate, default_time=default_time)
-    if lang.startswith("de"):
-        return extract_datetime_de(text, anchorDate=anchorDate, default_time=default_time)
-    if lang.startswith("en"):
-        return extract_datetime_en(text, anchorDate=anchorDate, default_time=default_time)
-    if lang.startswith("es"):
-        return extract_datetime_es(text, anchorDate=anchorDate, default_time=default_time)
-    if lang.startswith("fa"):
-        return extract_datetime_fa(text, anchorDate=anchorDate, default_time=default_time)
-    if lang.startswith("fr"):
-        return extract_datetime_fr(text, anchorDate=anchorDate, default_time=default_time)
-    if lang.startswith("it"):
-        return extract_datetime_it(text, anchorDate=anchorDate, default_time=default_time)
-    if lang.startswith("nl"):
-        return extract_datetime_nl(text, anchorDate=anchorDate, default_time=default_time)
-    if lang.startswith("pl"):
-        return extract_datetime_pl(text, anchorDate=anchorDate, default_time=default_time)
-    if lang.startswith("pt"):
-        return extract_datetime_pt(text, anchorDate=anchorDate, default_time=default_time)
-    if lang.startswith("ru"):
-        return extract_datetime_ru(text, anchor_date=anchorDate, default_time=default_time)
-    if lang.startswith("sv"):
-        return extract_datetime_sv(text, anchorDate=anchorDate, default_time=default_time)
-    if lang.startswith("uk"):
-        return extract_datetime_uk(text, anchor_date=anchorDate, default_time=default_time)
-
-    # fallback parser
+    impl = get_implementation("extract_datetime", lang)
+    if impl is not None:
+        code = normalize_lang(lang)
+        if skip_extract("extract_datetime", text, code):
+            return None
+        # NOTE: anchor passed positionally, ru/uk name it "anchor_date"
+        return cached_extract_datetime(impl, text, code, anchorDate, default_time)
+    return cached_extract_datetime(partial(_extract_datetime_fallback, lang=lang),
+                                   text, lang, anchorDate, default_time)
+
+
+def _extract_datetime_fallback(text: str, anchorDate: Optional[datetime],
+                               default_time: Optional[time], lang: str):
+    # fallback parser, imported on demand since it is slow to import
     LOG.warning(f"{lang} is not implemented! attempting to use fallback date parser")
+    import dateparser
+    from dateparser.search import search_dates
+    from ovos_config import Configuration
 
     tzstr = Configuration()["location"]["timezone"]["code"]
     fmt = Configuration().get("date_format", 'DMY')
@@ -314,130 +226,314 @@ def extract_datetime(
     raise NotImplementedError(f"Unsupported language: {lang}")
 
 
+def extract_datetime_batch(
+        items: Iterable[Tuple[str, Optional[datetime]]],
+        lang: str,
+        default_time: Optional[time] = None,
+) -> Iterator[Optional[Tuple[datetime, str]]]:
+    """
+    Extract date and time information from many sentences in the same language.
+
+    The language implementation is resolved once and its precomputed word
+    lists are shared by every item. Results are yielded lazily, in input
+    order, so memory stays flat on large inputs.
+
+    Args:
+        items: Iterable of (text, anchorDate) pairs, anchorDate may be None.
+        lang: The BCP-47 code for the language to use.
+        default_time: Time to use if none was found in the input string.
+
+    Returns:
+        A generator with one extract_datetime result per item.
+    """
+    impl = get_implementation("extract_datetime", lang)
+    if impl is None:
+        # dateparser fallback
+        for text, anchorDate in items:
+            yield extract_datetime(text, lang, anchorDate, default_time)
+        return
+    code = normalize_lang(lang)
+    for text, anchorDate in items:
+        if skip_extract("extract_datetime", text, code):
+            yield None
+        else:
+            yield impl(text, anchorDate, default_time)
+
+
+# extract_temporal result, either value may be None
+Temporal = namedtuple("Temporal", ["duration", "datetime", "remainder"])
+
+
+def extract_temporal(
+        text: str,
+        lang: str,
+        anchorDate: Optional[datetime] = None,
+        default_time: Optional[time] = None,
+) -> Temporal:
+    """
+    Extract a duration and a date from the same sentence.
+
+    The date is parsed from the text first and the duration from the
+    words the date did not consume, so a relative date such as "in 2 days
+    at 5 pm" stays a date. Durations the parsers would add to the date next
+    to them, as "for 20 minutes" in "for 20 minutes tomorrow at 7", are cut
+    out before the date is parsed (currently de, en, es and pt).
+
+    This is a convenience wrapper, not a faster path: the durations are
+    scanned and the date is parsed with their own normalizers, about the
+    cost of calling extract_duration and extract_datetime one after the
+    other. The results are consistent with each other, no word is read as
+    both a duration and a date.
+
+    Args:
+        text: The text to be interpreted, can be a PreparedText.
+        lang: The BCP-47 code for the language to use.
+        anchorDate: Date to use for relative dating.
+        default_time: Time to use if no time was found for the date.
+
+    Returns:
+        Temporal(duration, datetime, remainder), duration is None if the
+        language has no extract_duration, remainder is the text neither of
+        them consumed.
+    """
+    text = prepare(text, lang)
+    code = normalize_lang(lang)
+    if code in _DURATIONS:
+        cut, duration = _without_durations(text, code)
+        if duration is not None:
+            found = extract_datetime(cut, lang, anchorDate, default_time) if cut else None
+            if found is None:
+                result = extract_duration(text, lang)
+                return Temporal(duration, None, result[1] if result else str(text))
+            return Temporal(duration, found[0], found[1])
+    found = extract_datetime(text, lang, anchorDate, default_time)
+    date, remainder = (None, text) if found is None else found
+    duration = None
+    # most remainders have no unit word left, skip normalizing them again
+    if remainder and get_implementation("extract_duration", lang) is not None and has_duration(remainder, code):
+        result = extract_duration(remainder, lang)
+        if result is not None and result[0] is not None:
+            duration, remainder = result
+    return Temporal(duration, date, str(remainder))
+
+
 NUMBER_TUPLE = namedtuple(
     'number',
     ('x, xx, x0, x_in_x0, xxx, x00, x_in_x00, xx00, xx_in_xx00, x000, ' +
      'x_in_x000, x0_in_x000, x_in_0x00'))
 
 
+# a rule section of date_time.json, (compiled match, format) pairs in
+# priority order and the format used when none of them matches
+_FormatRules = namedtuple("_FormatRules", ("rules", "default"))
+
+# date_time.json of a language compiled for formatting, the "weekday",
+# "month", "date" and "number" sections are tuples indexed by number,
+# None where the file has no entry
+_LangFormats = namedtuple(
+    "_LangFormats",
+    ("decade_format", "hundreds_format", "thousand_format", "year_format", "bc",
+     "date_format", "date_format_no_weekday", "date_time",
+     "weekday", "month", "date", "number"))
+
+_WEEKDAY_FIELD = re.compile(r"{weekday}\s*,?\s*")
+_SPACES = re.compile(' +')
+
+
+def _compile_rules(section: dict) -> _FormatRules:
+    rules = []
+    i = 1
+    while section.get(str(i)):
+        rules.append((re.compile(section[str(i)]['match']), section[str(i)]['format']))
+        i = i + 1
+    return _FormatRules(tuple(rules), section['default'])
+
+
+def _lookup_table(section: dict) -> tuple:
+    size = max(int(key) for key in section) + 1
+    return tuple(section.get(str(i)) for i in range(size))
+
+
+def _compile_formats(config: dict) -> _LangFormats:
+    date_format = config['date_format']
+    return _LangFormats(
+        decade_format=_compile_rules(config['decade_format']),
+        hundreds_format=_compile_rules(config['hundreds_format']),
+        thousand_format=_compile_rules(config['thousand_format']),
+        year_format=_compile_rules(config['year_format']),
+        bc=config['year_format'].get('bc', ''),
+        date_format=MappingProxyType(dict(date_format)),
+        date_format_no_weekday=MappingProxyType({
+            key: _WEEKDAY_FIELD.sub("", template).strip(", ")
+            for key, template in date_format.items()}),
+        date_time=config['date_time_format']['date_time'],
+        weekday=_lookup_table(config['weekday']),
+        month=_lookup_table(config['month']),
+        date=_lookup_table(config['date']),
+        number=_lookup_table(config['number']))
+
+
+class _NumberStrings(dict):
+    """The NUMBER_TUPLE fields of a number, as a mapping for str.format_map
+
+    A field is only looked up the first time a template uses it, templates
+    such as "{x0} {x}" need two of the thirteen.
+    """
+    # the number each field spells out, only the digits it covers
+    _FIELDS = {
+        "x": lambda n: n % 10,
+        "xx": lambda n: n % 100,
+        "x0": lambda n: n % 100 // 10 * 10,
+        "x_in_x0": lambda n: n % 100 // 10,
+        "xxx": lambda n: n % 1000,
+        "x00": lambda n: n % 1000 // 100 * 100,
+        "x_in_x00": lambda n: n % 1000 // 100,
+        "xx00": lambda n: n % 10000 // 100 * 100,
+        "xx_in_xx00": lambda n: n % 10000 // 100,
+        "x000": lambda n: n % 10000 // 1000 * 1000,
+        "x_in_x000": lambda n: n % 10000 // 1000,
+        "x0_in_x000": lambda n: n % 10000 // 1000 * 10,
+        "x_in_0x00": lambda n: n % 1000 // 100,
+    }
+
+    def __init__(self, number: int, numbers: tuple):
+        super().__init__()
+        self.number = number
+        self.numbers = numbers
+
+    def __missing__(self, key):
+        # unknown fields raise KeyError, like str.format
+        value = self._FIELDS[key](self.number)
+        word = self.numbers[value] if value < len(self.numbers) else None
+        if key != "x_in_0x00":
+            # historically looked up without the digits fallback
+            word = word or str(value)
+        self[key] = word
+        return word
+
+
 class DateTimeFormat:
     """resource file based regex date formatter
-    NOTE: this is optional, can be implemented as code if desired"""
+    NOTE: this is optional, can be implemented as code if desired
+
+    Years in year_range are formatted once per language and looked up
+    afterwards, see set_year_range.
+
+    Safe to share between threads, each language is loaded once and read
+    without locking afterwards.
+    """
 
-    def __init__(self, config_path):
+    def __init__(self, config_path, year_range=range(1900, 2101)):
         self.lang_config = {}
+        self.formats = {}
         self.config_path = config_path
+        self.year_range = year_range
+        self.year_tables = {}
+        self._missing = set()
+        self._lock = Lock()
 
     def cache(self, lang):
-        lang = lang.split("-")[0]
-        # TODO - find closest lang code
-        if lang not in self.lang_config:
-            path = self.config_path + '/' + lang + '/date_time.json'
-            if not os.path.isfile(path):
-                LOG.warning(f"could not find '{path}'")
-                return
-            with open(self.config_path + '/' + lang + '/date_time.json',
-                      'r', encoding='utf8') as lang_config_file:
-                self.lang_config[lang] = json.loads(
-                    lang_config_file.read())
-
-            for x in ['decade_format', 'hundreds_format', 'thousand_format',
-                      'year_format']:
-                i = 1
-                while self.lang_config[lang][x].get(str(i)):
-                    self.lang_config[lang][x][str(i)]['re'] = (
-                        re.compile(self.lang_config[lang][x][str(i)]['match']
-                                   ))
-                    i = i + 1
-
-    def _number_strings(self, number, lang):
-        lang = lang.split("-")[0]
-        x = (self.lang_config[lang]['number'].get(str(number % 10)) or
-             str(number % 10))
-        xx = (self.lang_config[lang]['number'].get(str(number % 100)) or
-              str(number % 100))
-        x_in_x0 = self.lang_config[lang]['number'].get(
-            str(int(number % 100 / 10))) or str(int(number % 100 / 10))
-        x0 = (self.lang_config[lang]['number'].get(
-            str(int(number % 100 / 10) * 10)) or
-              str(int(number % 100 / 10) * 10))
-        xxx = (self.lang_config[lang]['number'].get(str(number % 1000)) or
-               str(number % 1000))
-        x00 = (self.lang_config[lang]['number'].get(str(int(
-            number % 1000 / 100) * 100)) or
-               str(int(number % 1000 / 100) * 100))
-        x_in_x00 = self.lang_config[lang]['number'].get(str(int(
-            number % 1000 / 100))) or str(int(number % 1000 / 100))
-        xx00 = self.lang_config[lang]['number'].get(str(int(
-            number % 10000 / 100) * 100)) or str(int(number % 10000 / 100) *
-                                                 100)
-        xx_in_xx00 = self.lang_config[lang]['number'].get(str(int(
-            number % 10000 / 100))) or str(int(number % 10000 / 100))
-        x000 = (self.lang_config[lang]['number'].get(str(int(
-            number % 10000 / 1000) * 1000)) or
-                str(int(number % 10000 / 1000) * 1000))
-        x_in_x000 = self.lang_config[lang]['number'].get(str(int(
-            number % 10000 / 1000))) or str(int(number % 10000 / 1000))
-        x0_in_x000 = self.lang_config[lang]['number'].get(str(int(
-            number % 10000 / 1000) * 10)) or str(int(number % 10000 / 1000) * 10)
-        x_in_0x00 = self.lang_config[lang]['number'].get(str(int(
-            number % 1000 / 100)) or str(int(number % 1000 / 100)))
-
-        return NUMBER_TUPLE(
-            x, xx, x0, x_in_x0, xxx, x00, x_in_x00, xx00, xx_in_xx00, x000,
-            x_in_x000, x0_in_x000, x_in_0x00)
-
-    def _format_string(self, number, format_section, lang):
-        lang = lang.split("-")[0]
-        s = self.lang_config[lang][format_section]['default']
-        i = 1
-        while self.lang_config[lang][format_section].get(str(i)):
-            e = self.lang_config[lang][format_section][str(i)]
-            if e['re'].match(str(number)):
-                return e['format']
-            i = i + 1
-        return s
-
-    def _decade_format(self, number, number_tuple, lang):
-        s = self._format_string(number % 100, 'decade_format', lang)
-        return s.format(x=number_tuple.x, xx=number_tuple.xx,
-                        x0=number_tuple.x0, x_in_x0=number_tuple.x_in_x0,
-                        number=str(number % 100))
-
-    def _number_format_hundreds(self, number, number_tuple, lang,
+        """
+        Load and compile the date_time.json of a language.
+
+        Args:
+            lang (str): Language code, resolved to the closest language
+                shipping a date_time.json.
+
+        Returns:
+            The compiled formats, None if no language matches.
+        """
+        code = closest_resource_lang(lang, 'date_time.json', self.config_path)
+        if code is None:
+            # one warning per language, not per tag
+            missing = normalize_lang(lang)
+            if missing not in self._missing:
+                self._missing.add(missing)
+                LOG.warning(f"could not find date_time.json for '{lang}' in '{self.config_path}'")
+            return None
+        formats = self.formats.get(code)
+        if formats is None:
+            with self._lock:
+                # another thread may have loaded it while we waited for the lock
+                formats = self.formats.get(code)
+                if formats is None:
+                    formats = self._load(code)
+        return formats
+
+    def _load(self, lang):
+        path = self.config_path + '/' + lang + '/date_time.json'
+        with open(path, 'r', encoding='utf8') as lang_config_file:
+            config = json.loads(lang_config_file.read())
+        formats = _compile_formats(config)
+        self.lang_config[lang] = config
+        # published last, readers only check formats
+        self.formats[lang] = formats
+        return formats
+
+    def set_year_range(self, year_range):
+        """
+        Change the years formatted upfront, e.g. range(1, 2201).
+
+        Args:
+            year_range (range): The years to keep formatted, an empty
+                range disables the tables.
+        """
+        with self._lock:
+            self.year_range = year_range
+            self.year_tables = {}
+
+    def _lang_code(self, lang):
+        code = closest_resource_lang(lang, 'date_time.json', self.config_path)
+        if code is None:
+            raise NotImplementedError(f"Unsupported language: {lang}")
+        if code not in self.formats:
+            self.cache(code)
+        return code
+
+    @staticmethod
+    def _number_strings(number, formats):
+        return _NumberStrings(number, formats.number)
+
+    @staticmethod
+    def _format_string(number, rules):
+        number = str(number)
+        for match, template in rules.rules:
+            if match.match(number):
+                return template
+        return rules.default
+
+    def _decade_format(self, number, number_strings, formats):
+        s = self._format_string(number % 100, formats.decade_format)
+        number_strings["number"] = str(number % 100)
+        return s.format_map(number_strings)
+
+    def _number_format_hundreds(self, number, number_strings, formats,
                                 formatted_decade):
-        s = self._format_string(number % 1000, 'hundreds_format', lang)
-        return s.format(xxx=number_tuple.xxx, x00=number_tuple.x00,
-                        x_in_x00=number_tuple.x_in_x00,
-                        formatted_decade=formatted_decade,
-                        number=str(number % 1000))
+        s = self._format_string(number % 1000, formats.hundreds_format)
+        number_strings["formatted_decade"] = formatted_decade
+        number_strings["number"] = str(number % 1000)
+        return s.format_map(number_strings)
 
-    def _number_format_thousand(self, number, number_tuple, lang,
+    def _number_format_thousand(self, number, number_strings, formats,
                                 formatted_decade, formatted_hundreds):
         """
         Format the thousands part of a year using language-specific templates.
 
         Parameters:
             number (int): The year value to format.
-            number_tuple: A named tuple containing precomputed string representations of number components.
-            lang (str): Language code for localization.
+            number_strings: The number strings of the year, computed on demand.
+            formats: The compiled formats of the language.
             formatted_decade (str): Preformatted decade string.
             formatted_hundreds (str): Preformatted hundreds string.
 
         Returns:
             str: The formatted thousands part of the year as a localized string.
         """
-        s = self._format_string(number % 10000, 'thousand_format', lang)
-        return s.format(x_in_x00=number_tuple.x_in_x00,
-                        xx00=number_tuple.xx00,
-                        xx_in_xx00=number_tuple.xx_in_xx00,
-                        x000=number_tuple.x000,
-                        x_in_x000=number_tuple.x_in_x000,
-                        x0_in_x000=number_tuple.x0_in_x000,
-                        x_in_0x00=number_tuple.x_in_0x00,
-                        formatted_decade=formatted_decade,
-                        formatted_hundreds=formatted_hundreds,
-                        number=str(number % 10000))
+        s = self._format_string(number % 10000, formats.thousand_format)
+        number_strings["formatted_decade"] = formatted_decade
+        number_strings["formatted_hundreds"] = formatted_hundreds
+        number_strings["number"] = str(number % 10000)
+        return s.format_map(number_strings)
 
     def date_format(self, dt, lang, now, include_weekday=True):
         """
@@ -452,8 +548,9 @@ class DateTimeFormat:
         Returns:
             str: The formatted date string, localized and optionally including the weekday.
         """
+        lang = self._lang_code(lang)
+        formats = self.formats[lang]
         format_str = 'date_full'
-        lang = lang.split("-")[0]
         if now:
             if dt.year == now.year:
                 format_str = 'date_full_no_year'
@@ -469,48 +566,69 @@ class DateTimeFormat:
             elif yesterday.date() == dt.date():
                 format_str = 'yesterday'
 
-        unformatted = self.lang_config[lang]['date_format'][format_str]
-        args = dict(
-                month=self.lang_config[lang]['month'][str(dt.month)],
-                day=self.lang_config[lang]['date'][str(dt.day)],
-                formatted_year=self.year_format(dt, lang, False)
-        )
+        month = formats.month[dt.month]
+        day = formats.date[dt.day]
+        formatted_year = self._cached_year_format(dt.year, lang, False)
         if include_weekday:
-            args["weekday"] = self.lang_config[lang]['weekday'][str(dt.weekday())]
-        else:
-            unformatted = re.sub(r"{weekday}\s*,?\s*", "", unformatted).strip(", ")
-        return unformatted.format(**args)
+            return formats.date_format[format_str].format(
+                weekday=formats.weekday[dt.weekday()], month=month, day=day,
+                formatted_year=formatted_year)
+        return formats.date_format_no_weekday[format_str].format(
+            month=month, day=day, formatted_year=formatted_year)
 
     def date_time_format(self, dt, lang, now, use_24hour, use_ampm):
-        lang = lang.split("-")[0]
+        formats = self.formats[self._lang_code(lang)]
         date_str = self.date_format(dt, lang, now)
         time_str = nice_time(dt, lang, use_24hour=use_24hour,
                              use_ampm=use_ampm)
-        return self.lang_config[lang]['date_time_format']['date_time'].format(
+        return formats.date_time.format(
             formatted_date=date_str, formatted_time=time_str)
 
     def year_format(self, dt, lang, bc):
-        lang = lang.split("-")[0]
-        number_tuple = self._number_strings(dt.year, lang)
-        formatted_bc = (
-            self.lang_config[lang]['year_format']['bc'] if bc else '')
+        return self._cached_year_format(dt.year, self._lang_code(lang), bc)
+
+    def _cached_year_format(self, year, lang, bc):
+        tables = self.year_tables.get(lang)
+        if tables is None:
+            tables = self._build_year_tables(lang)
+        # the range is stored with the strings, set_year_range may run concurrently
+        years, ad, with_bc = tables
+        if year not in years:
+            return self._year_format(year, self.formats[lang], bc)
+        return (with_bc if bc else ad)[years.index(year)]
+
+    def _build_year_tables(self, lang):
+        formats = self.formats[lang]
+        with self._lock:
+            tables = self.year_tables.get(lang)
+            if tables is None:
+                years = self.year_range
+                tables = self.year_tables[lang] = (
+                    years,
+                    tuple(self._year_format(year, formats, False) for year in years),
+                    tuple(self._year_format(year, formats, True) for year in years))
+        return tables
+
+    def _year_format(self, year, formats, bc):
+        number_strings = self._number_strings(year, formats)
+        formatted_bc = formats.bc if bc else ''
         formatted_decade = self._decade_format(
-            dt.year, number_tuple, lang)
+            year, number_strings, formats)
         formatted_hundreds = self._number_format_hundreds(
-            dt.year, number_tuple, lang, formatted_decade)
+            year, number_strings, formats, formatted_decade)
         formatted_thousand = self._number_format_thousand(
-            dt.year, number_tuple, lang, formatted_decade, formatted_hundreds)
+            year, number_strings, formats, formatted_decade, formatted_hundreds)
 
-        s = self._format_string(dt.year, 'year_format', lang)
-        return re.sub(' +', ' ',
-                      s.format(
-                          year=str(dt.year),
-                          century=str(int(dt.year / 100)),
-                          decade=str(dt.year % 100),
-                          formatted_hundreds=formatted_hundreds,
-                          formatted_decade=formatted_decade,
-                          formatted_thousand=formatted_thousand,
-                          bc=formatted_bc)).strip()
+        s = self._format_string(year, formats.year_format)
+        return _SPACES.sub(' ',
+                           s.format(
+                               year=str(year),
+                               century=str(year // 100),
+                               decade=str(year % 100),
+                               formatted_hundreds=formatted_hundreds,
+                               formatted_decade=formatted_decade,
+                               formatted_thousand=formatted_thousand,
+                               bc=formatted_bc)).strip()
 
 
 date_time_format = DateTimeFormat(os.path.join(os.path.dirname(__file__), 'res'))
@@ -535,13 +653,10 @@ def nice_date(dt, lang, now=None, include_weekday=True):
     Returns:
         (str): The formatted date string
     """
-    lang = lang.lower().split("-")[0]
-    if lang.startswith("pt"):
-        return nice_date_pt(dt, now, include_weekday)
-    if lang.startswith("es"):
-        return nice_date_es(dt, now, include_weekday)
-    if lang.startswith("gl"):
-        return nice_date_gl(dt, now, include_weekday)
+    impl = get_implementation("nice_date", lang)
+    if impl is not None:
+        return impl(dt, now, include_weekday)
+    lang = normalize_lang(lang)
     date_time_format.cache(lang)
     return date_time_format.date_format(dt, lang, now, include_weekday)
 
@@ -567,24 +682,19 @@ def nice_date_time(dt, lang, now=None, use_24hour=False,
         Returns:
             (str): The formatted date time string
     """
-    lang = lang.lower().split("-")[0]
-    if lang.startswith("pt"):
-        return nice_date_time_pt(dt, now, use_24hour, use_ampm)
-    if lang.startswith("es"):
-        return nice_date_time_es(dt, now, use_24hour, use_ampm)
-    if lang.startswith("gl"):
-        return nice_date_time_gl(dt, now, use_24hour, use_ampm)
+    impl = get_implementation("nice_date_time", lang)
+    if impl is not None:
+        return impl(dt, now, use_24hour, use_ampm)
+    lang = normalize_lang(lang)
     date_time_format.cache(lang)
     return date_time_format.date_time_format(dt, lang, now, use_24hour, use_ampm)
 
 
 def nice_day(dt, lang, date_format='DMY', include_month=True):
-    if lang.startswith("pt"):
-        return nice_day_pt(dt, date_format, include_month)
-    if lang.startswith("es"):
-        return nice_day_es(dt, date_format, include_month)
-    if lang.startswith("gl"):
-        return nice_day_gl(dt, date_format, include_month)
+    impl = get_implementation("nice_day", lang)
+    if impl is not None:
+        return impl(dt, date_format, include_month)
+    lang = normalize_lang(lang)
     if include_month:
         month = nice_month(dt, lang, date_format)
         if date_format == 'MDY':
@@ -595,36 +705,26 @@ def nice_day(dt, lang, date_format='DMY', include_month=True):
 
 
 def nice_weekday(dt, lang):
-    lang = lang.lower().split("-")[0]
-    if lang.startswith("pt"):
-        return nice_weekday_pt(dt)
-    if lang.startswith("es"):
-        return nice_weekday_es(dt)
-    if lang.startswith("gl"):
-        return nice_weekday_gl(dt)
-    date_time_format.cache(lang)
-
-    if lang in date_time_format.lang_config.keys():
-        localized_day_names = list(
-            date_time_format.lang_config[lang]['weekday'].values())
-        weekday = localized_day_names[dt.weekday()]
+    impl = get_implementation("nice_weekday", lang)
+    if impl is not None:
+        return impl(dt)
+    lang = normalize_lang(lang)
+    formats = date_time_format.cache(lang)
+    if formats is not None:
+        weekday = formats.weekday[dt.weekday()]
     else:
         weekday = dt.strftime("%A")
     return weekday.capitalize()
 
 
 def nice_month(dt, lang, date_format='MDY'):
-    lang = lang.lower().split("-")[0]
-    if lang.startswith("pt"):
-        return nice_month_pt(dt)
-    if lang.startswith("es"):
-        return nice_month_es(dt)
-    if lang.startswith("gl"):
-        return nice_month_gl(dt)
-    date_time_format.cache(lang)
-    if lang in date_time_format.lang_config.keys():
-        localized_month_names = date_time_format.lang_config[lang]['month']
-        month = localized_month_names[str(int(dt.strftime("%m")))]
+    impl = get_implementation("nice_month", lang)
+    if impl is not None:
+        return impl(dt)
+    lang = normalize_lang(lang)
+    formats = date_time_format.cache(lang)
+    if formats is not None:
+        month = formats.month[dt.month]
     else:
         month = dt.strftime("%B")
     return month.capitalize()
@@ -645,38 +745,101 @@ def nice_year(dt, lang, bc=False):
         Returns:
             (str): The formatted year string
     """
-    lang = lang.lower().split("-")[0]
-    if lang.startswith("pt"):
-        return nice_year_pt(dt, bc)
-    if lang.startswith("es"):
-        return nice_year_es(dt, bc)
-    if lang.startswith("gl"):
-        return nice_year_gl(dt, bc)
+    stored = _stored_year(dt.year, lang, bc)
+    if stored is not None:
+        return stored
+    return _format_year(dt, lang, bc)
+
+
+def _format_year(dt, lang, bc=False):
+    impl = get_implementation("nice_year", lang)
+    if impl is not None:
+        return impl(dt, bc)
+    lang = normalize_lang(lang)
     date_time_format.cache(lang)
     return date_time_format.year_format(dt, lang, bc)
 
 
 def get_date_strings(dt, lang, date_format='DMY', time_format="full"):
-    lang = lang.lower().split("-")[0]
-    timestr = nice_time(dt, lang, speech=False,
-                        use_24hour=time_format == "full")
-    monthstr = nice_month(dt, lang, date_format)
-    weekdaystr = nice_weekday(dt, lang)
-    yearstr = dt.strftime("%Y")
-    daystr = nice_day(dt, date_format=date_format, include_month=False, lang=lang)
-    if date_format == 'MDY':
-        dtstr = dt.strftime("%-m/%-d/%Y")
-    elif date_format == 'DMY':
-        dtstr = dt.strftime("%d/%-m/%-Y")
-    elif date_format == 'YMD':
-        dtstr = dt.strftime("%Y/%-m/%-d")
-    else:
-        raise ValueError("invalid date_format")
-    return {
-        "date_string": dtstr,
-        "time_string": timestr,
-        "month_string": monthstr,
-        "day_string": daystr,
-        'year_string': yearstr,
-        "weekday_string": weekdaystr
+    """
+    Get the strings an always-on clock display shows for a datetime.
+
+    Args:
+        dt (datetime): date to format (assumes already in local timezone)
+        lang (str): a BCP-47 language code
+        date_format (str): "MDY", "DMY" or "YMD"
+        time_format (str): "full" for 24 hour time, anything else for 12 hour
+
+    Returns:
+        dict: date_string, time_string, month_string, day_string,
+            year_string and weekday_string
+    """
+    return _date_strings_formatter(normalize_lang(lang), date_format, time_format).format(dt)
+
+
+class DateStringsFormatter:
+    """Incremental get_date_strings for displays formatting every tick
+
+    The date fields are only formatted again when the day changes and the
+    time only when the minute changes, other calls return the strings from
+    the previous call.
+
+    Args:
+        lang (str): a BCP-47 language code
+        date_format (str): "MDY", "DMY" or "YMD"
+        time_format (str): "full" for 24 hour time, anything else for 12 hour
+    """
+    _DATE_PATTERNS = {
+        "MDY": "%-m/%-d/%Y",
+        "DMY": "%d/%-m/%-Y",
+        "YMD": "%Y/%-m/%-d",
     }
+
+    def __init__(self, lang: str, date_format: str = "DMY", time_format: str = "full"):
+        if date_format not in self._DATE_PATTERNS:
+            raise ValueError("invalid date_format")
+        self.lang = normalize_lang(lang)
+        self.date_format = date_format
+        self.use_24hour = time_format == "full"
+        # (key, strings) pairs, replaced as a whole so threads never see
+        # the strings of one key with another key
+        self._date = (None, None)
+        self._time = (None, None)
+
+    def _date_strings(self, dt: datetime) -> dict:
+        return {
+            "date_string": dt.strftime(self._DATE_PATTERNS[self.date_format]),
+            "month_string": nice_month(dt, self.lang, self.date_format),
+            "day_string": nice_day(dt, date_format=self.date_format, include_month=False, lang=self.lang),
+            "year_string": dt.strftime("%Y"),
+            "weekday_string": nice_weekday(dt, self.lang),
+        }
+
+    def format(self, dt: datetime) -> dict:
+        """
+        Same as get_date_strings(dt, ...), a new dict on every call.
+
+        Args:
+            dt (datetime): date to format (assumes already in local timezone)
+        """
+        key, date_strings = self._date
+        if key != (dt.year, dt.month, dt.day):
+            date_strings = self._date_strings(dt)
+            self._date = ((dt.year, dt.month, dt.day), date_strings)
+        key, timestr = self._time
+        if key != (dt.hour, dt.minute):
+            timestr = nice_time(dt, self.lang, speech=False, use_24hour=self.use_24hour)
+            self._time = ((dt.hour, dt.minute), timestr)
+        return {
+            "date_string": date_strings["date_string"],
+            "time_string": timestr,
+            "month_string": date_strings["month_string"],
+            "day_string": date_strings["day_string"],
+            'year_string': date_strings["year_string"],
+            "weekday_string": date_strings["weekday_string"]
+        }
+
+
+@lru_cache(maxsize=64)
+def _date_strings_formatter(lang: str, date_format: str, time_format: str) -> DateStringsFormatter:
+    return DateStringsFormatter(lang, date_format, time_format)
@@ -0,0 +1,126 @@
+"""Resolve one phrase against many anchor dates
+
+Services scheduling the same phrase for many users call extract_datetime
+once per user, with that user's local time as anchor. Most phrases are a
+fixed offset from the anchor ("in 5 minutes", "tomorrow at 9" at a given
+hour of the day), :func:`extract_datetime_many` finds that offset with two
+parses per hour of the day and adds it to every anchor, vectorized when
+the anchors are a numpy ``datetime64`` array. Other phrases are parsed once
+per distinct anchor, normalizing the text only once.
+"""
+import sys
+from collections import defaultdict
+from datetime import datetime, time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ovos_date_parser.cache import _PROBE_SHIFT, _RelativeResult, _as_relative
+from ovos_date_parser.prefilter import skip_extract
+from ovos_date_parser.prepared import prepare
+from ovos_date_parser.registry import get_implementation, normalize_lang
+
+
+def _resolver(text: str, lang: str, default_time: Optional[time]):
+    impl = get_implementation("extract_datetime", lang)
+    if impl is None:
+        # dateparser fallback, one call per anchor
+        from ovos_date_parser import extract_datetime
+        return lambda anchor: extract_datetime(text, lang, anchor, default_time)
+    if skip_extract("extract_datetime", text, normalize_lang(lang)):
+        return lambda anchor: None
+    text = prepare(text, lang)
+    # NOTE: anchor passed positionally, ru/uk name it "anchor_date"
+    return lambda anchor: impl(text, anchor, default_time)
+
+
+def _classify(resolve, anchor: datetime) -> Tuple[object, Optional[_RelativeResult]]:
+    """The result for anchor, and the offset it is from the anchor if it is a fixed one"""
+    result = resolve(anchor)
+    probe_anchor = anchor + _PROBE_SHIFT
+    try:
+        return result, _as_relative(anchor, result, probe_anchor, resolve(probe_anchor))
+    except Exception:
+        return result, None
+
+
+def _apply(relative: _RelativeResult, anchor: datetime):
+    if relative.offset is None:
+        return None
+    base = anchor.replace(microsecond=0) if relative.truncate else anchor
+    return relative.container((base + relative.offset, relative.remainder))
+
+
+def _extract_many(resolve, anchors: Sequence[datetime]) -> list:
+    results = [None] * len(anchors)
+    # parsers are known to jump at fixed times of the day, offsets are
+    # only reused within the same hour (see cache.py)
+    by_hour: Dict[int, List[int]] = defaultdict(list)
+    for idx, anchor in enumerate(anchors):
+        by_hour[anchor.hour].append(idx)
+    for indexes in by_hour.values():
+        first, relative = _classify(resolve, anchors[indexes[0]])
+        if relative is not None:
+            for idx in indexes:
+                results[idx] = _apply(relative, anchors[idx])
+            continue
+        seen = {anchors[indexes[0]]: first}
+        for idx in indexes:
+            anchor = anchors[idx]
+            if anchor not in seen:
+                seen[anchor] = resolve(anchor)
+            result = seen[anchor]
+            # never hand out the same mutable result twice
+            results[idx] = list(result) if isinstance(result, list) else result
+    return results
+
+
+def _extract_many_datetime64(resolve, anchors):
+    import numpy as np
+    anchors = anchors.astype("datetime64[us]")
+    values = np.full(anchors.shape, np.datetime64("NaT"), dtype="datetime64[us]")
+    hours = (anchors - anchors.astype("datetime64[D]")).astype("timedelta64[h]").astype(int)
+    for hour in np.unique(hours[~np.isnat(anchors)]):
+        mask = hours == hour
+        selected = anchors[mask]
+        first, relative = _classify(resolve, selected[0].item())
+        if relative is not None:
+            if relative.offset is not None:
+                base = selected.astype("datetime64[s]") if relative.truncate else selected
+                values[mask] = base + np.timedelta64(relative.offset)
+            continue
+        found = [resolve(anchor) for anchor in selected.tolist()]
+        values[mask] = [np.datetime64(result[0].replace(tzinfo=None)) if result else np.datetime64("NaT")
+                        for result in found]
+    return values
+
+
+def extract_datetime_many(
+        text: str,
+        lang: str,
+        anchors,
+        default_time: Optional[time] = None,
+):
+    """
+    Extract date and time information from a sentence for many anchor dates.
+
+    Same results as calling extract_datetime once per anchor. Results that
+    are a fixed offset from the anchor are computed once per hour of the
+    day and added to every anchor of that hour.
+
+    Args:
+        text: The text to be interpreted.
+        lang: The BCP-47 code for the language to use.
+        anchors: A sequence of datetimes, or a numpy datetime64 array of
+            naive local times.
+        default_time: Time to use if none was found in the input string.
+
+    Returns:
+        One extract_datetime result per anchor. For a datetime64 array, a
+        datetime64[us] array of the same shape with the extracted dates,
+        NaT where nothing was found.
+    """
+    resolve = _resolver(text, lang, default_time)
+    # numpy is only imported by applications passing arrays
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(anchors, np.ndarray):
+        return _extract_many_datetime64(resolve, anchors)
+    return _extract_many(resolve, list(anchors))
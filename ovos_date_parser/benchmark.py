@@ -0,0 +1,245 @@
+"""Latency and throughput of the public API, for every dispatched language
+
+    python -m ovos_date_parser.benchmark --output results.json
+
+The corpus and anchor dates are fixed so runs can be compared between
+releases. Results are emitted as JSON, one entry per (api, lang) with the
+number of calls, calls per second and p50/p99 latency in microseconds.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional
+
+from ovos_date_parser.registry import get_supported_langs, preload
+from ovos_date_parser.version import VERSION_MAJOR, VERSION_MINOR, VERSION_BUILD, VERSION_ALPHA
+
+ANCHORS = [datetime(2024, 3, 14, 13, 37, 0), datetime(2023, 12, 31, 23, 59, 30)]
+
+DATES = [datetime(2024, 3, 14, 13, 37), datetime(2024, 3, 15, 0, 5), datetime(2025, 7, 4, 8, 0),
+         datetime(1999, 12, 31, 23, 59), datetime(2024, 2, 29, 12, 0)]
+
+DURATIONS = [1, 59, 90, 3600, 5400, 93784, 1000000]
+
+RELATIVE_OFFSETS = [timedelta(seconds=25), timedelta(minutes=5), timedelta(hours=3), timedelta(days=1),
+                    timedelta(days=7)]
+
+# one phrase per code path: relative day + time, relative offset, weekday,
+# calendar date and no date at all
+DATETIME_CORPUS = {
+    "az": ["sabah saat 8 də", "5 dəqiqə sonra", "gələn bazar ertəsi", "15 iyul", "salam dünya"],
+    "ca": ["demà a les 8", "d'aquí a 5 minuts", "el proper dilluns", "15 de juliol", "hola món"],
+    "cs": ["zítra v 8", "za 5 minut", "příští pondělí", "15. července", "ahoj světe"],
+    "da": ["i morgen klokken 8", "om 5 minutter", "næste mandag", "15. juli", "hej verden"],
+    "de": ["morgen um 8 uhr", "in 5 minuten", "nächsten montag", "15. juli", "hallo welt"],
+    "en": ["what is the weather tomorrow at 8", "remind me in 5 minutes", "next tuesday at 4pm",
+           "june 5th 2020", "hello there"],
+    "es": ["mañana a las 8 de la mañana", "dentro de 5 minutos", "el próximo lunes", "15 de julio", "hola mundo"],
+    "fa": ["فردا ساعت 8", "5 دقیقه بعد", "دوشنبه بعد", "15 ژوئیه", "سلام دنیا"],
+    "fr": ["demain à 8 heures", "dans 5 minutes", "lundi prochain", "15 juillet", "bonjour le monde"],
+    "it": ["domani alle 8", "tra 5 minuti", "lunedì prossimo", "15 luglio", "ciao mondo"],
+    "nl": ["morgen om 8 uur", "over 5 minuten", "volgende maandag", "15 juli", "hallo wereld"],
+    "pl": ["jutro o 8", "za 5 minut", "w następny poniedziałek", "15 lipca", "cześć świecie"],
+    "pt": ["amanhã às 8 da manhã", "daqui a 5 minutos", "próxima segunda-feira", "dia 15 de julho", "olá mundo"],
+    "ru": ["завтра в 8", "через 5 минут", "в следующий понедельник", "15 июля", "привет мир"],
+    "sv": ["i morgon klockan 8", "om 5 minuter", "nästa måndag", "15 juli", "hej världen"],
+    "uk": ["завтра о 8", "через 5 хвилин", "наступного понеділка", "15 липня", "привіт світ"],
+}
+
+# a compound duration, a short one and no duration at all
+DURATION_CORPUS = {
+    "az": ["3 gün 8 saat 10 dəqiqə 49 saniyə", "taymer 5 dəqiqə", "salam dünya"],
+    "ca": ["3 dies 8 hores 10 minuts i 49 segons", "temporitzador de 5 minuts", "hola món"],
+    "cs": ["3 dny 8 hodin 10 minut a 49 sekund", "časovač na 5 minut", "ahoj světe"],
+    "da": ["3 dage 8 timer 10 minutter og 49 sekunder", "timer på 5 minutter", "hej verden"],
+    "de": ["3 tage 8 stunden 10 minuten und 49 sekunden", "timer für 5 minuten", "hallo welt"],
+    "en": ["3 days 8 hours 10 minutes and 49 seconds", "set a timer for 5 minutes", "hello there"],
+    "es": ["3 días 8 horas 10 minutos y 49 segundos", "temporizador de 5 minutos", "hola mundo"],
+    "fa": ["سه روز و هشت ساعت و ده دقیقه و چهل و نه ثانیه", "پنج دقیقه", "سلام دنیا"],
+    "gl": ["3 días 8 horas 10 minutos e 49 segundos", "temporizador de 5 minutos", "ola mundo"],
+    "nl": ["3 dagen 8 uur 10 minuten en 49 seconden", "timer voor 5 minuten", "hallo wereld"],
+    "pl": ["3 dni 8 godzin 10 minut i 49 sekund", "minutnik na 5 minut", "cześć świecie"],
+    "pt": ["3 dias 8 horas 10 minutos e 49 segundos", "temporizador de 5 minutos", "olá mundo"],
+    "ru": ["3 дня 8 часов 10 минут и 49 секунд", "таймер на 5 минут", "привет мир"],
+    "sv": ["3 dagar 8 timmar 10 minuter och 49 sekunder", "timer på 5 minuter", "hej världen"],
+    "uk": ["3 дні 8 годин 10 хвилин і 49 секунд", "таймер на 5 хвилин", "привіт світ"],
+}
+
+
+def _cases(api: str, lang: str) -> List[Callable]:
+    import ovos_date_parser as odp
+
+    if api == "extract_datetime":
+        return [lambda t=text, a=anchor: odp.extract_datetime(t, lang, a)
+                for text in DATETIME_CORPUS[lang] for anchor in ANCHORS]
+    if api == "extract_duration":
+        return [lambda t=text: odp.extract_duration(t, lang) for text in DURATION_CORPUS[lang]]
+    if api == "nice_time":
+        return [lambda d=dt, s=speech, h=use_24hour: odp.nice_time(d, lang, s, h)
+                for dt in DATES for speech in (True, False) for use_24hour in (True, False)]
+    if api == "nice_date":
+        return [lambda d=dt: odp.nice_date(d, lang, now=ANCHORS[0]) for dt in DATES]
+    if api == "nice_date_time":
+        return [lambda d=dt: odp.nice_date_time(d, lang, now=ANCHORS[0]) for dt in DATES]
+    if api == "nice_duration":
+        return [lambda s=seconds, sp=speech: odp.nice_duration(s, lang, sp)
+                for seconds in DURATIONS for speech in (True, False)]
+    if api == "nice_relative_time":
+        return [lambda w=anchor + offset, a=anchor: odp.nice_relative_time(w, a, lang)
+                for anchor in ANCHORS for offset in RELATIVE_OFFSETS]
+    if api == "nice_year":
+        return [lambda d=dt, bc=bc: odp.nice_year(d, lang, bc=bc) for dt in DATES for bc in (False, True)]
+    raise ValueError(f"unknown api: {api}")
+
+
+APIS = ("extract_datetime", "extract_duration", "nice_time", "nice_date", "nice_date_time",
+        "nice_duration", "nice_relative_time", "nice_year")
+
+
+def _percentile(sorted_values: List[int], pct: float) -> int:
+    # nearest-rank percentile
+    idx = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[idx]
+
+
+def bench(api: str, lang: str, rounds: int = 20) -> Dict:
+    """
+    Time every corpus entry of one API and language.
+
+    Each case is called once to warm up, then `rounds` more times. Cases
+    raising during the warm up are left out of the timings and reported
+    separately.
+
+    Args:
+        api: Name of the public API, e.g. "nice_time".
+        lang: A language code dispatched for that API.
+        rounds: Number of timed calls per corpus entry.
+
+    Returns:
+        The number of timed calls, the number of failing cases and their
+        errors, calls per second, and the p50 and p99 latency in
+        microseconds.
+    """
+    cases = []
+    failures = []
+    for case in _cases(api, lang):
+        try:
+            case()
+        except Exception as e:
+            failures.append(f"{type(e).__name__}: {e}")
+        else:
+            cases.append(case)
+    timings = []
+    clock = time.perf_counter_ns
+    for _ in range(rounds):
+        for case in cases:
+            start = clock()
+            case()
+            timings.append(clock() - start)
+    timings.sort()
+    total = sum(timings)
+    return {
+        "api": api,
+        "lang": lang,
+        "calls": len(timings),
+        "errors": len(failures),
+        "failures": failures,
+        "throughput": round(len(timings) / total * 1e9, 1) if total else None,
+        "p50_us": round(_percentile(timings, 50) / 1000, 2) if timings else None,
+        "p99_us": round(_percentile(timings, 99) / 1000, 2) if timings else None,
+    }
+
+
+def run_benchmarks(langs: Optional[Iterable[str]] = None,
+                   apis: Optional[Iterable[str]] = None,
+                   rounds: int = 20,
+                   progress: Optional[Callable[[Dict], None]] = None) -> Dict:
+    """
+    Benchmark the public API for every language it dispatches.
+
+    Languages are preloaded first, import time is not part of the results.
+    extract_datetime is only benchmarked for languages with a native parser.
+
+    Args:
+        langs: Language codes to benchmark, defaults to all of them.
+        apis: Public API names to benchmark, defaults to all of them.
+        rounds: Number of timed calls per corpus entry.
+        progress: Called with every result as soon as it is available.
+
+    Returns:
+        A JSON serializable dict with the run metadata and the results.
+    """
+    from ovos_date_parser.cache import extract_cache_info, format_cache_info
+
+    apis = list(apis or APIS)
+    for api in apis:
+        if api not in APIS:
+            raise ValueError(f"unknown api: {api}")
+    langs = set(langs) if langs is not None else None
+    preload(langs)
+
+    results = []
+    for api in apis:
+        supported = get_supported_langs(api)
+        if api == "extract_datetime":
+            supported = supported.intersection(DATETIME_CORPUS)
+        for lang in sorted(supported):
+            if langs is not None and lang not in langs:
+                continue
+            result = bench(api, lang, rounds)
+            results.append(result)
+            if progress:
+                progress(result)
+
+    version = f"{VERSION_MAJOR}.{VERSION_MINOR}.{VERSION_BUILD}"
+    if VERSION_ALPHA:
+        version += f"a{VERSION_ALPHA}"
+    return {
+        "meta": {
+            "version": version,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "rounds": rounds,
+            "caches": extract_cache_info() is not None or format_cache_info() is not None,
+            "date": datetime.now().isoformat(timespec="seconds"),
+        },
+        "results": results,
+    }
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(prog="python -m ovos_date_parser.benchmark",
+                                     description=__doc__.split("\n")[0])
+    parser.add_argument("--lang", action="append", dest="langs",
+                        help="language to benchmark, can be repeated (default: all)")
+    parser.add_argument("--api", action="append", dest="apis", choices=APIS,
+                        help="public API to benchmark, can be repeated (default: all)")
+    parser.add_argument("--rounds", type=int, default=20,
+                        help="timed calls per corpus entry (default: 20)")
+    parser.add_argument("--output", "-o", help="write the JSON report to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    def progress(result):
+        line = f"{result['api']:<20} {result['lang']:<4} "
+        if result["calls"]:
+            line += (f"p50 {result['p50_us']:>10.2f} us  p99 {result['p99_us']:>10.2f} us  "
+                     f"{result['throughput']:>10.1f} calls/s")
+        if result["errors"]:
+            line += f"  {result['errors']} failing case(s)"
+        print(line, file=sys.stderr)
+
+    report = run_benchmarks(args.langs, args.apis, args.rounds, progress)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""Format many values at once
+
+List views render hundreds of durations and relative times per refresh.
+The functions here split all the values into their components in one
+vectorized step when numpy is in use, and build the strings from number
+words, unit words and phrases looked up once per language instead of once
+per item.
+
+numpy is never imported here, importing ovos_date_parser stays cheap for
+applications that do not use it.
+"""
+import sys
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from ovos_number_parser import pronounce_number
+
+from ovos_date_parser.common import _format_duration, _translate_word
+from ovos_date_parser.registry import get_implementation
+
+
+def _numpy():
+    """numpy if the application already imported it, plain python loops are used otherwise"""
+    return sys.modules.get("numpy")
+
+
+@lru_cache(maxsize=4096)
+def _number_word(number: int, lang: str) -> str:
+    return pronounce_number(number, lang)
+
+
+def _seconds(values, np) -> list:
+    """Seconds as floats, the way nice_duration_generic converts them"""
+    if np is not None and isinstance(values, np.ndarray):
+        if np.issubdtype(values.dtype, np.timedelta64):
+            # same float as timedelta.total_seconds()
+            return values.astype("timedelta64[us]").astype(np.int64) / 10 ** 6
+        if np.issubdtype(values.dtype, np.number):
+            return values.astype(np.float64)
+        values = values.ravel().tolist()
+    return [value.total_seconds() if isinstance(value, timedelta) else value
+            for value in values]
+
+
+def _duration_components(seconds, np) -> zip:
+    """(days, hours, minutes, seconds) of every duration, rounded to the second"""
+    if np is not None:
+        rounded = np.asarray(seconds, dtype=np.float64).ravel() + 0.5
+        return zip((rounded // 86400).astype(np.int64).tolist(),
+                   (rounded // 3600 % 24).astype(np.int64).tolist(),
+                   (rounded // 60 % 60).astype(np.int64).tolist(),
+                   (rounded % 60).astype(np.int64).tolist())
+    rounded = [value + 0.5 for value in seconds]
+    return zip([int(value // 86400) for value in rounded],
+               [int(value // 3600 % 24) for value in rounded],
+               [int(value // 60 % 60) for value in rounded],
+               [int(value % 60) for value in rounded])
+
+
+def nice_duration_batch(durations: Sequence, lang: str, speech: bool = True) -> List[str]:
+    """
+    Convert many durations to nice spoken timespans.
+
+    Same output as calling nice_duration on every item.
+
+    Args:
+        durations: Seconds or timedeltas, a sequence or a numpy array of
+            numbers or timedelta64 values.
+        lang: A BCP-47 language code.
+        speech: Format for speech (True) or display (False).
+
+    Returns:
+        One string per duration, in input order.
+    """
+    np = _numpy()
+    impl = get_implementation("nice_duration", lang)
+    if impl is not None:
+        # language specific grammar, nothing to share between items
+        if np is not None and isinstance(durations, np.ndarray):
+            durations = _seconds(durations, np).ravel().tolist()
+        return [impl(duration, speech) for duration in durations]
+
+    words = {}
+
+    def word(keyword: str) -> str:
+        if keyword not in words:
+            words[keyword] = _translate_word(keyword, lang)
+        return words[keyword]
+
+    def number(value: int) -> str:
+        return _number_word(value, lang)
+
+    return [_format_duration(days, hours, minutes, seconds, speech, number, word)
+            for days, hours, minutes, seconds in _duration_components(_seconds(durations, np), np)]
+
+
+# nice_relative_time buckets, the phrase only depends on the bucket
+_NOW, _SECONDS, _MINUTES, _HOURS, _DAYS = range(5)
+# a delta in the middle of each bucket, in seconds per unit
+_BUCKET_SECONDS = {_NOW: 0, _SECONDS: 1, _MINUTES: 60, _HOURS: 3600, _DAYS: 86400}
+_EPOCH = datetime(2000, 1, 1)
+
+
+@lru_cache(maxsize=4096)
+def _relative_phrase(lang: str, bucket: int, value: float) -> str:
+    from ovos_date_parser import nice_relative_time
+    delta = timedelta(seconds=value * _BUCKET_SECONDS[bucket])
+    return nice_relative_time(_EPOCH + delta, _EPOCH, lang)
+
+
+def _relative_buckets(seconds, np) -> Iterator[Tuple[int, float]]:
+    """(bucket, value) of every delta, rounded like nice_relative_time_generic"""
+    if np is not None:
+        seconds = np.asarray(seconds, dtype=np.float64).ravel()
+        minutes = (seconds + 30) // 60
+        hours = (minutes + 30) // 60
+        days = (hours + 12) // 24
+        conditions = [seconds < 1, seconds < 90, minutes < 90, hours < 36]
+        buckets = np.select(conditions, [_NOW, _SECONDS, _MINUTES, _HOURS], _DAYS)
+        values = np.select(conditions, [0, seconds, minutes, hours], days)
+        # NaT
+        buckets[np.isnan(seconds)] = -1
+        return zip(buckets.tolist(), values.tolist())
+    found = []
+    for value in seconds:
+        minutes = int((value + 30) // 60)
+        hours = int((minutes + 30) // 60)
+        if value < 1:
+            found.append((_NOW, 0))
+        elif value < 90:
+            found.append((_SECONDS, value))
+        elif minutes < 90:
+            found.append((_MINUTES, minutes))
+        elif hours < 36:
+            found.append((_HOURS, hours))
+        else:
+            found.append((_DAYS, int((hours + 12) // 24)))
+    return iter(found)
+
+
+def nice_relative_time_batch(whens: Sequence, relative_to: datetime, lang: str) -> List[Optional[str]]:
+    """
+    Create relative phrases for many datetimes against the same baseline.
+
+    Same output as calling nice_relative_time on every item, each distinct
+    phrase is only rendered once.
+
+    Args:
+        whens: Datetimes, a sequence or a numpy datetime64 array of naive
+            local times.
+        relative_to: Baseline for relative time.
+        lang: A BCP-47 language code.
+
+    Returns:
+        One phrase per datetime, in input order, None for NaT.
+    """
+    np = _numpy()
+    if np is not None and isinstance(whens, np.ndarray):
+        base = np.datetime64(relative_to.replace(tzinfo=None), "us")
+        seconds = (whens.astype("datetime64[us]") - base).astype(np.float64) / 10 ** 6
+        seconds[np.isnat(whens)] = np.nan
+    else:
+        seconds = [(when - relative_to).total_seconds() for when in whens]
+    # numpy returns every value as a float, seconds are pronounced as
+    # floats ("2.5 seconds") but minutes, hours and days are whole numbers
+    return [None if bucket == -1 else
+            _relative_phrase(lang, bucket, int(value) if bucket in (_MINUTES, _HOURS, _DAYS) else value)
+            for bucket, value in _relative_buckets(seconds, np)]
@@ -0,0 +1,270 @@
+"""Opt-in result caches for the top-level API
+
+Voice assistants parse the same handful of phrases over and over, the caches
+here let repeated calls skip the parsers entirely. They are disabled by
+default, see :func:`enable_extract_cache`.
+"""
+from collections import OrderedDict, namedtuple
+from datetime import datetime, time, timedelta
+from threading import Lock
+from typing import Callable, Hashable, Iterable, Optional, Tuple
+
+from ovos_utils.time import now_local
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"])
+# extract_datetime result stored as an offset from the anchor date, some
+# languages return a list instead of a tuple, "container" keeps track of it
+_RelativeResult = namedtuple("_RelativeResult", ["truncate", "offset", "remainder", "container"])
+
+_MISSING = object()
+
+
+class LRUCache:
+    """Thread safe bounded mapping that drops the least recently used entry
+
+    Args:
+        maxsize (int): maximum number of entries
+    """
+
+    def __init__(self, maxsize: int):
+        if maxsize < 1:
+            raise ValueError("maxsize must be a positive integer")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable, default=None):
+        return self.get_any((key,), default)
+
+    def get_any(self, keys: Iterable[Hashable], default=None):
+        """Get the value of the first key present, counted as a single lookup"""
+        with self._lock:
+            for key in keys:
+                value = self._data.get(key, _MISSING)
+                if value is not _MISSING:
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+            self.misses += 1
+            return default
+
+    def put(self, key: Hashable, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions,
+                             self.maxsize, len(self._data))
+
+
+# relative results are bucketed by the hour of the anchor, parsers are known
+# to jump at fixed times of the day (e.g. noon). A result is a fixed offset
+# if it moves with the anchor to another day and a few seconds later
+# NOTE: parsers drop the anchor microseconds, the odd microsecond in the
+#  probe tells a truncated anchor apart from an exact one
+_PROBE_SHIFT = timedelta(days=1, minutes=1, seconds=1, microseconds=1)
+# relativedelta based results (months, years) are not fixed offsets,
+# never reuse anything that far from the anchor
+_MAX_RELATIVE_OFFSET = timedelta(days=28)
+
+_EXTRACT_CACHE: Optional[LRUCache] = None
+
+
+def enable_extract_cache(maxsize: Optional[int] = None):
+    """
+    Cache the results of extract_datetime and extract_duration.
+
+    Results that are a fixed offset from the anchor date, e.g. "in 5
+    minutes", are stored as that offset and reused for any anchor date at
+    the same hour of the day. Other results are only reused when the same
+    anchorDate is passed again. Finding out which kind a result is costs a
+    second parse on every cache miss.
+
+    Args:
+        maxsize: Maximum number of cached results, defaults to the
+            "cache_size" of the "date_parser" section in mycroft.conf, or
+            1024 if not set.
+    """
+    global _EXTRACT_CACHE
+    if maxsize is None:
+        from ovos_config import Configuration
+        maxsize = Configuration().get("date_parser", {}).get("cache_size", 1024)
+    _EXTRACT_CACHE = LRUCache(maxsize)
+
+
+def disable_extract_cache():
+    """Stop caching extract_datetime and extract_duration results and drop the cache."""
+    global _EXTRACT_CACHE
+    _EXTRACT_CACHE = None
+
+
+def extract_cache_info() -> Optional[CacheInfo]:
+    """
+    Get the extract_datetime and extract_duration cache statistics.
+
+    Returns:
+        A CacheInfo with the hits, misses, evictions, maxsize and currsize of
+        the cache, or None if caching is disabled.
+    """
+    cache = _EXTRACT_CACHE
+    return cache.info() if cache is not None else None
+
+
+def _copy(result):
+    # never hand out a mutable result that is also stored in the cache
+    return list(result) if isinstance(result, list) else result
+
+
+def cached_extract_duration(extract: Callable[[str], tuple],
+                            text: str, lang: str) -> tuple:
+    cache = _EXTRACT_CACHE
+    if cache is None:
+        return extract(text)
+    key = ("duration", lang, str(text))
+    result = cache.get(key, _MISSING)
+    if result is _MISSING:
+        result = extract(text)
+        cache.put(key, _copy(result))
+    return _copy(result)
+
+
+def _as_relative(anchor: datetime, result, probe_anchor: datetime, probe) -> Optional[_RelativeResult]:
+    """Express result as an offset from anchor, if probe shows it does not depend on anything else"""
+    if result is None or probe is None:
+        # nothing found for either anchor, nothing to find for any anchor
+        return _RelativeResult(False, None, None, None) if result is probe else None
+    (dt, remainder), (probe_dt, probe_remainder) = result, probe
+    if remainder != probe_remainder or dt.tzinfo is not anchor.tzinfo:
+        return None
+    for truncate in (True, False):
+        base = anchor.replace(microsecond=0) if truncate else anchor
+        probe_base = probe_anchor.replace(microsecond=0) if truncate else probe_anchor
+        offset = dt - base
+        if abs(offset) < _MAX_RELATIVE_OFFSET and probe_dt - probe_base == offset:
+            return _RelativeResult(truncate, offset, remainder, type(result))
+    return None
+
+
+def cached_extract_datetime(extract: Callable[[str, datetime, Optional[time]], tuple],
+                            text: str, lang: str,
+                            anchorDate: Optional[datetime],
+                            default_time: Optional[time]) -> Optional[Tuple[datetime, str]]:
+    cache = _EXTRACT_CACHE
+    if cache is None:
+        return extract(text, anchorDate, default_time)
+    anchor = anchorDate or now_local()
+
+    key = ("datetime", lang, str(text), default_time)
+    relative_key = key + (anchor.hour,)
+    absolute_key = key + (anchor,)
+    result = cache.get_any((relative_key, absolute_key), _MISSING)
+    if isinstance(result, _RelativeResult):
+        if result.offset is None:
+            return None
+        base = anchor.replace(microsecond=0) if result.truncate else anchor
+        return result.container((base + result.offset, result.remainder))
+    if result is not _MISSING:
+        return _copy(result)
+
+    result = extract(text, anchor, default_time)
+    probe_anchor = anchor + _PROBE_SHIFT
+    try:
+        relative = _as_relative(anchor, result, probe_anchor,
+                                extract(text, probe_anchor, default_time))
+    except Exception:
+        relative = None
+    if relative is not None:
+        cache.put(relative_key, relative)
+    elif anchorDate is not None:
+        # "now" never comes back, only explicit anchors are worth keeping
+        cache.put(absolute_key, _copy(result))
+    return result
+
+
+_FORMAT_CACHE: Optional[LRUCache] = None
+
+
+def enable_format_cache(maxsize: Optional[int] = None):
+    """
+    Memoize the output of nice_time and nice_duration.
+
+    nice_time output only depends on the hour and minute, there are 1440 of
+    them per language and flag combination, see :func:`prewarm_nice_time`.
+    nice_duration is memoized for int seconds and whole second timedeltas.
+
+    Args:
+        maxsize: Maximum number of memoized strings, defaults to the
+            "format_cache_size" of the "date_parser" section in mycroft.conf,
+            or 16384 if not set.
+    """
+    global _FORMAT_CACHE
+    if maxsize is None:
+        from ovos_config import Configuration
+        maxsize = Configuration().get("date_parser", {}).get("format_cache_size", 16384)
+    _FORMAT_CACHE = LRUCache(maxsize)
+
+
+def disable_format_cache():
+    """Stop memoizing nice_time and nice_duration and drop the memoized strings."""
+    global _FORMAT_CACHE
+    _FORMAT_CACHE = None
+
+
+def format_cache_info() -> Optional[CacheInfo]:
+    """
+    Get the nice_time and nice_duration memo statistics.
+
+    Returns:
+        A CacheInfo with the hits, misses, evictions, maxsize and currsize of
+        the memo, or None if it is disabled.
+    """
+    cache = _FORMAT_CACHE
+    return cache.info() if cache is not None else None
+
+
+def prewarm_nice_time(lang: str, speech: bool = True, use_24hour: bool = False,
+                      use_ampm: bool = False, variant=None):
+    """
+    Format every minute of the day upfront, so nice_time never misses.
+
+    Enables the memo with the default size if it is disabled, call once per
+    language and flag combination used at runtime.
+
+    Args:
+        lang: A BCP-47 language code.
+        speech: Format for speech (True) or display (False).
+        use_24hour: Output in 24-hour/military or 12-hour format.
+        use_ampm: Include the am/pm for 12-hour format.
+        variant: Optional variant for Catalan (ca).
+    """
+    from ovos_date_parser import nice_time
+    if _FORMAT_CACHE is None:
+        enable_format_cache()
+    day = datetime(2000, 1, 1)
+    for minute in range(24 * 60):
+        nice_time(day + timedelta(minutes=minute), lang,
+                  speech, use_24hour, use_ampm, variant)
+
+
+def cached_format(key: Hashable, format_func: Callable[..., str], *args, **kwargs) -> str:
+    cache = _FORMAT_CACHE
+    if cache is None:
+        return format_func(*args, **kwargs)
+    text = cache.get(key)
+    if text is None:
+        text = format_func(*args, **kwargs)
+        cache.put(key, text)
+    return text
@@ -1,18 +1,56 @@
 import datetime
 import json
 import os.path
+import re
+from operator import itemgetter
+from threading import Lock
+from typing import Callable, Dict, Optional, Sequence, Tuple
 
 from ovos_number_parser import pronounce_number
 
+from ovos_date_parser.registry import closest_resource_lang
+
+# process wide cache of res/<lang>/date_words.json, see invalidate_date_words
+_DATE_WORDS: Dict[str, Dict[str, str]] = {}
+_DATE_WORDS_LOCK = Lock()
+
+
+def _load_date_words(lang: str) -> Dict[str, str]:
+    words = _DATE_WORDS.get(lang)
+    if words is None:
+        with _DATE_WORDS_LOCK:
+            # another thread may have loaded it while we waited for the lock
+            words = _DATE_WORDS.get(lang)
+            if words is None:
+                p = f"{os.path.dirname(__file__)}/res/{lang}/date_words.json"
+                if not os.path.isfile(p):
+                    raise NotImplementedError(f"Unsupported language: {lang} - please translate {p}")
+                with open(p) as f:
+                    words = json.load(f)
+                _DATE_WORDS[lang] = words
+    return words
+
+
+def invalidate_date_words(lang: Optional[str] = None):
+    """Drop cached date_words.json tables so they are re-read from disk
+
+    Useful during development when editing the resource files
+
+    Args:
+        lang (str): BCP-47 language code, if omitted all languages are dropped
+    """
+    with _DATE_WORDS_LOCK:
+        if lang is None:
+            _DATE_WORDS.clear()
+        else:
+            _DATE_WORDS.pop(closest_resource_lang(lang, "date_words.json"), None)
+
 
 def _translate_word(keyword: str, lang: str) -> str:
-    lang = lang.split("-")[0]
-    p = f"{os.path.dirname(__file__)}/res/{lang}/date_words.json"
-    if not os.path.isfile(p):
-        raise NotImplementedError(f"Unsupported language: {lang} - please translate {p}")
-    with open(p) as f:
-        words = json.load(f)
-    return words[keyword]
+    code = closest_resource_lang(lang, "date_words.json")
+    if code is None:
+        raise NotImplementedError(f"Unsupported language: {lang} - please translate res/{lang}/date_words.json")
+    return _load_date_words(code)[keyword]
 
 
 def nice_relative_time_generic(lang, when, relative_to):
@@ -97,39 +135,52 @@ def nice_duration_generic(lang, duration, speech=True):
     minutes = int(duration // 60 % 60)
     seconds = int(duration % 60)
 
+    return _format_duration(days, hours, minutes, seconds, speech,
+                            lambda n: pronounce_number(n, lang),
+                            lambda word: _translate_word(word, lang))
+
+
+def _format_duration(days: int, hours: int, minutes: int, seconds: int, speech: bool,
+                     number: Callable[[int], str], word: Callable[[str], str]) -> str:
+    """nice_duration_generic output for the given components
+
+    Args:
+        number (callable): spoken form of a number
+        word (callable): translation of a unit keyword of date_words.json
+    """
     if speech:
         out = ""
         if days > 0:
-            out += pronounce_number(days, lang) + " "
+            out += number(days) + " "
             if days == 1:
-                out += _translate_word("day", lang)
+                out += word("day")
             else:
-                out += _translate_word("days", lang)
+                out += word("days")
             out += " "
         if hours > 0:
             if out:
                 out += " "
-            out += pronounce_number(hours, lang) + " "
+            out += number(hours) + " "
             if hours == 1:
-                out += _translate_word("hour", lang)
+                out += word("hour")
             else:
-                out += _translate_word("hours", lang)
+                out += word("hours")
         if minutes > 0:
             if out:
                 out += " "
-            out += pronounce_number(minutes, lang) + " "
+            out += number(minutes) + " "
             if minutes == 1:
-                out += _translate_word("minute", lang)
+                out += word("minute")
             else:
-                out += _translate_word("minutes", lang)
+                out += word("minutes")
         if seconds > 0:
             if out:
                 out += " "
-            out += pronounce_number(seconds, lang) + " "
+            out += number(seconds) + " "
             if seconds == 1:
-                out += _translate_word("second", lang)
+                out += word("second")
             else:
-                out += _translate_word("seconds", lang)
+                out += word("seconds")
     else:
         # M:SS, MM:SS, H:MM:SS, Dd H:MM:SS format
         out = ""
@@ -145,3 +196,79 @@ def nice_duration_generic(lang, duration, speech=True):
         out += str(seconds)
 
     return out
+
+
+class DurationScanner:
+    """Single pass duration extractor built from a unit table
+
+    All unit words of a language are compiled into one alternation, the text
+    is scanned once and the remainder is assembled once from the spans that
+    were not consumed.
+
+    Matching one regex per unit and removing its matches before trying the
+    next unit can join a number and a unit word that were apart, e.g.
+    "2 10 minutes hours". Those inputs are detected and handled unit by
+    unit, so results do not depend on which strategy was used.
+
+    Args:
+        pattern (str): regex with a "value" named group and a "{unit}"
+            placeholder, the part after the placeholder must not capture
+        units (list): (timedelta argument, multiplier, unit regex) tuples,
+            when several units match at the same position the first one wins
+        to_number (callable): converts the matched value to a float
+    """
+
+    def __init__(self, pattern: str,
+                 units: Sequence[Tuple[str, float, str]],
+                 to_number: Callable[[str], float] = float):
+        prefix, suffix = pattern.split("{unit}")
+        alternatives = "|".join(f"({unit})" for _, _, unit in units)
+        self.regex = re.compile(f"{prefix}(?:{alternatives}){suffix}")
+        # group number of the first unit alternative
+        self._first_unit = re.compile(prefix).groups + 1
+        self.units = [(unit, multiplier) for unit, multiplier, _ in units]
+        self.unit_words = tuple(unit for _, _, unit in units)
+        self.unit_regexes = [re.compile(pattern.format(unit=unit)) for _, _, unit in units]
+        self.to_number = to_number
+
+    def scan(self, text: str, time_units: Dict[str, float]) -> str:
+        """Add the durations found in text to time_units
+
+        Args:
+            text (str): normalized text, numbers already converted to digits
+            time_units (dict): timedelta arguments to accumulate into
+
+        Returns:
+            str: text with the matched durations removed
+        """
+        hits = []
+        chunks = []
+        end = 0
+        for match in self.regex.finditer(text):
+            hits.append((match.lastindex - self._first_unit, match.group("value")))
+            chunks.append(text[end:match.start()])
+            end = match.end()
+        if not hits:
+            return text
+        chunks.append(text[end:])
+        remainder = "".join(chunks)
+        if self.regex.search(remainder):
+            # removing the matches formed a new one
+            return self._scan_per_unit(text, time_units)
+
+        # sum in unit table order, float additions happen in the same
+        # order as with one regex per unit
+        hits.sort(key=itemgetter(0))
+        for idx, value in hits:
+            unit, multiplier = self.units[idx]
+            time_units[unit] += multiplier * self.to_number(value)
+        return remainder
+
+    def _scan_per_unit(self, text: str, time_units: Dict[str, float]) -> str:
+        for (unit, multiplier), unit_regex in zip(self.units, self.unit_regexes):
+            values = [m.group("value") for m in unit_regex.finditer(text)]
+            if values:
+                for value in values:
+                    time_units[unit] += multiplier * self.to_number(value)
+                text = unit_regex.sub('', text)
+        return text
@@ -213,6 +213,21 @@ def nice_duration_az(duration, speech=True):
     return out
 
 
+_DURATION_PATTERN_AZ = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}?(?:yə|a|ə)?(?:(?:\s|,)+)?(?P<half>yarım|0\.5)?(?:a)?"
+_DURATION_UNITS_AZ = [
+    (unit_en, re.compile(_DURATION_PATTERN_AZ.format(unit=unit_az)))
+    for unit_az, unit_en in (
+        ('mikrosaniyə', 'microseconds'),
+        ('milisaniyə', 'milliseconds'),
+        ('saniyə', 'seconds'),
+        ('dəqiqə', 'minutes'),
+        ('saat', 'hours'),
+        ('gün', 'days'),
+        ('həftə', 'weeks')
+    )
+]
+
+
 def extract_duration_az(text):
     """
     Convert an azerbaijani phrase into a number of seconds
@@ -252,26 +267,14 @@ def extract_duration_az(text):
         'weeks': 0
     }
 
-    time_units_az = {
-        'mikrosaniyə': 'microseconds',
-        'milisaniyə': 'milliseconds',
-        'saniyə': 'seconds',
-        'dəqiqə': 'minutes',
-        'saat': 'hours',
-        'gün': 'days',
-        'həftə': 'weeks'
-    }
-
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}?(?:yə|a|ə)?(?:(?:\s|,)+)?(?P<half>yarım|0\.5)?(?:a)?"
     text = numbers_to_digits_az(text)
-    for unit_az in time_units_az:
-        unit_pattern = pattern.format(unit=unit_az)
+    for unit_en, unit_regex in _DURATION_UNITS_AZ:
 
         def repl(match):
-            time_units[time_units_az[unit_az]] += float(match.group(1)) + (0.5 if match.group(2) else 0)
+            time_units[unit_en] += float(match.group(1)) + (0.5 if match.group(2) else 0)
             return ''
 
-        text = re.sub(unit_pattern, repl, text)
+        text = unit_regex.sub(repl, text)
 
     text = text.strip()
     duration = timedelta(**time_units) if any(time_units.values()) else None
@@ -14,6 +14,29 @@ class TimeVariantCA(IntEnum):
     SPANISH_LIKE = 3
 
 
+_DURATION_PATTERN_CA = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[s]?"
+# (timedelta argument, multiplier, compiled pattern) in matching order,
+# units without a timedelta argument are converted to days
+_DURATION_UNITS_CA = [
+    # remove 's' from unit
+    (unit_en, multiplier, re.compile(_DURATION_PATTERN_CA.format(unit=unit[:-1])))
+    for unit_en, multiplier, unit in (
+        ('microseconds', 1, 'microsegons'),
+        ('milliseconds', 1, 'mil·lisegons'),
+        ('seconds', 1, 'segons'),
+        ('minutes', 1, 'minuts'),
+        ('hours', 1, 'hores'),
+        ('days', 1, 'dies'),
+        ('weeks', 1, 'setmanes'),
+        ('days', DAYS_IN_1_MONTH, 'mesos'),
+        ('days', DAYS_IN_1_YEAR, 'anys'),
+        ('days', 10 * DAYS_IN_1_YEAR, 'dècades'),
+        ('days', 100 * DAYS_IN_1_YEAR, 'segles'),
+        ('days', 1000 * DAYS_IN_1_YEAR, 'mil·lenis'),
+    )
+]
+
+
 def extract_duration_ca(text):
     """
     Converteix una frase en català en un nombre de segons.
@@ -40,59 +63,24 @@ def extract_duration_ca(text):
 
     text = text.lower().replace("í", "i")
     time_units = {
-        'microseconds': 'microsegons',
-        'milliseconds': 'mil·lisegons',
-        'seconds': 'segons',
-        'minutes': 'minuts',
-        'hours': 'hores',
-        'days': 'dies',
-        'weeks': 'setmanes'
+        'microseconds': 0,
+        'milliseconds': 0,
+        'seconds': 0,
+        'minutes': 0,
+        'hours': 0,
+        'days': 0,
+        'weeks': 0
     }
-    # NOTE: alguns d'aquests unitats angleses estan escrites incorrectament a propòsit per al bucle següent que elimina la s
-    non_std_un = {
-        "months": "mesos",
-        "years": "anys",
-        'decades': "dècades",
-        'centurys': "segles",
-        'millenniums': "mil·lenis"
-    }
-
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[s]?"
 
     text = text.replace("í", "i").replace("é", "e").replace("ñ", "n").replace("mesos", "mes")
     text = numbers_to_digits_ca(text)
 
-    for (unit_en, unit_ca) in time_units.items():
-        unit_pattern = pattern.format(
-            unit=unit_ca[:-1])  # remove 's' from unit
-        time_units[unit_en] = 0
-
-        def repl(match):
-            time_units[unit_en] += float(match.group(1))
-            return ''
-
-        text = re.sub(unit_pattern, repl, text)
-
-    for (unit_en, unit_ca) in non_std_un.items():
-        unit_pattern = pattern.format(
-            unit=unit_ca[:-1])  # remove 's' from unit
-
-        def repl_non_std(match):
-            val = float(match.group(1))
-            if unit_en == "months":
-                val = DAYS_IN_1_MONTH * val
-            if unit_en == "years":
-                val = DAYS_IN_1_YEAR * val
-            if unit_en == "decades":
-                val = 10 * DAYS_IN_1_YEAR * val
-            if unit_en == "centurys":
-                val = 100 * DAYS_IN_1_YEAR * val
-            if unit_en == "millenniums":
-                val = 1000 * DAYS_IN_1_YEAR * val
-            time_units["days"] += val
-            return ''
-
-        text = re.sub(unit_pattern, repl_non_std, text)
+    for unit_en, multiplier, unit_regex in _DURATION_UNITS_CA:
+        values = unit_regex.findall(text)
+        if values:
+            for value in values:
+                time_units[unit_en] += multiplier * float(value)
+            text = unit_regex.sub('', text)
 
     text = text.strip()
     duration = timedelta(**time_units) if any(time_units.values()) else None
@@ -132,6 +132,14 @@ def nice_time_cs(dt, speech=True, use_24hour=True, use_ampm=False):
         return speak
 
 
+_DURATION_PATTERN_CS = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[ay]?"
+# (timedelta argument, compiled pattern) in matching order
+_DURATION_UNITS_CS = [
+    (unit_en, re.compile(_DURATION_PATTERN_CS.format(unit=unit_cs)))
+    for unit_cs, unit_en in _TIME_UNITS_CONVERSION.items()
+]
+
+
 def extract_duration_cs(text):
     """
     Convert an english phrase into a number of seconds
@@ -174,17 +182,14 @@ def extract_duration_cs(text):
         'weeks': 0
     }
 
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[ay]?"
     text = numbers_to_digits_cs(text)
 
-    for (unit_cs, unit_en) in _TIME_UNITS_CONVERSION.items():
-        unit_pattern = pattern.format(unit=unit_cs)
-
-        def repl(match):
-            time_units[unit_en] += float(match.group(1))
-            return ''
-
-        text = re.sub(unit_pattern, repl, text)
+    for unit_en, unit_regex in _DURATION_UNITS_CS:
+        values = unit_regex.findall(text)
+        if values:
+            for value in values:
+                time_units[unit_en] += float(value)
+            text = unit_regex.sub('', text)
 
     text = text.strip()
     duration = timedelta(**time_units) if any(time_units.values()) else None
@@ -784,6 +784,31 @@ def extract_datetime_da(text, anchorDate=None, default_time=None):
 
     return [extractedDate, resultStr]
 
+_DURATION_PATTERN_DA = r"(?P<value>\d+(?:\.?\d+)?)\s+{unit}"
+# (timedelta argument, multiplier, compiled pattern) in matching order,
+# longest words first for each unit
+_DURATION_UNITS_DA = [
+    (unit, multiplier, re.compile(_DURATION_PATTERN_DA.format(unit=unit_da)))
+    for unit, multiplier, unit_da_words in (
+        ('microseconds', 1, ["mikrosekund", "mikrosekunder", "mikrosekunds", "mikrosekunders"]),
+        ('milliseconds', 1, ["millisekund", "millisekunder", "millisekunds"]),
+        ('seconds', 1, ["sekund", "sekunder", "sekunds", "sekunders"]),
+        ('minutes', 1, ["minut", "minutter", "minuts", "minutters"]),
+        ('hours', 1, ["time", "timer", "times", "timers"]),
+        ('days', 1, ["dag", "dage", "dags", "dages"]),
+        ('weeks', 1, ["uge", "uges", "uger", "ugers"]),
+        # Non-standard time units
+        ('days', DAYS_IN_1_MONTH, ["måned", "måneder", "måneds", "måneders"]),
+        ('days', 10 * DAYS_IN_1_YEAR, ["årti", "årtier", "årtis"]),
+        ('days', 100 * DAYS_IN_1_YEAR, ["århundrede", "århundreder", "århundredes"]),
+        ('days', 1000 * DAYS_IN_1_YEAR, ["årtusinde", "årtusinder", "årtusindes"]),
+        # must be last to avoid matching on centuries and millennia
+        ('days', DAYS_IN_1_YEAR, ["år", "års"])
+    )
+    for unit_da in sorted(unit_da_words, key=len, reverse=True)
+]
+
+
 def extract_duration_da(text):
     """Convert a danish phrase into a number of seconds
 
@@ -822,57 +847,14 @@ def extract_duration_da(text):
         'weeks': 0
     }
 
-    da_translations = {
-        'microseconds': ["mikrosekund", "mikrosekunder", "mikrosekunds", "mikrosekunders"],
-        'milliseconds': ["millisekund", "millisekunder", "millisekunds"],
-        'seconds': ["sekund", "sekunder", "sekunds", "sekunders"],
-        'minutes': ["minut", "minutter", "minuts", "minutters"],
-        'hours': ["time", "timer", "times", "timers"],
-        'days': ["dag", "dage", "dags", "dages"],
-        'weeks': ["uge", "uges", "uger", "ugers"]
-    }
-
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)\s+{unit}"
     text = numbers_to_digits_da(text)
 
-    for unit in time_units:
-        unit_da_words = da_translations[unit]
-        unit_da_words.sort(key=len, reverse=True)
-        for unit_da in unit_da_words:
-            unit_pattern = pattern.format(unit=unit_da)
-            matches = re.findall(unit_pattern, text)
+    for unit, multiplier, unit_regex in _DURATION_UNITS_DA:
+        matches = unit_regex.findall(text)
+        if matches:
             value = sum(map(float, matches))
-            time_units[unit] = time_units[unit] + value
-            text = re.sub(unit_pattern, '', text)
-
-    # Non-standard time units
-    non_std_unit = {
-        'months': ["måned", "måneder", "måneds", "måneders"],
-        'decades': ["årti", "årtier", "årtis"],
-        'centuries': ["århundrede", "århundreder", "århundredes"],
-        'millennia': ["årtusinde", "årtusinder", "årtusindes"],
-        'years': ["år", "års"]  # must be last to avoid matching on centuries and millennia
-    }
-
-    for unit in non_std_unit.keys():
-        unit_da_words = non_std_unit[unit]
-        unit_da_words.sort(key=len, reverse=True)
-        for unit_da in unit_da_words:
-            unit_pattern = pattern.format(unit=unit_da)
-            matches = re.findall(unit_pattern, text)
-            val = sum(map(float, matches))
-            if unit == "months":
-                val = DAYS_IN_1_MONTH * val
-            if unit == "years":
-                val = DAYS_IN_1_YEAR * val
-            if unit == "decades":
-                val = 10 * DAYS_IN_1_YEAR * val
-            if unit == "centuries":
-                val = 100 * DAYS_IN_1_YEAR * val
-            if unit == "millennia":
-                val = 1000 * DAYS_IN_1_YEAR * val
-            time_units["days"] += val
-            text = re.sub(unit_pattern, '', text)
+            time_units[unit] += multiplier * value
+            text = unit_regex.sub('', text)
 
     text = text.strip()
     duration = timedelta(**time_units) if any(time_units.values()) else None
@@ -1,4 +1,3 @@
-import re
 from datetime import datetime, timedelta
 
 from dateutil.relativedelta import relativedelta
@@ -6,6 +5,9 @@ from ovos_number_parser.numbers_de import pronounce_number_de, _get_ordinal_inde
     numbers_to_digits_de
 from ovos_utils.time import now_local
 
+from ovos_date_parser.common import DurationScanner
+from ovos_date_parser.prepared import normalizer
+
 
 def nice_time_de(dt, speech=True, use_24hour=False, use_ampm=False):
     """
@@ -72,6 +74,31 @@ def nice_time_de(dt, speech=True, use_24hour=False, use_ampm=False):
     return string
 
 
+# Einzahl und Mehrzahl
+_DURATION_PATTERN_DE = r"(?:^|\s)(?P<value>\d+(?:[.,]?\d+)?\b)(?:\s+|\-){unit}[nes]?[sn]?\b"
+# (timedelta argument, multiplier, unit) in matching order
+_DURATION_SCANNER_DE = DurationScanner(_DURATION_PATTERN_DE, [
+    # remove 'n'/'e' from unit
+    (unit_en, 1, unit_de[:-1])
+    for unit_en, unit_de in (
+        ('microseconds', 'mikrosekunden'),
+        ('milliseconds', 'millisekunden'),
+        ('seconds', 'sekunden'),
+        ('minutes', 'minuten'),
+        ('hours', 'stunden'),
+        ('days', 'tage'),
+        ('weeks', 'wochen'),
+    )
+], to_number=lambda value: float(value.replace(",", ".")))
+_DURATION_KEYWORDS_DE = frozenset(_DURATION_SCANNER_DE.unit_words)
+
+
+@normalizer
+def _normalize_duration_de(text):
+    """text as scanned by extract_duration_de, numbers converted to digits"""
+    return numbers_to_digits_de(text.lower())
+
+
 def extract_duration_de(text):
     """
     Convert a german phrase into a number of seconds
@@ -95,63 +122,85 @@ def extract_duration_de(text):
     if not text:
         return None
 
-    text = text.lower()
-    # die time_unit values werden für timedelta() mit dem jeweiligen Wert überschrieben
     time_units = {
-        'microseconds': 'mikrosekunden',
-        'milliseconds': 'millisekunden',
-        'seconds': 'sekunden',
-        'minutes': 'minuten',
-        'hours': 'stunden',
-        'days': 'tage',
-        'weeks': 'wochen'
+        'microseconds': 0,
+        'milliseconds': 0,
+        'seconds': 0,
+        'minutes': 0,
+        'hours': 0,
+        'days': 0,
+        'weeks': 0
     }
 
-    # Einzahl und Mehrzahl
-    pattern = r"(?:^|\s)(?P<value>\d+(?:[.,]?\d+)?\b)(?:\s+|\-)(?P<unit>{unit}[nes]?[sn]?\b)"
+    text = _normalize_duration_de(text)
+    text = _DURATION_SCANNER_DE.scan(text, time_units)
 
-    text = numbers_to_digits_de(text)
+    text = text.strip()
+    duration = timedelta(**time_units) if any(time_units.values()) else None
 
-    for (unit_en, unit_de) in time_units.items():
-        unit_pattern = pattern.format(
-            unit=unit_de[:-1])  # remove 'n'/'e' from unit
-        time_units[unit_en] = 0
+    return (duration, text)
 
-        def repl(match):
-            value = match.group("value").replace(",", ".")
-            time_units[unit_en] += float(value)
-            return ''
 
-        text = re.sub(unit_pattern, repl, text)
+# vocabulary of extract_datetime_de, built once instead of on every call
+_TIME_QUALIFIERS_DE = ['früh', 'morgens', 'vormittag', 'vormittags',
+                       'mittag', 'mittags', 'nachmittag', 'nachmittags',
+                       'abend', 'abends', 'nacht', 'nachts', 'pm', 'p.m.']
+_DAYS_DE = ['montag', 'dienstag', 'mittwoch',
+            'donnerstag', 'freitag', 'samstag', 'sonntag']
+_MONTHS_DE = ['januar', 'februar', 'märz', 'april', 'mai', 'juni',
+              'juli', 'august', 'september', 'oktober', 'november',
+              'dezember']
+_MONTHS_SHORT_DE = ['jan', 'feb', 'mär', 'apr', 'mai', 'juni', 'juli', 'aug',
+                    'sept', 'oct', 'nov', 'dez']
+# words a date needs when it has no digits or number words, matched as word
+# prefixes (montagabend, nächsten, ...) by ovos_date_parser.prefilter
+_DATETIME_KEYWORDS_DE = frozenset(_TIME_QUALIFIERS_DE + _DAYS_DE + _MONTHS_DE + _MONTHS_SHORT_DE + [
+    "heute", "morgen", "übermorgen", "gestern", "vorgestern", "jetzt", "mitternacht", "uhr",
+    "nächst", "letzt", "sekunde", "minute", "stunde", "tag", "woche", "monat", "jahr"])
 
-    text = text.strip()
-    duration = timedelta(**time_units) if any(time_units.values()) else None
 
-    return (duration, text)
+@normalizer
+def _normalize_datetime_de(s):
+    """
+        cleans the input string of unneeded punctuation
+        and capitalization among other things.
 
+        'am' is a preposition, so cannot currently be used
+        for 12 hour date format
+    """
 
-def extract_datetime_de(text, anchorDate=None, default_time=None):
-    def clean_string(s):
-        """
-            cleans the input string of unneeded punctuation
-            and capitalization among other things.
+    s = numbers_to_digits_de(s)
+    s = s.lower().replace('?', '').replace(' der ', ' ').replace(' den ', ' ') \
+        .replace(' an ', ' ').replace(' am ', ' ').replace(' auf ', ' ') \
+        .replace(' um ', ' ')
+    wordList = s.split()
 
-            'am' is a preposition, so cannot currently be used
-            for 12 hour date format
-        """
+    for idx, word in enumerate(wordList):
+        ordinal = _get_ordinal_index(word)
+        if ordinal:
+            wordList[idx] = ordinal
 
-        s = numbers_to_digits_de(s)
-        s = s.lower().replace('?', '').replace(' der ', ' ').replace(' den ', ' ') \
-            .replace(' an ', ' ').replace(' am ', ' ').replace(' auf ', ' ') \
-            .replace(' um ', ' ')
-        wordList = s.split()
+    return wordList
 
-        for idx, word in enumerate(wordList):
-            ordinal = _get_ordinal_index(word)
-            if ordinal:
-                wordList[idx] = ordinal
 
-        return wordList
+def extract_datetime_de(text, anchorDate=None, default_time=None):
+    result = _extract_datetime_words_de(text, anchorDate, default_time)
+    if result is None:
+        return None
+    extractedDate, words, _ = result
+    resultStr = " ".join(words)
+    resultStr = ' '.join(resultStr.split())
+    return [extractedDate, resultStr]
+
+
+def _extract_datetime_words_de(text, anchorDate=None, default_time=None):
+    """ extract_datetime_de without building the remainder string
+
+    Returns:
+        (datetime, list, list): the datetime, the normalized words with the
+            consumed ones blanked and the normalized words as they were
+            before parsing, or None if no date or time was found.
+    """
 
     def date_found():
         return found or \
@@ -180,19 +229,13 @@ def extract_datetime_de(text, anchorDate=None, default_time=None):
     hasYear = False
     timeQualifier = ""
 
-    timeQualifiersList = ['früh', 'morgens', 'vormittag', 'vormittags',
-                          'mittag', 'mittags', 'nachmittag', 'nachmittags',
-                          'abend', 'abends', 'nacht', 'nachts', 'pm', 'p.m.']
+    timeQualifiersList = _TIME_QUALIFIERS_DE
     eveningQualifiers = ['nachmittag', 'nachmittags', 'abend', 'abends', 'nacht',
                          'nachts', 'pm', 'p.m.']
     markers = ['in', 'am', 'gegen', 'bis', 'für']
-    days = ['montag', 'dienstag', 'mittwoch',
-            'donnerstag', 'freitag', 'samstag', 'sonntag']
-    months = ['januar', 'februar', 'märz', 'april', 'mai', 'juni',
-              'juli', 'august', 'september', 'oktober', 'november',
-              'dezember']
-    monthsShort = ['jan', 'feb', 'mär', 'apr', 'mai', 'juni', 'juli', 'aug',
-                   'sept', 'oct', 'nov', 'dez']
+    days = _DAYS_DE
+    months = _MONTHS_DE
+    monthsShort = _MONTHS_SHORT_DE
 
     validFollowups = days + months + monthsShort
     validFollowups.append("heute")
@@ -209,7 +252,8 @@ def extract_datetime_de(text, anchorDate=None, default_time=None):
     validFollowups.append("letztem")
     validFollowups.append("jetzt")
 
-    words = clean_string(text)
+    words = _normalize_datetime_de(text)
+    cleaned = list(words)
 
     for idx, word in enumerate(words):
         if word == "":
@@ -811,7 +855,4 @@ def extract_datetime_de(text, anchorDate=None, default_time=None):
                 and words[idx + 1] == "":
             words[idx] = ""
 
-    resultStr = " ".join(words)
-    resultStr = ' '.join(resultStr.split())
-
-    return [extractedDate, resultStr]
+    return extractedDate, words, cleaned
@@ -1,4 +1,3 @@
-import re
 from datetime import datetime, timedelta, time
 
 from dateutil.relativedelta import relativedelta
@@ -6,6 +5,59 @@ from ovos_number_parser.numbers_en import extract_number_en, numbers_to_digits_e
 from ovos_number_parser.util import is_numeric
 from ovos_utils.time import now_local, DAYS_IN_1_YEAR, DAYS_IN_1_MONTH
 
+from ovos_date_parser.common import DurationScanner
+from ovos_date_parser.prepared import normalizer
+
+# vocabulary of extract_datetime_en, built once instead of on every call
+_TIME_QUALIFIERS_AM_EN = ['morning']
+_TIME_QUALIFIERS_PM_EN = ['afternoon', 'evening', 'night', 'tonight']
+_TIME_QUALIFIERS_EN = frozenset(_TIME_QUALIFIERS_AM_EN + _TIME_QUALIFIERS_PM_EN)
+_YEAR_MARKERS_EN = ['in', 'on', 'of']
+_PAST_MARKERS_EN = ["was", "last", "past"]
+_EARLIER_MARKERS_EN = ["ago", "earlier"]
+_FUTURE_MARKERS_EN = ["in", "within"]  # in a month -> + 1 month timedelta
+_FUTURE_1ST_MARKERS_EN = ["next"]  # next month -> day 1 of next month
+_ANY_FUTURE_MARKERS_EN = _FUTURE_MARKERS_EN + _FUTURE_1ST_MARKERS_EN
+_MARKERS_EN = _YEAR_MARKERS_EN + ['at', 'by', 'this', 'around', 'for', "within"]
+_DAYS_EN = ['monday', 'tuesday', 'wednesday',
+            'thursday', 'friday', 'saturday', 'sunday']
+_MONTHS_EN = ['january', 'february', 'march', 'april', 'may', 'june',
+              'july', 'august', 'september', 'october', 'november',
+              'december']
+_RECUR_MARKERS_EN = _DAYS_EN + [d + 's' for d in _DAYS_EN] + ['weekend', 'weekday',
+                                                              'weekends', 'weekdays']
+_MONTHS_SHORT_EN = ['jan', 'feb', 'mar', 'apr', 'may', 'june', 'july', 'aug',
+                    'sept', 'oct', 'nov', 'dec']
+_YEAR_MULTIPLES_EN = ["decade", "century", "millennium"]
+_DAY_MULTIPLES_EN = ["weeks", "months", "years"]
+# parse 5 days from tomorrow, 10 weeks from next thursday, 2 months from July
+_VALID_FOLLOWUPS_EN = frozenset(_DAYS_EN + _MONTHS_EN + _MONTHS_SHORT_EN + [
+    "today", "tomorrow", "yesterday", "next", "last", "past", "now", "this"])
+# words a date needs when it has no digits or number words, matched as word
+# prefixes (days, weekend, ...) by ovos_date_parser.prefilter
+_DATETIME_KEYWORDS_EN = _VALID_FOLLOWUPS_EN.union(_TIME_QUALIFIERS_EN, _YEAR_MULTIPLES_EN, [
+    "centuries", "decades", "millenniums", "noon", "midnight", "o'clock", "oclock", "clock",
+    "second", "minute", "hour", "day", "week", "month", "year"])
+
+_DURATION_PATTERN_EN = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}s?"
+# (timedelta argument, multiplier, unit) in matching order,
+# units without a timedelta argument are converted to days
+_DURATION_SCANNER_EN = DurationScanner(_DURATION_PATTERN_EN, [
+    ('days', DAYS_IN_1_MONTH, 'month'),
+    ('days', DAYS_IN_1_YEAR, 'year'),
+    ('days', 10 * DAYS_IN_1_YEAR, 'decade'),
+    ('days', 100 * DAYS_IN_1_YEAR, 'century'),
+    ('days', 1000 * DAYS_IN_1_YEAR, 'millennium'),
+    ('microseconds', 1, 'microsecond'),
+    ('milliseconds', 1, 'millisecond'),
+    ('seconds', 1, 'second'),
+    ('minutes', 1, 'minute'),
+    ('hours', 1, 'hour'),
+    ('days', 1, 'day'),
+    ('weeks', 1, 'week'),
+])
+_DURATION_KEYWORDS_EN = frozenset(_DURATION_SCANNER_EN.unit_words + ("centuries", "millenia"))
+
 
 def nice_time_en(dt, speech=True, use_24hour=False, use_ampm=False):
     """
@@ -91,6 +143,16 @@ def nice_time_en(dt, speech=True, use_24hour=False, use_ampm=False):
         return speak
 
 
+@normalizer
+def _normalize_duration_en(text):
+    """text as scanned by extract_duration_en, numbers converted to digits"""
+    text = numbers_to_digits_en(text)
+    text = text.replace("centuries", "century").replace("millenia", "millennium")
+    for word in ('day', 'month', 'year', 'decade', 'century', 'millennium'):
+        text = text.replace(f'a {word}', f'1 {word}')
+    return text
+
+
 def extract_duration_en(text):
     """
     Convert an english phrase into a number of seconds
@@ -129,42 +191,8 @@ def extract_duration_en(text):
         'days': 0,
         'weeks': 0
     }
-    # NOTE: these are spelled wrong on purpose because of the loop below that strips the s
-    units = ['months', 'years', 'decades', 'centurys', 'millenniums'] + \
-            list(time_units.keys())
-
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}s?"
-    text = numbers_to_digits_en(text)
-    text = text.replace("centuries", "century").replace("millenia", "millennium")
-    for word in ('day', 'month', 'year', 'decade', 'century', 'millennium'):
-        text = text.replace(f'a {word}', f'1 {word}')
-
-    for unit_en in units:
-        unit_pattern = pattern.format(unit=unit_en[:-1])  # remove 's' from unit
-
-        def repl(match):
-            time_units[unit_en] += float(match.group(1))
-            return ''
-
-        def repl_non_std(match):
-            val = float(match.group(1))
-            if unit_en == "months":
-                val = DAYS_IN_1_MONTH * val
-            if unit_en == "years":
-                val = DAYS_IN_1_YEAR * val
-            if unit_en == "decades":
-                val = 10 * DAYS_IN_1_YEAR * val
-            if unit_en == "centurys":
-                val = 100 * DAYS_IN_1_YEAR * val
-            if unit_en == "millenniums":
-                val = 1000 * DAYS_IN_1_YEAR * val
-            time_units["days"] += val
-            return ''
-
-        if unit_en not in time_units:
-            text = re.sub(unit_pattern, repl_non_std, text)
-        else:
-            text = re.sub(unit_pattern, repl, text)
+    text = _normalize_duration_en(text)
+    text = _DURATION_SCANNER_EN.scan(text, time_units)
 
     text = text.strip()
     duration = timedelta(**time_units) if any(time_units.values()) else None
@@ -172,6 +200,34 @@ def extract_duration_en(text):
     return (duration, text)
 
 
+@normalizer
+def _normalize_datetime_en(s):
+    # normalize and lowercase utt  (replaces words with numbers)
+    s = numbers_to_digits_en(s, ordinals=None)
+    # clean unneeded punctuation and capitalization among other things.
+    s = s.lower().replace('?', '').replace(',', '') \
+        .replace(' the ', ' ').replace(' a ', ' ').replace(' an ', ' ') \
+        .replace("o' clock", "o'clock").replace("o clock", "o'clock") \
+        .replace("o ' clock", "o'clock").replace("o 'clock", "o'clock") \
+        .replace("oclock", "o'clock").replace("couple", "2") \
+        .replace("centuries", "century").replace("decades", "decade") \
+        .replace("millenniums", "millennium")
+
+    wordList = s.split()
+    for idx, word in enumerate(wordList):
+        word = word.replace("'s", "")
+
+        ordinals = ["rd", "st", "nd", "th"]
+        if word[0].isdigit():
+            for ordinal in ordinals:
+                # "second" is the only case we should not do this
+                if ordinal in word and "second" not in word:
+                    word = word.replace(ordinal, "")
+        wordList[idx] = word
+
+    return wordList
+
+
 def extract_datetime_en(text, anchorDate=None, default_time=None):
     """ Convert a human date reference into an exact datetime
 
@@ -202,32 +258,23 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                          text not consumed in the parsing, or None if no
                          date or time related text was found.
     """
+    result = _extract_datetime_words_en(text, anchorDate, default_time)
+    if result is None:
+        return None
+    extractedDate, words, _ = result
+    resultStr = " ".join(words)
+    resultStr = ' '.join(resultStr.split())
+    return [extractedDate, resultStr]
+
+
+def _extract_datetime_words_en(text, anchorDate=None, default_time=None):
+    """ extract_datetime_en without building the remainder string
 
-    def clean_string(s):
-        # normalize and lowercase utt  (replaces words with numbers)
-        s = numbers_to_digits_en(s, ordinals=None)
-        # clean unneeded punctuation and capitalization among other things.
-        s = s.lower().replace('?', '').replace(',', '') \
-            .replace(' the ', ' ').replace(' a ', ' ').replace(' an ', ' ') \
-            .replace("o' clock", "o'clock").replace("o clock", "o'clock") \
-            .replace("o ' clock", "o'clock").replace("o 'clock", "o'clock") \
-            .replace("oclock", "o'clock").replace("couple", "2") \
-            .replace("centuries", "century").replace("decades", "decade") \
-            .replace("millenniums", "millennium")
-
-        wordList = s.split()
-        for idx, word in enumerate(wordList):
-            word = word.replace("'s", "")
-
-            ordinals = ["rd", "st", "nd", "th"]
-            if word[0].isdigit():
-                for ordinal in ordinals:
-                    # "second" is the only case we should not do this
-                    if ordinal in word and "second" not in word:
-                        word = word.replace(ordinal, "")
-            wordList[idx] = word
-
-        return wordList
+    Returns:
+        (datetime, list, list): the datetime, the normalized words with the
+            consumed ones blanked and the normalized words as they were
+            before parsing, or None if no date or time was found.
+    """
 
     def date_found():
         return found or \
@@ -258,30 +305,26 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
     hasYear = False
     timeQualifier = ""
 
-    timeQualifiersAM = ['morning']
-    timeQualifiersPM = ['afternoon', 'evening', 'night', 'tonight']
-    timeQualifiersList = set(timeQualifiersAM + timeQualifiersPM)
-    year_markers = ['in', 'on', 'of']
-    past_markers = ["last", "past"]
-    earlier_markers = ["ago", "earlier"]
-    later_markers = ["after", "later"]
-    future_markers = ["in", "within"]  # in a month -> + 1 month timedelta
-    future_1st_markers = ["next"]  # next month -> day 1 of next month
-    markers = year_markers + ['at', 'by', 'this', 'around', 'for', "within"]
-    days = ['monday', 'tuesday', 'wednesday',
-            'thursday', 'friday', 'saturday', 'sunday']
-    months = ['january', 'february', 'march', 'april', 'may', 'june',
-              'july', 'august', 'september', 'october', 'november',
-              'december']
-    recur_markers = days + [d + 's' for d in days] + ['weekend', 'weekday',
-                                                      'weekends', 'weekdays']
-    monthsShort = ['jan', 'feb', 'mar', 'apr', 'may', 'june', 'july', 'aug',
-                   'sept', 'oct', 'nov', 'dec']
-    year_multiples = ["decade", "century", "millennium"]
-    day_multiples = ["weeks", "months", "years"]
-    past_markers = ["was", "last", "past"]
-
-    words = clean_string(text)
+    timeQualifiersAM = _TIME_QUALIFIERS_AM_EN
+    timeQualifiersPM = _TIME_QUALIFIERS_PM_EN
+    timeQualifiersList = _TIME_QUALIFIERS_EN
+    year_markers = _YEAR_MARKERS_EN
+    earlier_markers = _EARLIER_MARKERS_EN
+    future_markers = _FUTURE_MARKERS_EN
+    future_1st_markers = _FUTURE_1ST_MARKERS_EN
+    any_future_markers = _ANY_FUTURE_MARKERS_EN
+    markers = _MARKERS_EN
+    days = _DAYS_EN
+    months = _MONTHS_EN
+    recur_markers = _RECUR_MARKERS_EN
+    monthsShort = _MONTHS_SHORT_EN
+    year_multiples = _YEAR_MULTIPLES_EN
+    day_multiples = _DAY_MULTIPLES_EN
+    past_markers = _PAST_MARKERS_EN
+    validFollowups = _VALID_FOLLOWUPS_EN
+
+    words = _normalize_datetime_en(text)
+    cleaned = list(words)
 
     for idx, word in enumerate(words):
         if word == "":
@@ -300,10 +343,10 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
             dayOffset = - dayOffset
             used += 1
         elif word == "now" and not datestr:
-            resultStr = " ".join(words[idx + 1:])
-            resultStr = ' '.join(resultStr.split())
+            # everything up to "now" is consumed
+            words[:idx + 1] = [""] * (idx + 1)
             extractedDate = anchorDate.replace(microsecond=0)
-            return [extractedDate, resultStr]
+            return extractedDate, words, cleaned
         elif wordNext in year_multiples:
             multiplier = None
             if is_numeric(word):
@@ -401,7 +444,7 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
 
             # next day
             # normalize step makes "in a day" -> "in day"
-            elif wordPrev and wordPrev in future_markers + future_1st_markers:
+            elif wordPrev and wordPrev in any_future_markers:
                 dayOffset += 1
                 start -= 1
                 used = 2
@@ -634,15 +677,6 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 hasYear = True
         # parse 5 days from tomorrow, 10 weeks from next thursday,
         # 2 months from July
-        validFollowups = days + months + monthsShort
-        validFollowups.append("today")
-        validFollowups.append("tomorrow")
-        validFollowups.append("yesterday")
-        validFollowups.append("next")
-        validFollowups.append("last")
-        validFollowups.append("past")
-        validFollowups.append("now")
-        validFollowups.append("this")
         if (word == "from" or word == "after") and wordNext in validFollowups:
             used = 2
             fromFlag = True
@@ -736,13 +770,13 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
             elif wordNextNext == "seconds":
                 secOffset = 2
         # parse in a/next second/minute/hour
-        elif wordNext == "hour" and word in future_markers + future_1st_markers:
+        elif wordNext == "hour" and word in any_future_markers:
             used += 2
             hrOffset = 1
-        elif wordNext == "minute" and word in future_markers + future_1st_markers:
+        elif wordNext == "minute" and word in any_future_markers:
             used += 2
             minOffset = 1
-        elif wordNext == "second" and word in future_markers + future_1st_markers:
+        elif wordNext == "second" and word in any_future_markers:
             used += 2
             secOffset = 1
         # parse last/past  second/minute/hour
@@ -1185,6 +1219,4 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 words[idx - 1] == "" and words[idx + 1] == "":
             words[idx] = ""
 
-    resultStr = " ".join(words)
-    resultStr = ' '.join(resultStr.split())
-    return [extractedDate, resultStr]
+    return extractedDate, words, cleaned
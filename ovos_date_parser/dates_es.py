@@ -1,10 +1,12 @@
-import re
 from datetime import datetime, timedelta
 
 from dateutil.relativedelta import relativedelta
 from ovos_number_parser.numbers_es import pronounce_number_es, numbers_to_digits_es
 from ovos_utils.time import now_local, DAYS_IN_1_YEAR, DAYS_IN_1_MONTH
 
+from ovos_date_parser.common import DurationScanner
+from ovos_date_parser.prepared import normalizer
+
 WEEKDAYS_ES = {
     0: "lunes",
     1: "martes",
@@ -243,45 +245,97 @@ def nice_time_es(dt, speech=True, use_24hour=False, use_ampm=False):
     return speak
 
 
+# vocabulary of extract_datetime_es, built once instead of on every call
+_TIME_QUALIFIERS_LIST_ES = ['mañana', 'tarde', 'noche']
+_TIME_INDICATORS_ES = ["en", "la", "al", "por", "pasados",
+                       "pasadas", "día", "hora"]
+_DAYS_ES = ['lunes', 'martes', 'miércoles',
+            'jueves', 'viernes', 'sábado', 'domingo']
+_MONTHS_ES = ['enero', 'febrero', 'marzo', 'abril', 'mayo', 'junio',
+              'julio', 'agosto', 'septiembre', 'octubre', 'noviembre',
+              'diciembre']
+_MONTHS_SHORT_ES = ['ene', 'feb', 'mar', 'abr', 'may', 'jun', 'jul', 'ago',
+                    'sep', 'oct', 'nov', 'dic']
+_NEXTS_ES = ["siguiente", "próximo", "próxima"]
+_SUFFIX_NEXTS_ES = ["siguientes", "subsecuentes"]
+_LASTS_ES = ["último", "última"]
+_SUFFIX_LASTS_ES = ["pasada", "pasado", "anterior", "antes"]
+_NXTS_ES = ["después", "siguiente", "próximo", "próxima"]
+_PREVS_ES = ["antes", "previa", "previo", "anterior"]
+_THISES_ES = ["este", "esta"]
+_FROMS_ES = ["desde", "en", "para", "después de", "por", "próximo",
+             "próxima", "de"] + _THISES_ES
+_LISTS_ES = _NXTS_ES + _PREVS_ES + _FROMS_ES + _TIME_INDICATORS_ES
+# parse 5 days from tomorrow, 10 weeks from next thursday, 2 months from July
+_VALID_FOLLOWUPS_ES = frozenset(_DAYS_ES + _MONTHS_ES + _MONTHS_SHORT_ES + [
+    "hoy", "mañana", "ayer", "anteayer", "ahora", "ya", "ante"])
+# words a date needs when it has no digits, matched as word prefixes
+# (semanas, anterior, ...) by ovos_date_parser.prefilter
+_DATETIME_KEYWORDS_ES = _VALID_FOLLOWUPS_ES.union(_TIME_QUALIFIERS_LIST_ES, _NEXTS_ES, _LASTS_ES, [
+    "amanecer", "atardecer", "anochecer", "madrugada", "temprano", "mediodía", "medianoche",
+    "pasado", "segundo", "minuto", "hora", "día", "semana", "mes", "año"])
+
+
+@normalizer
+def _normalize_datetime_es(s):
+    # cleans the input string of unneeded punctuation and capitalization
+    # among other things
+    symbols = [".", ",", ";", "?", "!", "º", "ª"]
+    noise_words = ["entre", "la", "del", "al", "el", "de",
+                   "para", "una", "cualquier", "a",
+                   "e'", "esta", "este"]
+
+    for word in symbols:
+        s = s.replace(word, "")
+    for word in noise_words:
+        s = s.replace(" " + word + " ", " ")
+    s = s.lower().replace(
+        "á",
+        "a").replace(
+        "é",
+        "e").replace(
+        "ó",
+        "o").replace(
+        "-",
+        " ").replace(
+        "_",
+        "")
+    # handle synonyms and equivalents, "tomorrow early = tomorrow morning
+    synonyms = {"mañana": ["amanecer", "temprano", "muy temprano"],
+                "tarde": ["media tarde", "atardecer"],
+                "noche": ["anochecer", "tarde"]}
+    for syn in synonyms:
+        for word in synonyms[syn]:
+            s = s.replace(" " + word + " ", " " + syn + " ")
+    # relevant plurals, cant just extract all s in pt
+    wordlist = ["mañanas", "tardes", "noches", "días", "semanas",
+                "años", "minutos", "segundos", "las", "los", "siguientes",
+                "próximas", "próximos", "horas"]
+    for _, word in enumerate(wordlist):
+        s = s.replace(word, word.rstrip('s'))
+    s = s.replace("meses", "mes").replace("anteriores", "anterior")
+    return s
+
+
 def extract_datetime_es(text, anchorDate=None, default_time=None):
-    def clean_string(s):
-        # cleans the input string of unneeded punctuation and capitalization
-        # among other things
-        symbols = [".", ",", ";", "?", "!", "º", "ª"]
-        noise_words = ["entre", "la", "del", "al", "el", "de",
-                       "para", "una", "cualquier", "a",
-                       "e'", "esta", "este"]
-
-        for word in symbols:
-            s = s.replace(word, "")
-        for word in noise_words:
-            s = s.replace(" " + word + " ", " ")
-        s = s.lower().replace(
-            "á",
-            "a").replace(
-            "é",
-            "e").replace(
-            "ó",
-            "o").replace(
-            "-",
-            " ").replace(
-            "_",
-            "")
-        # handle synonyms and equivalents, "tomorrow early = tomorrow morning
-        synonyms = {"mañana": ["amanecer", "temprano", "muy temprano"],
-                    "tarde": ["media tarde", "atardecer"],
-                    "noche": ["anochecer", "tarde"]}
-        for syn in synonyms:
-            for word in synonyms[syn]:
-                s = s.replace(" " + word + " ", " " + syn + " ")
-        # relevant plurals, cant just extract all s in pt
-        wordlist = ["mañanas", "tardes", "noches", "días", "semanas",
-                    "años", "minutos", "segundos", "las", "los", "siguientes",
-                    "próximas", "próximos", "horas"]
-        for _, word in enumerate(wordlist):
-            s = s.replace(word, word.rstrip('s'))
-        s = s.replace("meses", "mes").replace("anteriores", "anterior")
-        return s
+    result = _extract_datetime_words_es(text, anchorDate, default_time)
+    if result is None:
+        return None
+    extractedDate, words, _ = result
+    resultStr = " ".join(words)
+    resultStr = ' '.join(resultStr.split())
+    # resultStr = pt_pruning(resultStr)
+    return [extractedDate, resultStr]
+
+
+def _extract_datetime_words_es(text, anchorDate=None, default_time=None):
+    """ extract_datetime_es without building the remainder string
+
+    Returns:
+        (datetime, list, list): the datetime, the normalized words with the
+            consumed ones blanked and the normalized words as they were
+            before parsing, or None if no date or time was found.
+    """
 
     def date_found():
         return found or \
@@ -311,28 +365,23 @@ def extract_datetime_es(text, anchorDate=None, default_time=None):
     hasYear = False
     timeQualifier = ""
 
-    words = clean_string(text).split(" ")
-    timeQualifiersList = ['mañana', 'tarde', 'noche']
-    time_indicators = ["en", "la", "al", "por", "pasados",
-                       "pasadas", "día", "hora"]
-    days = ['lunes', 'martes', 'miércoles',
-            'jueves', 'viernes', 'sábado', 'domingo']
-    months = ['enero', 'febrero', 'marzo', 'abril', 'mayo', 'junio',
-              'julio', 'agosto', 'septiembre', 'octubre', 'noviembre',
-              'diciembre']
-    monthsShort = ['ene', 'feb', 'mar', 'abr', 'may', 'jun', 'jul', 'ago',
-                   'sep', 'oct', 'nov', 'dic']
-    nexts = ["siguiente", "próximo", "próxima"]
-    suffix_nexts = ["siguientes", "subsecuentes"]
-    lasts = ["último", "última"]
-    suffix_lasts = ["pasada", "pasado", "anterior", "antes"]
-    nxts = ["después", "siguiente", "próximo", "próxima"]
-    prevs = ["antes", "previa", "previo", "anterior"]
-    froms = ["desde", "en", "para", "después de", "por", "próximo",
-             "próxima", "de"]
-    thises = ["este", "esta"]
-    froms += thises
-    lists = nxts + prevs + froms + time_indicators
+    words = _normalize_datetime_es(text).split(" ")
+    cleaned = list(words)
+    timeQualifiersList = _TIME_QUALIFIERS_LIST_ES
+    time_indicators = _TIME_INDICATORS_ES
+    days = _DAYS_ES
+    months = _MONTHS_ES
+    monthsShort = _MONTHS_SHORT_ES
+    nexts = _NEXTS_ES
+    suffix_nexts = _SUFFIX_NEXTS_ES
+    lasts = _LASTS_ES
+    suffix_lasts = _SUFFIX_LASTS_ES
+    nxts = _NXTS_ES
+    prevs = _PREVS_ES
+    froms = _FROMS_ES
+    thises = _THISES_ES
+    lists = _LISTS_ES
+    validFollowups = _VALID_FOLLOWUPS_ES
     for idx, word in enumerate(words):
         if word == "":
             continue
@@ -559,15 +608,6 @@ def extract_datetime_es(text, anchorDate=None, default_time=None):
 
         # parse 5 days from tomorrow, 10 weeks from next thursday,
         # 2 months from July
-        validFollowups = days + months + monthsShort
-        validFollowups.append("hoy")
-        validFollowups.append("mañana")
-        validFollowups.append("ayer")
-        validFollowups.append("anteayer")
-        validFollowups.append("ahora")
-        validFollowups.append("ya")
-        validFollowups.append("ante")
-
         # TODO debug word "depois" that one is failing for some reason
         if word in froms and wordNext in validFollowups:
 
@@ -995,10 +1035,38 @@ def extract_datetime_es(text, anchorDate=None, default_time=None):
     if secOffset != 0:
         extractedDate = extractedDate + relativedelta(seconds=secOffset)
 
-    resultStr = " ".join(words)
-    resultStr = ' '.join(resultStr.split())
-    # resultStr = pt_pruning(resultStr)
-    return [extractedDate, resultStr]
+    return extractedDate, words, cleaned
+
+
+_DURATION_PATTERN_ES = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[s]?"
+# (timedelta argument, multiplier, unit) in matching order,
+# units without a timedelta argument are converted to days
+_DURATION_SCANNER_ES = DurationScanner(_DURATION_PATTERN_ES, [
+    # remove 's' from unit
+    (unit_en, multiplier, unit[:-1])
+    for unit_en, multiplier, unit in (
+        ('microseconds', 1, 'microsegundos'),
+        ('milliseconds', 1, 'milisegundos'),
+        ('seconds', 1, 'segundos'),
+        ('minutes', 1, 'minutos'),
+        ('hours', 1, 'horas'),
+        ('days', 1, 'dias'),
+        ('weeks', 1, 'semanas'),
+        ('days', DAYS_IN_1_MONTH, 'mes'),
+        ('days', DAYS_IN_1_YEAR, 'anos'),
+        ('days', 10 * DAYS_IN_1_YEAR, 'decadas'),
+        ('days', 100 * DAYS_IN_1_YEAR, 'siglos'),
+        ('days', 1000 * DAYS_IN_1_YEAR, 'milenios'),
+    )
+])
+_DURATION_KEYWORDS_ES = frozenset(_DURATION_SCANNER_ES.unit_words)
+
+
+@normalizer
+def _normalize_duration_es(text):
+    """text as scanned by extract_duration_es, numbers converted to digits"""
+    text = text.lower().replace("í", "i").replace("é", "e").replace("ñ", "n").replace("meses", "mes")
+    return numbers_to_digits_es(text)
 
 
 def extract_duration_es(text):
@@ -1024,61 +1092,18 @@ def extract_duration_es(text):
     if not text:
         return None
 
-    text = text.lower().replace("í", "i")
     time_units = {
-        'microseconds': 'microsegundos',
-        'milliseconds': 'milisegundos',
-        'seconds': 'segundos',
-        'minutes': 'minutos',
-        'hours': 'horas',
-        'days': 'dias',
-        'weeks': 'semanas'
-    }
-    # NOTE: some of these english units are spelled wrong on purpose because of the loop below that strips the s
-    non_std_un = {
-        "months": "mes",
-        "years": "anos",
-        'decades': "decadas",
-        'centurys': "siglos",
-        'millenniums': "milenios"
+        'microseconds': 0,
+        'milliseconds': 0,
+        'seconds': 0,
+        'minutes': 0,
+        'hours': 0,
+        'days': 0,
+        'weeks': 0
     }
 
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[s]?"
-
-    text = text.replace("í", "i").replace("é", "e").replace("ñ", "n").replace("meses", "mes")
-    text = numbers_to_digits_es(text)
-
-    for (unit_en, unit_es) in time_units.items():
-        unit_pattern = pattern.format(
-            unit=unit_es[:-1])  # remove 's' from unit
-        time_units[unit_en] = 0
-
-        def repl(match):
-            time_units[unit_en] += float(match.group(1))
-            return ''
-
-        text = re.sub(unit_pattern, repl, text)
-
-    for (unit_en, unit_es) in non_std_un.items():
-        unit_pattern = pattern.format(
-            unit=unit_es[:-1])  # remove 's' from unit
-
-        def repl_non_std(match):
-            val = float(match.group(1))
-            if unit_en == "months":
-                val = DAYS_IN_1_MONTH * val
-            if unit_en == "years":
-                val = DAYS_IN_1_YEAR * val
-            if unit_en == "decades":
-                val = 10 * DAYS_IN_1_YEAR * val
-            if unit_en == "centurys":
-                val = 100 * DAYS_IN_1_YEAR * val
-            if unit_en == "millenniums":
-                val = 1000 * DAYS_IN_1_YEAR * val
-            time_units["days"] += val
-            return ''
-
-        text = re.sub(unit_pattern, repl_non_std, text)
+    text = _normalize_duration_es(text)
+    text = _DURATION_SCANNER_ES.scan(text, time_units)
 
     text = text.strip()
     duration = timedelta(**time_units) if any(time_units.values()) else None
@@ -226,6 +226,29 @@ def nice_time_gl(dt, speech=True, use_24hour=False, use_ampm=False):
     return speak
 
 
+_PATRON_DURACION_GL = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[s]?"
+# (argumento de timedelta, multiplicador, patrón compilado) na orde de procura,
+# as unidades sen argumento de timedelta convértense en días
+_UNIDADES_DURACION_GL = [
+    # eliminar 's' da unidade
+    (unit_en, multiplicador, re.compile(_PATRON_DURACION_GL.format(unit=unit_gl[:-1])))
+    for unit_en, multiplicador, unit_gl in (
+        ('microseconds', 1, 'microsegundos'),
+        ('milliseconds', 1, 'milisegundos'),
+        ('seconds', 1, 'segundos'),
+        ('minutes', 1, 'minutos'),
+        ('hours', 1, 'horas'),
+        ('days', 1, 'dias'),
+        ('weeks', 1, 'semanas'),
+        ('days', 30, 'mes'),  # aproximación dun mes en días
+        ('days', 365, 'anos'),  # aproximación dun ano en días
+        ('days', 10 * 365, 'decadas'),
+        ('days', 100 * 365, 'seculos'),
+        ('days', 1000 * 365, 'milenios'),
+    )
+]
+
+
 def extract_duration_gl(text):
     """
     Converte unha frase en galego nun número de segundos.
@@ -254,54 +277,21 @@ def extract_duration_gl(text):
     text = text.lower().replace("í", "i").replace("é", "e").replace("ñ", "n").replace("meses", "mes")
 
     unidades_tempo = {
-        'microseconds': 'microsegundos',
-        'milliseconds': 'milisegundos',
-        'seconds': 'segundos',
-        'minutes': 'minutos',
-        'hours': 'horas',
-        'days': 'dias',
-        'weeks': 'semanas'
-    }
-
-    unidades_non_estandar = {
-        "months": "mes",
-        "years": "anos",
-        'decades': "decadas",
-        'centuries': "seculos",
-        'millenniums': "milenios"
+        'microseconds': 0,
+        'milliseconds': 0,
+        'seconds': 0,
+        'minutes': 0,
+        'hours': 0,
+        'days': 0,
+        'weeks': 0
     }
 
-    patron = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[s]?"
-
-    for (unit_en, unit_gl) in unidades_tempo.items():
-        patron_unidade = patron.format(unit=unit_gl[:-1])  # eliminar 's' da unidade
-        unidades_tempo[unit_en] = 0
-
-        def substitucion(match):
-            unidades_tempo[unit_en] += float(match.group("value"))
-            return ''
-
-        text = re.sub(patron_unidade, substitucion, text)
-
-    for (unit_en, unit_gl) in unidades_non_estandar.items():
-        patron_unidade = patron.format(unit=unit_gl[:-1])  # eliminar 's' da unidade
-
-        def substitucion_non_estandar(match):
-            val = float(match.group("value"))
-            if unit_en == "months":
-                val = 30 * val  # aproximación dun mes en días
-            elif unit_en == "years":
-                val = 365 * val  # aproximación dun ano en días
-            elif unit_en == "decades":
-                val = 10 * 365 * val
-            elif unit_en == "centuries":
-                val = 100 * 365 * val
-            elif unit_en == "millenniums":
-                val = 1000 * 365 * val
-            unidades_tempo["days"] += val
-            return ''
-
-        text = re.sub(patron_unidade, substitucion_non_estandar, text)
+    for unit_en, multiplicador, patron_unidade in _UNIDADES_DURACION_GL:
+        valores = patron_unidade.findall(text)
+        if valores:
+            for valor in valores:
+                unidades_tempo[unit_en] += multiplicador * float(valor)
+            text = patron_unidade.sub('', text)
 
     text = text.strip()
     duracion = timedelta(**unidades_tempo) if any(unidades_tempo.values()) else None
@@ -6,6 +6,32 @@ from ovos_number_parser.numbers_nl import pronounce_number_nl, extract_number_nl
 from ovos_number_parser.util import is_numeric
 from ovos_utils.time import now_local
 
+from ovos_date_parser.prepared import normalizer
+
+
+_DURATION_PATTERN_NL = r"(?P<value>\d+(?:\.?\d+)?)\s+{unit}"
+# (timedelta argument, compiled pattern) in matching order,
+# longest words first for each unit
+_DURATION_UNITS_NL = [
+    (unit, re.compile(_DURATION_PATTERN_NL.format(unit=unit_nl)))
+    for unit, unit_nl_words in (
+        ('microseconds', ["microsecond", "microseconde", "microseconden", "microsecondje", "microsecondjes"]),
+        ('milliseconds', ["millisecond", "milliseconde", "milliseconden", "millisecondje", "millisecondjes"]),
+        ('seconds', ["second", "seconde", "seconden", "secondje", "secondjes"]),
+        ('minutes', ["minuut", "minuten", "minuutje", "minuutjes"]),
+        ('hours', ["uur", "uren", "uurtje", "uurtjes"]),
+        ('days', ["dag", "dagen", "dagje", "dagjes"]),
+        ('weeks', ["week", "weken", "weekje", "weekjes"])
+    )
+    for unit_nl in sorted(unit_nl_words, key=len, reverse=True)
+]
+
+
+@normalizer
+def _normalize_duration_nl(text):
+    """text as scanned by extract_duration_nl, numbers converted to digits"""
+    return numbers_to_digits_nl(text)
+
 
 def extract_duration_nl(text):
     """Convert an english phrase into a number of seconds
@@ -45,28 +71,14 @@ def extract_duration_nl(text):
         'weeks': 0
     }
 
-    nl_translations = {
-        'microseconds': ["microsecond", "microseconde", "microseconden", "microsecondje", "microsecondjes"],
-        'milliseconds': ["millisecond", "milliseconde", "milliseconden", "millisecondje", "millisecondjes"],
-        'seconds': ["second", "seconde", "seconden", "secondje", "secondjes"],
-        'minutes': ["minuut", "minuten", "minuutje", "minuutjes"],
-        'hours': ["uur", "uren", "uurtje", "uurtjes"],
-        'days': ["dag", "dagen", "dagje", "dagjes"],
-        'weeks': ["week", "weken", "weekje", "weekjes"]
-    }
-
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)\s+{unit}"
-    text = numbers_to_digits_nl(text)
+    text = _normalize_duration_nl(text)
 
-    for unit in time_units:
-        unit_nl_words = nl_translations[unit]
-        unit_nl_words.sort(key=len, reverse=True)
-        for unit_nl in unit_nl_words:
-            unit_pattern = pattern.format(unit=unit_nl)
-            matches = re.findall(unit_pattern, text)
+    for unit, unit_regex in _DURATION_UNITS_NL:
+        matches = unit_regex.findall(text)
+        if matches:
             value = sum(map(float, matches))
             time_units[unit] = time_units[unit] + value
-            text = re.sub(unit_pattern, '', text)
+            text = unit_regex.sub('', text)
 
     text = text.strip()
     duration = timedelta(**time_units) if any(time_units.values()) else None
@@ -74,6 +86,28 @@ def extract_duration_nl(text):
     return (duration, text)
 
 
+@normalizer
+def _normalize_datetime_nl(s):
+    # clean unneeded punctuation and capitalization among other things.
+    s = s.lower().replace('?', '').replace('.', '').replace(',', '') \
+        .replace(' de ', ' ').replace(' het ', ' ').replace(' het ', ' ') \
+        .replace("paar", "2").replace("eeuwen", "eeuw") \
+        .replace("decennia", "decennium") \
+        .replace("millennia", "millennium")
+
+    wordList = s.split()
+    for idx, word in enumerate(wordList):
+        ordinals = ["ste", "de"]
+        if word[0].isdigit():
+            for ordinal in ordinals:
+                # "second" is the only case we should not do this
+                if ordinal in word and "second" not in word:
+                    word = word.replace(ordinal, "")
+        wordList[idx] = word
+
+    return wordList
+
+
 def extract_datetime_nl(text, anchorDate=None, default_time=None):
     """Convert a human date reference into an exact datetime
 
@@ -105,26 +139,6 @@ def extract_datetime_nl(text, anchorDate=None, default_time=None):
                          date or time related text was found.
     """
 
-    def clean_string(s):
-        # clean unneeded punctuation and capitalization among other things.
-        s = s.lower().replace('?', '').replace('.', '').replace(',', '') \
-            .replace(' de ', ' ').replace(' het ', ' ').replace(' het ', ' ') \
-            .replace("paar", "2").replace("eeuwen", "eeuw") \
-            .replace("decennia", "decennium") \
-            .replace("millennia", "millennium")
-
-        wordList = s.split()
-        for idx, word in enumerate(wordList):
-            ordinals = ["ste", "de"]
-            if word[0].isdigit():
-                for ordinal in ordinals:
-                    # "second" is the only case we should not do this
-                    if ordinal in word and "second" not in word:
-                        word = word.replace(ordinal, "")
-            wordList[idx] = word
-
-        return wordList
-
     def date_found():
         return found or \
             (
@@ -170,7 +184,7 @@ def extract_datetime_nl(text, anchorDate=None, default_time=None):
     year_multiples = ["decennium", "eeuw", "millennium"]
     day_multiples = ["dagen", "weken", "maanden", "jaren"]
 
-    words = clean_string(text)
+    words = _normalize_datetime_nl(text)
 
     for idx, word in enumerate(words):
         if word == "":
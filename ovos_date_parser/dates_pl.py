@@ -356,6 +356,14 @@ def get_pronounce_number_for_duration(num):
     return 'jedna' if pronounced == 'jeden' else pronounced
 
 
+_DURATION_PATTERN_PL = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[ayeę]?"
+# (timedelta argument, compiled pattern) in matching order
+_DURATION_UNITS_PL = [
+    (unit_en, re.compile(_DURATION_PATTERN_PL.format(unit=unit_pl)))
+    for unit_pl, unit_en in _TIME_UNITS_CONVERSION.items()
+]
+
+
 def extract_duration_pl(text):
     """
     Convert an english phrase into a number of seconds
@@ -395,17 +403,15 @@ def extract_duration_pl(text):
         'weeks': None
     }
 
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[ayeę]?"
     text = numbers_to_digits_pl(text)
 
-    for unit in _TIME_UNITS_CONVERSION:
-        unit_pattern = pattern.format(unit=unit)
-        matches = re.findall(unit_pattern, text)
+    for unit_en, unit_regex in _DURATION_UNITS_PL:
+        matches = unit_regex.findall(text)
         value = sum(map(float, matches))
-        unit_en = _TIME_UNITS_CONVERSION.get(unit)
         if time_units[unit_en] is None or time_units.get(unit_en) == 0:
             time_units[unit_en] = value
-        text = re.sub(unit_pattern, '', text)
+        if matches:
+            text = unit_regex.sub('', text)
 
     text = text.strip()
     duration = timedelta(**time_units) if any(time_units.values()) else None
@@ -1,4 +1,3 @@
-import re
 from datetime import datetime, timedelta
 
 from dateutil.relativedelta import relativedelta
@@ -6,6 +5,9 @@ from ovos_number_parser.numbers_pt import pronounce_number_pt, numbers_to_digits
 from ovos_number_parser.util import GrammaticalGender
 from ovos_utils.time import now_local, DAYS_IN_1_YEAR, DAYS_IN_1_MONTH
 
+from ovos_date_parser.common import DurationScanner
+from ovos_date_parser.prepared import normalizer
+
 WEEKDAYS_PT = {
     0: "segunda-feira",
     1: "terça-feira",
@@ -232,58 +234,105 @@ def nice_time_pt(dt, speech=True, use_24hour=False, use_ampm=False):
     return speak
 
 
+# vocabulary of extract_datetime_pt, built once instead of on every call
+_TIME_QUALIFIERS_LIST_PT = ['manha', 'tarde', 'noite']
+_TIME_INDICATORS_PT = ["em", "as", "nas", "pelas", "volta", "depois", "estas",
+                       "no", "dia", "hora"]
+_DAYS_PT = ['segunda', 'terca', 'quarta',
+            'quinta', 'sexta', 'sabado', 'domingo']
+_MONTHS_PT = ['janeiro', 'febreiro', 'marco', 'abril', 'maio', 'junho',
+              'julho', 'agosto', 'setembro', 'outubro', 'novembro',
+              'dezembro']
+_MONTHS_SHORT_PT = ['jan', 'feb', 'mar', 'abr', 'mai', 'jun', 'jul', 'ag',
+                    'set', 'out', 'nov', 'dec']
+_NEXTS_PT = ["proximo", "proxima"]
+_SUFFIX_NEXTS_PT = ["seguinte", "subsequente", "seguir"]
+_LASTS_PT = ["ultimo", "ultima"]
+_SUFFIX_LASTS_PT = ["passada", "passado", "anterior", "antes"]
+_NXTS_PT = ["depois", "seguir", "seguida", "seguinte", "proxima", "proximo"]
+_PREVS_PT = ["antes", "ante", "previa", "previamente", "anterior"]
+_THISES_PT = ["este", "esta", "deste", "desta", "neste", "nesta", "nesse",
+              "nessa"]
+_FROMS_PT = ["partir", "em", "para", "na", "no", "daqui", "seguir",
+             "depois", "por", "proxima", "proximo", "da", "do", "de"] + _THISES_PT
+_LISTS_PT = _NXTS_PT + _PREVS_PT + _FROMS_PT + _TIME_INDICATORS_PT
+# parse 5 days from tomorrow, 10 weeks from next thursday, 2 months from July
+_VALID_FOLLOWUPS_PT = frozenset(_DAYS_PT + _MONTHS_PT + _MONTHS_SHORT_PT + [
+    "hoje", "amanha", "ontem", "anteontem", "agora", "ja", "ante"])
+
+
+@normalizer
+def _normalize_datetime_pt(s):
+    # cleans the input string of unneeded punctuation and capitalization
+    # among other things
+    symbols = [".", ",", ";", "?", "!", "º", "ª"]
+    noise_words = ["o", "os", "a", "as", "do", "da", "dos", "das", "de",
+                   "ao", "aos"]
+
+    for word in symbols:
+        s = s.replace(word, "")
+    for word in noise_words:
+        s = s.replace(" " + word + " ", " ")
+    s = s.lower().replace(
+        "á",
+        "a").replace(
+        "ç",
+        "c").replace(
+        "à",
+        "a").replace(
+        "ã",
+        "a").replace(
+        "é",
+        "e").replace(
+        "è",
+        "e").replace(
+        "ê",
+        "e").replace(
+        "ó",
+        "o").replace(
+        "ò",
+        "o").replace(
+        "-",
+        " ").replace(
+        "_",
+        "")
+    # handle synonims and equivalents, "tomorrow early = tomorrow morning
+    synonims = {"manha": ["manhazinha", "cedo", "cedinho"],
+                "tarde": ["tardinha", "tarde"],
+                "noite": ["noitinha", "anoitecer"],
+                "todos": ["ao", "aos"],
+                "em": ["do", "da", "dos", "das", "de"]}
+    for syn in synonims:
+        for word in synonims[syn]:
+            s = s.replace(" " + word + " ", " " + syn + " ")
+    # relevant plurals, cant just extract all s in pt
+    wordlist = ["manhas", "noites", "tardes", "dias", "semanas", "anos",
+                "minutos", "segundos", "nas", "nos", "proximas",
+                "seguintes", "horas"]
+    for _, word in enumerate(wordlist):
+        s = s.replace(word, word.rstrip('s'))
+    s = s.replace("meses", "mes").replace("anteriores", "anterior")
+    return s
+
+
 def extract_datetime_pt(text, anchorDate=None, default_time=None):
-    def clean_string(s):
-        # cleans the input string of unneeded punctuation and capitalization
-        # among other things
-        symbols = [".", ",", ";", "?", "!", "º", "ª"]
-        noise_words = ["o", "os", "a", "as", "do", "da", "dos", "das", "de",
-                       "ao", "aos"]
-
-        for word in symbols:
-            s = s.replace(word, "")
-        for word in noise_words:
-            s = s.replace(" " + word + " ", " ")
-        s = s.lower().replace(
-            "á",
-            "a").replace(
-            "ç",
-            "c").replace(
-            "à",
-            "a").replace(
-            "ã",
-            "a").replace(
-            "é",
-            "e").replace(
-            "è",
-            "e").replace(
-            "ê",
-            "e").replace(
-            "ó",
-            "o").replace(
-            "ò",
-            "o").replace(
-            "-",
-            " ").replace(
-            "_",
-            "")
-        # handle synonims and equivalents, "tomorrow early = tomorrow morning
-        synonims = {"manha": ["manhazinha", "cedo", "cedinho"],
-                    "tarde": ["tardinha", "tarde"],
-                    "noite": ["noitinha", "anoitecer"],
-                    "todos": ["ao", "aos"],
-                    "em": ["do", "da", "dos", "das", "de"]}
-        for syn in synonims:
-            for word in synonims[syn]:
-                s = s.replace(" " + word + " ", " " + syn + " ")
-        # relevant plurals, cant just extract all s in pt
-        wordlist = ["manhas", "noites", "tardes", "dias", "semanas", "anos",
-                    "minutos", "segundos", "nas", "nos", "proximas",
-                    "seguintes", "horas"]
-        for _, word in enumerate(wordlist):
-            s = s.replace(word, word.rstrip('s'))
-        s = s.replace("meses", "mes").replace("anteriores", "anterior")
-        return s
+    result = _extract_datetime_words_pt(text, anchorDate, default_time)
+    if result is None:
+        return None
+    extractedDate, words, _ = result
+    resultStr = " ".join(words)
+    resultStr = ' '.join(resultStr.split())
+    return [extractedDate, resultStr]
+
+
+def _extract_datetime_words_pt(text, anchorDate=None, default_time=None):
+    """ extract_datetime_pt without building the remainder string
+
+    Returns:
+        (datetime, list, list): the datetime, the normalized words with the
+            consumed ones blanked and the normalized words as they were
+            before parsing, or None if no date or time was found.
+    """
 
     def date_found():
         return found or \
@@ -312,29 +361,23 @@ def extract_datetime_pt(text, anchorDate=None, default_time=None):
     hasYear = False
     timeQualifier = ""
 
-    words = clean_string(text).split(" ")
-    timeQualifiersList = ['manha', 'tarde', 'noite']
-    time_indicators = ["em", "as", "nas", "pelas", "volta", "depois", "estas",
-                       "no", "dia", "hora"]
-    days = ['segunda', 'terca', 'quarta',
-            'quinta', 'sexta', 'sabado', 'domingo']
-    months = ['janeiro', 'febreiro', 'marco', 'abril', 'maio', 'junho',
-              'julho', 'agosto', 'setembro', 'outubro', 'novembro',
-              'dezembro']
-    monthsShort = ['jan', 'feb', 'mar', 'abr', 'mai', 'jun', 'jul', 'ag',
-                   'set', 'out', 'nov', 'dec']
-    nexts = ["proximo", "proxima"]
-    suffix_nexts = ["seguinte", "subsequente", "seguir"]
-    lasts = ["ultimo", "ultima"]
-    suffix_lasts = ["passada", "passado", "anterior", "antes"]
-    nxts = ["depois", "seguir", "seguida", "seguinte", "proxima", "proximo"]
-    prevs = ["antes", "ante", "previa", "previamente", "anterior"]
-    froms = ["partir", "em", "para", "na", "no", "daqui", "seguir",
-             "depois", "por", "proxima", "proximo", "da", "do", "de"]
-    thises = ["este", "esta", "deste", "desta", "neste", "nesta", "nesse",
-              "nessa"]
-    froms += thises
-    lists = nxts + prevs + froms + time_indicators
+    words = _normalize_datetime_pt(text).split(" ")
+    cleaned = list(words)
+    timeQualifiersList = _TIME_QUALIFIERS_LIST_PT
+    time_indicators = _TIME_INDICATORS_PT
+    days = _DAYS_PT
+    months = _MONTHS_PT
+    monthsShort = _MONTHS_SHORT_PT
+    nexts = _NEXTS_PT
+    suffix_nexts = _SUFFIX_NEXTS_PT
+    lasts = _LASTS_PT
+    suffix_lasts = _SUFFIX_LASTS_PT
+    nxts = _NXTS_PT
+    prevs = _PREVS_PT
+    froms = _FROMS_PT
+    thises = _THISES_PT
+    lists = _LISTS_PT
+    validFollowups = _VALID_FOLLOWUPS_PT
     for idx, word in enumerate(words):
         if word == "":
             continue
@@ -570,15 +613,6 @@ def extract_datetime_pt(text, anchorDate=None, default_time=None):
 
         # parse 5 days from tomorrow, 10 weeks from next thursday,
         # 2 months from July
-        validFollowups = days + months + monthsShort
-        validFollowups.append("hoje")
-        validFollowups.append("amanha")
-        validFollowups.append("ontem")
-        validFollowups.append("anteontem")
-        validFollowups.append("agora")
-        validFollowups.append("ja")
-        validFollowups.append("ante")
-
         # TODO debug word "depois" that one is failing for some reason
         if word in froms and wordNext in validFollowups:
 
@@ -1014,9 +1048,41 @@ def extract_datetime_pt(text, anchorDate=None, default_time=None):
     if secOffset != 0:
         extractedDate = extractedDate + relativedelta(seconds=secOffset)
 
-    resultStr = " ".join(words)
-    resultStr = ' '.join(resultStr.split())
-    return [extractedDate, resultStr]
+    return extractedDate, words, cleaned
+
+
+_DURATION_PATTERN_PT = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[s]?"
+# (timedelta argument, multiplier, unit) in matching order,
+# units without a timedelta argument are converted to days
+_DURATION_SCANNER_PT = DurationScanner(_DURATION_PATTERN_PT, [
+    # remove 's' from unit
+    (unit_en, multiplier, unit[:-1])
+    for unit_en, multiplier, unit in (
+        ('microseconds', 1, 'microsegundos'),
+        ('milliseconds', 1, 'milisegundos'),
+        ('seconds', 1, 'segundos'),
+        ('minutes', 1, 'minutos'),
+        ('hours', 1, 'horas'),
+        ('days', 1, 'dias'),
+        ('weeks', 1, 'semanas'),
+        ('days', DAYS_IN_1_MONTH, 'meses'),
+        ('days', DAYS_IN_1_YEAR, 'anos'),
+        ('days', 10 * DAYS_IN_1_YEAR, 'decadas'),
+        ('days', 100 * DAYS_IN_1_YEAR, 'seculos'),
+        ('days', 1000 * DAYS_IN_1_YEAR, 'milenios'),
+    )
+])
+# "_s_" is the placeholder extract_duration_pt swaps "segundo" with
+_DURATION_KEYWORDS_PT = frozenset(_DURATION_SCANNER_PT.unit_words + ("mês", "_s_"))
+
+
+@normalizer
+def _normalize_duration_pt(text):
+    """text as scanned by extract_duration_pt, numbers converted to digits"""
+    text = text.lower().replace("mês", "meses").replace("é", "e")
+    text = text.replace("segundo", "_s_")  # HACK - segundo (second) will be replaced with 2
+    text = numbers_to_digits_pt(text)
+    return text.replace("_s_", "segundo")  # undo HACK
 
 
 def extract_duration_pt(text):
@@ -1042,63 +1108,18 @@ def extract_duration_pt(text):
     if not text:
         return None
 
-    text = text.lower()
     time_units = {
-        'microseconds': 'microsegundos',
-        'milliseconds': 'milisegundos',
-        'seconds': 'segundos',
-        'minutes': 'minutos',
-        'hours': 'horas',
-        'days': 'dias',
-        'weeks': 'semanas'
+        'microseconds': 0,
+        'milliseconds': 0,
+        'seconds': 0,
+        'minutes': 0,
+        'hours': 0,
+        'days': 0,
+        'weeks': 0
     }
-    # NOTE: some of these english units are spelled wrong on purpose because of the loop below that strips the s
-    non_std_un = {
-        "months": "meses",
-        "years": "anos",
-        'decades': "decadas",
-        'centurys': "seculos",
-        'millenniums': "milenios"
-    }
-
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[s]?"
 
-    text = text.replace("mês", "meses").replace("é", "e")
-    text = text.replace("segundo", "_s_")  # HACK - segundo (second) will be replaced with 2
-    text = numbers_to_digits_pt(text)
-    text = text.replace("_s_", "segundo")  # undo HACK
-
-    for (unit_en, unit_pt) in time_units.items():
-        unit_pattern = pattern.format(
-            unit=unit_pt[:-1])  # remove 's' from unit
-        time_units[unit_en] = 0
-
-        def repl(match):
-            time_units[unit_en] += float(match.group(1))
-            return ''
-
-        text = re.sub(unit_pattern, repl, text)
-
-    for (unit_en, unit_pt) in non_std_un.items():
-        unit_pattern = pattern.format(
-            unit=unit_pt[:-1])  # remove 's' from unit
-
-        def repl_non_std(match):
-            val = float(match.group(1))
-            if unit_en == "months":
-                val = DAYS_IN_1_MONTH * val
-            if unit_en == "years":
-                val = DAYS_IN_1_YEAR * val
-            if unit_en == "decades":
-                val = 10 * DAYS_IN_1_YEAR * val
-            if unit_en == "centurys":
-                val = 100 * DAYS_IN_1_YEAR * val
-            if unit_en == "millenniums":
-                val = 1000 * DAYS_IN_1_YEAR * val
-            time_units["days"] += val
-            return ''
-
-        text = re.sub(unit_pattern, repl_non_std, text)
+    text = _normalize_duration_pt(text)
+    text = _DURATION_SCANNER_PT.scan(text, time_units)
 
     text = text.strip()
     duration = timedelta(**time_units) if any(time_units.values()) else None
@@ -227,6 +227,14 @@ def pronounce_hour_ru(num):
     return pronounce_number_ru(num)
 
 
+_DURATION_PATTERN_RU = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}(?:а|ов|у|ут|уту)?"
+# (timedelta argument, compiled pattern) in matching order
+_DURATION_UNITS_RU = [
+    (unit_en, re.compile(_DURATION_PATTERN_RU.format(unit=unit_ru)))
+    for unit_ru, unit_en in _TIME_UNITS_CONVERSION.items()
+]
+
+
 def extract_duration_ru(text):
     """
     Convert an english phrase into a number of seconds
@@ -269,17 +277,14 @@ def extract_duration_ru(text):
         'weeks': 0
     }
 
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}(?:а|ов|у|ут|уту)?"
     text = numbers_to_digits_ru(text)
 
-    for (unit_ru, unit_en) in _TIME_UNITS_CONVERSION.items():
-        unit_pattern = pattern.format(unit=unit_ru)
-
-        def repl(match):
-            time_units[unit_en] += float(match.group(1))
-            return ''
-
-        text = re.sub(unit_pattern, repl, text)
+    for unit_en, unit_regex in _DURATION_UNITS_RU:
+        values = unit_regex.findall(text)
+        if values:
+            for value in values:
+                time_units[unit_en] += float(value)
+            text = unit_regex.sub('', text)
 
     text = text.strip()
     duration = timedelta(**time_units) if any(time_units.values()) else None
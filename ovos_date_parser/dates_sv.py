@@ -123,6 +123,26 @@ def nice_time_sv(dt, speech=True, use_24hour=False, use_ampm=False):
         return speak
 
 
+# vocabulary of extract_datetime_sv, built once instead of on every call
+_TIME_QUALIFIERS_SV = ['morgon', 'förmiddag', 'eftermiddag', 'kväll']
+_MARKERS_SV = ['på', 'i', 'den här', 'kring', 'efter']
+_DAYS_SV = ['måndag', 'tisdag', 'onsdag', 'torsdag',
+            'fredag', 'lördag', 'söndag']
+_MONTHS_SV = ['januari', 'februari', 'mars', 'april', 'maj', 'juni',
+              'juli', 'augusti', 'september', 'oktober', 'november',
+              'december']
+_MONTHS_SHORT_SV = ['jan', 'feb', 'mar', 'apr', 'may', 'june', 'july', 'aug',
+                    'sept', 'oct', 'nov', 'dec']
+# words a date needs when it has no digits, matched as word prefixes by
+# ovos_date_parser.prefilter
+# NOTE: a marker followed by any word is parsed as today, "i" and "på" let
+#  most sentences through
+_DATETIME_KEYWORDS_SV = frozenset(
+    _TIME_QUALIFIERS_SV + _MARKERS_SV + _DAYS_SV + _MONTHS_SV + _MONTHS_SHORT_SV + [
+        "idag", "imorgon", "morgondagen", "övermorgon", "igår", "middag", "midnatt", "nu", "från",
+        "förra", "nästa", "sekund", "minut", "timm", "halvtimm", "dag", "vecka", "veckor", "månad", "år"])
+
+
 def extract_datetime_sv(text, anchorDate=None, default_time=None):
     def clean_string(s):
         """
@@ -171,15 +191,11 @@ def extract_datetime_sv(text, anchorDate=None, default_time=None):
     hasYear = False
     timeQualifier = ""
 
-    timeQualifiersList = ['morgon', 'förmiddag', 'eftermiddag', 'kväll']
-    markers = ['på', 'i', 'den här', 'kring', 'efter']
-    days = ['måndag', 'tisdag', 'onsdag', 'torsdag',
-            'fredag', 'lördag', 'söndag']
-    months = ['januari', 'februari', 'mars', 'april', 'maj', 'juni',
-              'juli', 'augusti', 'september', 'oktober', 'november',
-              'december']
-    monthsShort = ['jan', 'feb', 'mar', 'apr', 'may', 'june', 'july', 'aug',
-                   'sept', 'oct', 'nov', 'dec']
+    timeQualifiersList = _TIME_QUALIFIERS_SV
+    markers = _MARKERS_SV
+    days = _DAYS_SV
+    months = _MONTHS_SV
+    monthsShort = _MONTHS_SHORT_SV
 
     words = clean_string(text)
 
@@ -725,6 +741,19 @@ def extract_datetime_sv(text, anchorDate=None, default_time=None):
     return [extractedDate, resultStr]
 
 
+# Parser state, mapping words that should set the parser to collect
+# numbers to a specific time "size"
+_DURATION_STATE_WORDS_SV = {
+    'days': ('dygn', 'dag', 'dagar', 'dags'),
+    'hours': ('timmar', 'timme', 'timma', 'timmes', 'timmas'),
+    'minutes': ('minuter', 'minuters', 'minut', 'minuts'),
+    'seconds': ('sekunder', 'sekunders', 'sekund', 'sekunds')
+}
+# the number parser expands "kvart" and "halvtimme" to a number and a unit
+_DURATION_KEYWORDS_SV = frozenset([word for words in _DURATION_STATE_WORDS_SV.values() for word in words] +
+                                  ["kvart", "trekvart", "halvtimme", "halvtimma"])
+
+
 def extract_duration_sv(text):
     """
     Convert a swedish phrase into a number of seconds.
@@ -765,14 +794,7 @@ def extract_duration_sv(text):
         'seconds': 0
     }
 
-    # Parser state, mapping words that should set the parser to collect
-    # numbers to a specific time "size"
-    state_words = {
-        'days': ('dygn', 'dag', 'dagar', 'dags'),
-        'hours': ('timmar', 'timme', 'timma', 'timmes', 'timmas'),
-        'minutes': ('minuter', 'minuters', 'minut', 'minuts'),
-        'seconds': ('sekunder', 'sekunders', 'sekund', 'sekunds')
-    }
+    state_words = _DURATION_STATE_WORDS_SV
     binding_words = ('och')
 
     consumed = []
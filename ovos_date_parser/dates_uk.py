@@ -163,6 +163,14 @@ _STRING_NUM_UK.update({
 })
 
 
+_DURATION_PATTERN_UK = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}(?:ів|я|и|ин|і|унд|ни|ну|ку|дні|у|днів)?"
+# (timedelta argument, compiled pattern) in matching order
+_DURATION_UNITS_UK = [
+    (unit_en, re.compile(_DURATION_PATTERN_UK.format(unit=unit_uk)))
+    for unit_uk, unit_en in _TIME_UNITS_CONVERSION.items()
+]
+
+
 def extract_duration_uk(text):
     """
     Convert an english phrase into a number of seconds
@@ -205,17 +213,14 @@ def extract_duration_uk(text):
         'weeks': 0
     }
 
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}(?:ів|я|и|ин|і|унд|ни|ну|ку|дні|у|днів)?"
     text = numbers_to_digits_uk(text)
 
-    for (unit_uk, unit_en) in _TIME_UNITS_CONVERSION.items():
-        unit_pattern = pattern.format(unit=unit_uk)
-
-        def repl(match):
-            time_units[unit_en] += float(match.group(1))
-            return ''
-
-        text = re.sub(unit_pattern, repl, text)
+    for unit_en, unit_regex in _DURATION_UNITS_UK:
+        values = unit_regex.findall(text)
+        if values:
+            for value in values:
+                time_units[unit_en] += float(value)
+            text = unit_regex.sub('', text)
 
     new_text = []
     tokens_in_result_text = text.split(' ')
@@ -0,0 +1,84 @@
+"""Bulk extraction across a process pool
+
+The parsers are pure python and GIL bound, for offline reprocessing of large
+corpora :func:`parallel_extract` shards the input across worker processes.
+"""
+import os
+from collections import deque
+from datetime import datetime, time
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+from ovos_date_parser.registry import get_implementation, preload
+
+_EXTRACTORS = ("datetime", "duration")
+
+
+def _init_worker(lang: str):
+    # import the language tables once per worker, not once per task
+    preload([lang], fallback=get_implementation("extract_datetime", lang) is None)
+
+
+def _extract_chunk(extractor: str, lang: str,
+                   chunk: List[Tuple[str, Optional[datetime]]],
+                   default_time: Optional[time]) -> list:
+    from ovos_date_parser import extract_datetime, extract_duration
+    if extractor == "duration":
+        return [extract_duration(text, lang) for text, _ in chunk]
+    return [extract_datetime(text, lang, anchorDate, default_time)
+            for text, anchorDate in chunk]
+
+
+def parallel_extract(
+        texts: Iterable[Union[str, Tuple[str, Optional[datetime]]]],
+        lang: str,
+        extractor: str = "datetime",
+        anchorDate: Optional[datetime] = None,
+        default_time: Optional[time] = None,
+        chunk_size: int = 256,
+        max_workers: Optional[int] = None,
+) -> Iterator:
+    """
+    Run extract_datetime or extract_duration over many texts in parallel.
+
+    The input is consumed in chunks of `chunk_size` items, each chunk is a
+    single task for the process pool. At most two chunks per worker are in
+    flight, so memory stays bounded on large inputs.
+
+    Args:
+        texts: Strings, or (text, anchorDate) pairs to use a per item anchor.
+        lang: A BCP-47 language code.
+        extractor: "datetime" or "duration".
+        anchorDate: Anchor for items that do not carry their own.
+        default_time: Time to use if none was found in the input string.
+        chunk_size: Number of items per task.
+        max_workers: Number of worker processes, defaults to the CPU count.
+
+    Returns:
+        A generator with one result per input item, in input order.
+    """
+    if extractor not in _EXTRACTORS:
+        raise ValueError(f"extractor must be one of {_EXTRACTORS}")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    max_workers = max_workers or os.cpu_count() or 1
+    items = ((t, anchorDate) if isinstance(t, str) else (t[0], t[1] or anchorDate)
+             for t in texts)
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             initializer=_init_worker,
+                             initargs=(lang,)) as executor:
+        max_pending = max_workers * 2
+        pending = deque()
+        while True:
+            while len(pending) < max_pending:
+                chunk = list(islice(items, chunk_size))
+                if not chunk:
+                    break
+                pending.append(executor.submit(_extract_chunk, extractor,
+                                               lang, chunk, default_time))
+            if not pending:
+                break
+            yield from pending.popleft().result()
@@ -0,0 +1,135 @@
+"""Cheap checks for text that can not contain a date or a duration
+
+Most utterances a voice assistant hears have no date in them, and parsing
+is by far the most expensive part of extract_datetime and extract_duration.
+A date needs a digit, a number word or one of a few dozen keywords (weekday
+and month names, markers such as "next" or "ago", unit words). The keywords
+of a language are taken from the word lists of its ``dates_<lang>`` module
+and compiled into a single regex, text that matches none of them is
+rejected in one linear scan.
+
+The checks are conservative, they may accept text without a date but never
+reject text the parser would find one in. Languages without a keyword index
+accept everything.
+"""
+import importlib
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, Optional, Pattern, Tuple
+
+from ovos_date_parser.prepared import normalizer
+from ovos_date_parser.registry import normalize_lang
+
+# name of the keyword index in ovos_date_parser.dates_<lang> and of the
+# functions converting number words to digits, keyed by public API name
+# NOTE: every duration needs a unit word, number words do not matter
+_INDEX: Dict[str, Dict[str, Tuple[str, Tuple[str, ...]]]] = {
+    "extract_datetime": {
+        "de": ("_DATETIME_KEYWORDS_DE", ("numbers_to_digits_de", "_get_ordinal_index")),
+        "en": ("_DATETIME_KEYWORDS_EN", ("numbers_to_digits_en",)),
+        "es": ("_DATETIME_KEYWORDS_ES", ()),
+        "sv": ("_DATETIME_KEYWORDS_SV", ()),
+    },
+    "extract_duration": {
+        "de": ("_DURATION_KEYWORDS_DE", ()),
+        "en": ("_DURATION_KEYWORDS_EN", ()),
+        "es": ("_DURATION_KEYWORDS_ES", ()),
+        "pt": ("_DURATION_KEYWORDS_PT", ()),
+        "sv": ("_DURATION_KEYWORDS_SV", ()),
+    },
+}
+
+# languages whose parser returns None for rejected text, the top-level API
+# returns early for them. Other parsers return a normalized remainder (or a
+# date for any text) that can not be reproduced without parsing
+_EARLY_EXIT: Dict[str, FrozenSet[str]] = {
+    "extract_datetime": frozenset({"de", "en", "es", "sv"}),
+    "extract_duration": frozenset({"sv"}),
+}
+
+_DIGIT = re.compile(r"\d")
+_WORD = re.compile(r"[^\W\d_]+")
+
+
+def _fold(text: str) -> str:
+    # parsers strip some accents before matching, drop all of them on both
+    # sides so any spelling matches
+    return "".join(c for c in unicodedata.normalize("NFKD", text)
+                   if not unicodedata.combining(c))
+
+
+@lru_cache(maxsize=None)
+def _gate(capability: str, code: str) -> Optional[Tuple[Pattern, Tuple[Callable, ...]]]:
+    if code not in _INDEX[capability]:
+        return None
+    keywords, converters = _INDEX[capability][code]
+    module = importlib.import_module(f"ovos_date_parser.dates_{code}")
+    words = sorted({_fold(word) for word in getattr(module, keywords)}, key=len, reverse=True)
+    # keywords match at the start of a word, "days" and "nächsten" included
+    regex = re.compile(r"\d|(?<![^\W\d_])(?:" + "|".join(map(re.escape, words)) + ")",
+                       re.IGNORECASE)
+    return regex, tuple(getattr(module, name) for name in converters)
+
+
+@lru_cache(maxsize=8192)
+def _is_number_word(converter: Callable, word: str) -> bool:
+    try:
+        return _DIGIT.search(str(converter(word))) is not None
+    except Exception:
+        return True
+
+
+@normalizer
+def _check(text: str, capability: str, lang: str) -> bool:
+    gate = _gate(capability, normalize_lang(lang))
+    if gate is None:
+        return True
+    regex, converters = gate
+    if regex.search(text if text.isascii() else _fold(text)):
+        return True
+    if converters:
+        for word in _WORD.findall(text.lower()):
+            for converter in converters:
+                if _is_number_word(converter, word):
+                    return True
+    return False
+
+
+def has_datetime(text: str, lang: str) -> bool:
+    """
+    Check if text may contain a date or time, without parsing it.
+
+    extract_datetime finds nothing in text this returns False for. Always
+    True for languages without a keyword index.
+
+    Args:
+        text: The text to check.
+        lang: A BCP-47 language code.
+
+    Returns:
+        False if text can not contain a date or time.
+    """
+    return _check(text, "extract_datetime", lang)
+
+
+def has_duration(text: str, lang: str) -> bool:
+    """
+    Check if text may contain a duration, without parsing it.
+
+    extract_duration finds no duration in text this returns False for.
+    Always True for languages without a keyword index.
+
+    Args:
+        text: The text to check.
+        lang: A BCP-47 language code.
+
+    Returns:
+        False if text can not contain a duration.
+    """
+    return _check(text, "extract_duration", lang)
+
+
+def skip_extract(capability: str, text: str, code: str) -> bool:
+    """True if the language parser is known to return None for text"""
+    return code in _EARLY_EXIT[capability] and not _check(text, capability, code)
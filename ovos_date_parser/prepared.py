@@ -0,0 +1,81 @@
+"""Utterances normalized once for every extractor
+
+Each parser starts by normalizing its input, converting number words to
+digits is the expensive part. Skills often parse the same utterance more
+than once, e.g. extract_datetime with several anchors, :func:`prepare` wraps
+it in a :class:`PreparedText` that remembers every normalized form computed
+from it, later calls needing the same form reuse it. Forms are specific to
+the normalizer, extract_duration and extract_datetime each compute their own.
+
+Normalization functions opt in with the :func:`normalizer` decorator.
+"""
+from functools import wraps
+from typing import Callable
+
+
+class PreparedText(str):
+    """A str that caches the forms normalizers compute from it
+
+    Accepted anywhere a str is, results are the same as for the raw text.
+
+    Attributes:
+        lang (str): the language of the text
+    """
+
+    def __new__(cls, text: str, lang: str):
+        prepared = super().__new__(cls, text)
+        prepared.lang = lang
+        prepared._forms = {}
+        return prepared
+
+    def form(self, func: Callable, *args):
+        """func(text, *args), computed once for this text
+
+        func gets the PreparedText itself, normalizers building on other
+        normalizers share their forms.
+        """
+        key = (func, args)
+        value = self._forms.get(key, self._forms)
+        if value is self._forms:
+            value = self._forms[key] = func(self, *args)
+        return value
+
+    def __reduce__(self):
+        # forms are not sent to worker processes
+        return PreparedText, (str(self), self.lang)
+
+
+def normalizer(func: Callable) -> Callable:
+    """Decorator caching the output of func(text, *args) on PreparedText inputs
+
+    Lists are copied, parsers blank the words they consume in place.
+    """
+
+    @wraps(func)
+    def wrapper(text, *args):
+        if not isinstance(text, PreparedText):
+            return func(text, *args)
+        value = text.form(func, *args)
+        return list(value) if isinstance(value, list) else value
+
+    return wrapper
+
+
+def prepare(text: str, lang: str) -> PreparedText:
+    """
+    Prepare an utterance to be passed to several extractors.
+
+    Normalized forms are computed the first time an extractor needs them and
+    reused by the next ones, e.g. extract_datetime with another anchor, or
+    extract_datetime_span and has_datetime on the same text.
+
+    Args:
+        text: The utterance.
+        lang: A BCP-47 language code.
+
+    Returns:
+        The text, usable in place of a str.
+    """
+    if isinstance(text, PreparedText) and text.lang == lang:
+        return text
+    return PreparedText(text, lang)
@@ -0,0 +1,325 @@
+"""Language dispatch tables for the top-level API
+
+Every public function in :mod:`ovos_date_parser` looks up its per-language
+implementation here instead of walking a chain of ``lang.startswith(...)``
+checks. Language codes are normalized once per distinct ``lang`` string and
+memoized, so dispatch is a dict lookup.
+
+The ``dates_<lang>`` modules are only imported the first time a language is
+used, see :func:`preload` to pay that cost upfront instead.
+"""
+import importlib
+import os
+from functools import lru_cache
+from threading import Lock
+from types import ModuleType
+from typing import Callable, Dict, FrozenSet, Iterable, Optional, Tuple
+
+RES_DIR = os.path.join(os.path.dirname(__file__), 'res')
+
+# names of the language specific implementations in ovos_date_parser.dates_<lang>,
+# keyed by public API name
+# NOTE: extract_datetime_ru/uk name their anchor "anchor_date",
+#  callers should pass the anchor positionally
+_DISPATCH: Dict[str, Dict[str, str]] = {
+    "nice_time": {
+        "az": "nice_time_az",
+        "ca": "nice_time_ca",
+        "cs": "nice_time_cs",
+        "da": "nice_time_da",
+        "de": "nice_time_de",
+        "en": "nice_time_en",
+        "es": "nice_time_es",
+        "eu": "nice_time_eu",
+        "fa": "nice_time_fa",
+        "fr": "nice_time_fr",
+        "gl": "nice_time_gl",
+        "hu": "nice_time_hu",
+        "it": "nice_time_it",
+        "nl": "nice_time_nl",
+        "pl": "nice_time_pl",
+        "pt": "nice_time_pt",
+        "ru": "nice_time_ru",
+        "sl": "nice_time_sl",
+        "sv": "nice_time_sv",
+        "uk": "nice_time_uk",
+    },
+    "nice_relative_time": {
+        "eu": "nice_relative_time_eu",
+    },
+    "nice_duration": {
+        "az": "nice_duration_az",
+        "pl": "nice_duration_pl",
+        "ru": "nice_duration_ru",
+        "uk": "nice_duration_uk",
+    },
+    "extract_duration": {
+        "az": "extract_duration_az",
+        "ca": "extract_duration_ca",
+        "cs": "extract_duration_cs",
+        "da": "extract_duration_da",
+        "de": "extract_duration_de",
+        "en": "extract_duration_en",
+        "es": "extract_duration_es",
+        "fa": "extract_duration_fa",
+        "gl": "extract_duration_gl",
+        "nl": "extract_duration_nl",
+        "pl": "extract_duration_pl",
+        "pt": "extract_duration_pt",
+        "ru": "extract_duration_ru",
+        "sv": "extract_duration_sv",
+        "uk": "extract_duration_uk",
+    },
+    "extract_datetime": {
+        "az": "extract_datetime_az",
+        "ca": "extract_datetime_ca",
+        "cs": "extract_datetime_cs",
+        "da": "extract_datetime_da",
+        "de": "extract_datetime_de",
+        "en": "extract_datetime_en",
+        "es": "extract_datetime_es",
+        "fa": "extract_datetime_fa",
+        "fr": "extract_datetime_fr",
+        "it": "extract_datetime_it",
+        "nl": "extract_datetime_nl",
+        "pl": "extract_datetime_pl",
+        "pt": "extract_datetime_pt",
+        "ru": "extract_datetime_ru",
+        "sv": "extract_datetime_sv",
+        "uk": "extract_datetime_uk",
+    },
+    "extract_datetime_span": {
+        "de": "_extract_datetime_words_de",
+        "en": "_extract_datetime_words_en",
+        "es": "_extract_datetime_words_es",
+        "pt": "_extract_datetime_words_pt",
+    },
+    "extract_datetimes": {
+        "de": "_extract_datetime_words_de",
+        "en": "_extract_datetime_words_en",
+        "es": "_extract_datetime_words_es",
+        "pt": "_extract_datetime_words_pt",
+    },
+    "nice_date": {
+        "es": "nice_date_es",
+        "gl": "nice_date_gl",
+        "pt": "nice_date_pt",
+    },
+    "nice_date_time": {
+        "es": "nice_date_time_es",
+        "gl": "nice_date_time_gl",
+        "pt": "nice_date_time_pt",
+    },
+    "nice_day": {
+        "es": "nice_day_es",
+        "gl": "nice_day_gl",
+        "pt": "nice_day_pt",
+    },
+    "nice_weekday": {
+        "es": "nice_weekday_es",
+        "gl": "nice_weekday_gl",
+        "pt": "nice_weekday_pt",
+    },
+    "nice_month": {
+        "es": "nice_month_es",
+        "gl": "nice_month_gl",
+        "pt": "nice_month_pt",
+    },
+    "nice_year": {
+        "es": "nice_year_es",
+        "gl": "nice_year_gl",
+        "pt": "nice_year_pt",
+    },
+}
+
+# APIs with a language agnostic implementation driven by resource files,
+# available for any language that ships the corresponding file
+_RESOURCE_BACKED = {
+    "nice_duration": "date_words.json",
+    "nice_relative_time": "date_words.json",
+    "nice_date": "date_time.json",
+    "nice_date_time": "date_time.json",
+    "nice_day": "date_time.json",
+    "nice_weekday": "date_time.json",
+    "nice_month": "date_time.json",
+    "nice_year": "date_time.json",
+}
+
+CAPABILITIES = frozenset(_DISPATCH)
+
+# languages with a ovos_date_parser.dates_<lang> module
+LANG_MODULES = frozenset().union(*(impls.keys() for impls in _DISPATCH.values()))
+
+_KNOWN_LANGS = frozenset(os.listdir(RES_DIR)).union(LANG_MODULES)
+
+
+@lru_cache(maxsize=256)
+def normalize_lang(lang: str) -> str:
+    """
+    Reduce a BCP-47 language code to the primary subtag used as dispatch key.
+
+    Args:
+        lang: A BCP-47 language code, e.g. "en-US" or "pt_BR".
+
+    Returns:
+        The lowercase primary language subtag, e.g. "en".
+    """
+    return _fallback_chain(lang)[-1]
+
+
+@lru_cache(maxsize=1024)
+def _fallback_chain(lang: str) -> Tuple[str, ...]:
+    """Codes to try for a tag, most specific first, e.g. ("pt-br", "pt")
+
+    Shared by dispatch (the last code, see normalize_lang) and resource
+    lookups (closest_resource_lang).
+    """
+    subtags = lang.lower().replace("_", "-").split("-")
+    chain = ["-".join(subtags[:i]) for i in range(len(subtags), 0, -1)]
+    if subtags[0] not in _KNOWN_LANGS:
+        # keep the historical "lang.startswith(code)" matching
+        for known in _KNOWN_LANGS:
+            if subtags[0].startswith(known):
+                chain.append(known)
+                break
+    return tuple(chain)
+
+
+_RESOLVED: Dict[str, Dict[str, Callable]] = {capability: {} for capability in _DISPATCH}
+_IMPORT_LOCK = Lock()
+
+
+def _load_module(code: str) -> ModuleType:
+    # importlib already serializes imports, the lock keeps the dispatch
+    # table updates below consistent for concurrent first calls
+    with _IMPORT_LOCK:
+        module = importlib.import_module(f"ovos_date_parser.dates_{code}")
+        for capability, impls in _DISPATCH.items():
+            if code in impls:
+                _RESOLVED[capability][code] = getattr(module, impls[code])
+    return module
+
+
+def get_implementation(capability: str, lang: str) -> Optional[Callable]:
+    """
+    Get the language specific implementation of a public API.
+
+    The language module is imported on first use.
+
+    Args:
+        capability: Name of the public API, e.g. "extract_datetime".
+        lang: A BCP-47 language code.
+
+    Returns:
+        The implementing function, or None if there is no language specific
+        implementation (a generic or fallback implementation may still exist).
+    """
+    code = normalize_lang(lang)
+    impl = _RESOLVED[capability].get(code)
+    if impl is None and code in _DISPATCH[capability]:
+        _load_module(code)
+        impl = _RESOLVED[capability][code]
+    return impl
+
+
+def preload(langs: Optional[Iterable[str]] = None, fallback: bool = False):
+    """
+    Import language modules upfront instead of on first use.
+
+    Args:
+        langs: BCP-47 language codes to load, defaults to all languages.
+        fallback: Also import dateparser, used by extract_datetime for
+            languages without a native parser.
+    """
+    codes = {normalize_lang(lang) for lang in langs} if langs is not None else _KNOWN_LANGS
+    for code in codes:
+        if code in LANG_MODULES:
+            _load_module(code)
+    if fallback:
+        importlib.import_module("dateparser.search")
+
+
+@lru_cache(maxsize=None)
+def _resource_dirs(res_dir: str) -> FrozenSet[str]:
+    return frozenset(os.listdir(res_dir)) if os.path.isdir(res_dir) else frozenset()
+
+
+@lru_cache(maxsize=1024)
+def closest_resource_lang(lang: str, filename: str, res_dir: str = RES_DIR) -> Optional[str]:
+    """
+    Find the resource directory that best matches a language.
+
+    Subtags are dropped from the end until a directory ships the file, e.g.
+    "pt-BR" tries "pt-br" and then "pt", the code normalize_lang reduces the
+    tag to is tried last. Missing languages are memoized too, repeated calls
+    do not touch the filesystem.
+
+    Args:
+        lang: A BCP-47 language code.
+        filename: The resource file needed, e.g. "date_time.json".
+        res_dir: The directory holding one subdirectory per language.
+
+    Returns:
+        The name of the language directory, None if no language matches.
+    """
+    available = _resource_dirs(res_dir)
+    for code in _fallback_chain(lang):
+        if code in available and os.path.isfile(os.path.join(res_dir, code, filename)):
+            return code
+    return None
+
+
+@lru_cache(maxsize=64)
+def _capabilities(code: str) -> FrozenSet[str]:
+    caps = set()
+    for capability, impls in _DISPATCH.items():
+        if code in impls:
+            caps.add(capability)
+        elif capability in _RESOURCE_BACKED and \
+                closest_resource_lang(code, _RESOURCE_BACKED[capability]) is not None:
+            caps.add(capability)
+    return frozenset(caps)
+
+
+def get_capabilities(lang: str) -> FrozenSet[str]:
+    """
+    List the public APIs supported for a language.
+
+    NOTE: extract_datetime is only reported for languages with a native
+    parser, other languages may still be handled by the dateparser fallback
+
+    Args:
+        lang: A BCP-47 language code.
+
+    Returns:
+        The names of the supported public APIs.
+    """
+    return _capabilities(normalize_lang(lang))
+
+
+def is_supported(capability: str, lang: str) -> bool:
+    """
+    Check if a public API is supported for a language without calling it.
+
+    Args:
+        capability: Name of the public API, e.g. "nice_time".
+        lang: A BCP-47 language code.
+
+    Returns:
+        True if the language supports the API.
+    """
+    return capability in get_capabilities(lang)
+
+
+def get_supported_langs(capability: str) -> FrozenSet[str]:
+    """
+    List the languages that support a public API.
+
+    Args:
+        capability: Name of the public API, e.g. "extract_duration".
+
+    Returns:
+        The language codes supporting the API.
+    """
+    return frozenset(lang for lang in _KNOWN_LANGS
+                     if capability in _capabilities(lang))
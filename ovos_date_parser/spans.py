@@ -0,0 +1,567 @@
+"""Dates and durations with their position in the original text
+
+The parsers consume normalized words (lowercased, numbers converted to
+digits, noise words dropped) and build the remainder string from the words
+that are left. :func:`extract_datetime_span` maps the consumed words back
+to character offsets in the original text, aligning the normalized words
+with the original tokens, and only assembles the remainder if it is asked
+for. Offsets are not tracked through the normalizers, the alignment is an
+extra pass on top of the parse.
+
+:func:`extract_datetimes` uses the same mapping to find every date and
+duration of a document.
+"""
+import importlib
+import re
+from collections import defaultdict, namedtuple
+from datetime import datetime, time, timedelta
+from itertools import repeat
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Tuple, Union
+
+from ovos_utils.time import now_local
+
+from ovos_date_parser.prefilter import _fold, has_duration, skip_extract
+from ovos_date_parser.prepared import normalizer
+from ovos_date_parser.registry import get_implementation, normalize_lang
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+# words without their surrounding punctuation, "tomorrow," -> "tomorrow"
+_TOKEN = re.compile(r"\w(?:\S*\w)?")
+# parts of a sentence not split by quebra_frases, "great! see you at 5"
+_CLAUSE = re.compile(r"(?:[^!;]|[!;]+(?!\s))+[!;]*")
+_PUNCTUATION = ".!?;:,"
+_TRAILING_PUNCTUATION = re.compile(r"[\s.!?;:,]+$")
+_LEADING_PUNCTUATION = re.compile(r"[.!?;:,]*")
+# a day written as an ordinal, "am 3. März"
+_ORDINAL_END = re.compile(r"(?:^|\s)\d{1,2}\.$")
+
+# normalizer and scanner of a language, the word joining units ("2 hours and
+# 30 minutes"), the words before a time of day written as a duration ("at 8
+# hours"), the words leading into a duration ("for 2 hours") and the ones
+# making it a date relative to now ("in 2 hours"), accents dropped
+_DurationRules = namedtuple("_DurationRules", ("normalize", "scanner", "joiner", "clock", "lead", "relative"))
+_DURATIONS = {
+    "de": _DurationRules("_normalize_duration_de", "_DURATION_SCANNER_DE", "und",
+                         ("um",), ("fur", "wahrend"), ("in", "nach")),
+    "en": _DurationRules("_normalize_duration_en", "_DURATION_SCANNER_EN", "and",
+                         ("at",), ("for", "during"), ("in", "within", "after")),
+    # the es parser fails on "a las 8:30", its clock times stay durations
+    "es": _DurationRules("_normalize_duration_es", "_DURATION_SCANNER_ES", "y",
+                         (), ("por", "durante", "de"), ("en", "dentro")),
+    "pt": _DurationRules("_normalize_duration_pt", "_DURATION_SCANNER_PT", "e",
+                         ("as",), ("por", "durante", "de"), ("em", "daqui", "a", "dentro")),
+}
+
+
+class _Match:
+    """Base class of DateTimeMatch and DurationMatch"""
+    __slots__ = ("value", "text", "start", "end")
+
+    def __init__(self, value, text: str, start: int, end: int):
+        self.value = value
+        self.text = text
+        self.start = start
+        self.end = end
+
+    @property
+    def span(self) -> Tuple[int, int]:
+        return self.start, self.end
+
+    @property
+    def surface(self) -> str:
+        """The date as written in the text"""
+        return self.text[self.start:self.end]
+
+    def __repr__(self):
+        return f"<{type(self).__name__} value={self.value!r} span={self.span} surface={self.surface!r}>"
+
+
+class DateTimeMatch(_Match):
+    """A date found in a text and where it was found
+
+    Offsets follow the ``re.Match`` conventions, ``text[start:end]`` is the
+    surface form of the date. When the date words are not adjacent, e.g.
+    "tomorrow I am free at 5", the span covers everything in between.
+
+    Attributes:
+        value (datetime): the extracted date
+        text (str): the text the date was found in
+        start (int): offset of the first character of the date
+        end (int): offset past the last character of the date
+    """
+    __slots__ = ("_words", "_remainder")
+
+    def __init__(self, value: datetime, text: str, start: int, end: int, words: List[str]):
+        super().__init__(value, text, start, end)
+        # normalized words with the consumed ones blanked
+        self._words = words
+        self._remainder = None
+
+    @property
+    def remainder(self) -> str:
+        """The normalized text that was not consumed, as returned by extract_datetime"""
+        if self._remainder is None:
+            self._remainder = " ".join(" ".join(self._words).split())
+            self._words = None
+        return self._remainder
+
+
+class DurationMatch(_Match):
+    """A duration found in a text and where it was found
+
+    Attributes:
+        value (timedelta): the extracted duration
+        text (str): the text the duration was found in
+        start (int): offset of the first character of the duration
+        end (int): offset past the last character of the duration
+    """
+    __slots__ = ()
+
+
+def _ascii(word: str) -> str:
+    return word if word.isascii() else _fold(word)
+
+
+@normalizer
+def _tokens(text: str) -> List[Tuple[int, int, str]]:
+    # some parsers strip accents, "miércoles" -> "miercoles"
+    return [(m.start(), m.end(), _ascii(m.group().lower())) for m in _TOKEN.finditer(text)]
+
+
+def _is_part(word: str, token: str) -> bool:
+    # the token starts with the word ("tuesday's"), or the word is a piece of
+    # it that does not start mid-word ("4:30pm", not "meeting")
+    if not word:
+        return False
+    pos = token.find(word)
+    while pos != -1:
+        if pos == 0 or not token[pos - 1].isalpha() or word[0].isdigit():
+            return True
+        pos = token.find(word, pos + 1)
+    return False
+
+
+def _align(text: str, words: List[str],
+           needed: Optional[Iterable[int]] = None) -> List[Optional[Tuple[int, int]]]:
+    """Character offsets in text of the normalized words, None if a word has no surface form
+
+    Words are aligned in order to the tokens they start or are part of,
+    maximizing the number of aligned words. Words that changed during
+    normalization ("twenty five" -> "25") take the tokens between their
+    aligned neighbours.
+
+    Only the offsets of the words at the indexes in needed are computed,
+    the others are None. The alignment of the words in between the
+    unchanged head and tail of the text is skipped when none of them is
+    needed.
+    """
+    tokens = _tokens(text)
+    # normalized words keep their punctuation, tokens do not, "años." -> "años"
+    words = [_ascii(word).strip(_PUNCTUATION) for word in words]
+    n, m = len(words), len(tokens)
+    aligned: List[Optional[int]] = [None] * n
+
+    # most words are unchanged, align the common head and tail one to one
+    lo = 0
+    while lo < n and lo < m and _is_part(words[lo], tokens[lo][2]):
+        aligned[lo] = lo
+        lo += 1
+    hi, hi_token = n, m
+    while hi > lo and hi_token > lo and _is_part(words[hi - 1], tokens[hi_token - 1][2]):
+        hi, hi_token = hi - 1, hi_token - 1
+        aligned[hi] = hi_token
+
+    needed = range(n) if needed is None else needed
+    if any(lo <= i < hi for i in needed):
+        _align_middle(words, tokens, aligned, lo, hi, hi_token)
+
+    spans: List[Optional[Tuple[int, int]]] = [None] * n
+    for i in needed:
+        j = aligned[i]
+        if j is not None:
+            spans[i] = tokens[j][:2]
+            continue
+        # tokens between the previous and the next aligned word
+        first = next((aligned[k] for k in range(i - 1, -1, -1) if aligned[k] is not None), -1) + 1
+        last = next((aligned[k] for k in range(i + 1, n) if aligned[k] is not None), m) - 1
+        if first <= last:
+            spans[i] = (tokens[first][0], tokens[last][1])
+    return spans
+
+
+def _align_middle(words: List[str], tokens: List[Tuple[int, int, str]], aligned: List[Optional[int]],
+                  lo: int, hi: int, hi_token: int):
+    """Align words[lo:hi] to tokens[lo:hi_token] in place, maximizing the aligned words"""
+    # tokens every word in between can be aligned to
+    matches = [frozenset(j for j in range(lo, hi_token) if _is_part(words[i], tokens[j][2]))
+               for i in range(lo, hi)]
+    # best[i][j]: most words of words[lo + i:hi] that align to tokens[lo + j:hi_token]
+    rows, cols = hi - lo, hi_token - lo
+    best = [[0] * (cols + 1) for _ in range(rows + 1)]
+    for i in range(rows - 1, -1, -1):
+        row, below, match = best[i], best[i + 1], matches[i]
+        for j in range(cols - 1, -1, -1):
+            if lo + j in match:
+                # several words can come from one token, "4:30pm" -> "4:30" "pm"
+                row[j] = 1 + max(below[j + 1], below[j])
+            else:
+                row[j] = max(below[j], row[j + 1])
+    i = j = 0
+    while i < rows and j < cols:
+        if lo + j in matches[i]:
+            aligned[lo + i] = lo + j
+            if best[i][j] == 1 + best[i + 1][j + 1]:
+                j += 1
+            i += 1
+        elif best[i][j] == best[i + 1][j]:
+            i += 1
+        else:
+            j += 1
+
+
+def extract_datetime_span(
+        text: str,
+        lang: str,
+        anchorDate: Optional[datetime] = None,
+        default_time: Optional[time] = None,
+) -> Optional[DateTimeMatch]:
+    """
+    Extract a date and time from a sentence, with its position in the sentence.
+
+    Same results as extract_datetime, the remainder is only built when
+    DateTimeMatch.remainder is read. Results are not cached.
+
+    Args:
+        text: The text to be interpreted, can be a PreparedText.
+        lang: The BCP-47 code for the language to use.
+        anchorDate: Date to use for relative dating.
+        default_time: Time to use if none was found in the input string.
+
+    Returns:
+        A DateTimeMatch, or None if no date or time related text is found.
+    """
+    impl = get_implementation("extract_datetime_span", lang)
+    if impl is None:
+        raise NotImplementedError(f"Unsupported language: {lang}")
+    if skip_extract("extract_datetime", text, normalize_lang(lang)):
+        return None
+    result = impl(text, anchorDate, default_time)
+    if result is None:
+        return None
+    value, words, cleaned = result
+    start, end = _consumed(text, words, cleaned) or (0, 0)
+    return DateTimeMatch(value, text, start, end, words)
+
+
+def _consumed_runs(text: str, words: List[str], cleaned: List[str],
+                   joiner: Optional[str] = None) -> List[Tuple[int, int]]:
+    """Offsets in text of the runs of words blanked by the parser
+
+    Consumed words only apart by dropped words are one run. Without a
+    joiner every consumed word is in one run, otherwise a new run starts
+    after a joiner that was left in the text ("tomorrow and dad on friday").
+    """
+    consumed = [i for i, (before, after) in enumerate(zip(cleaned, words)) if before and not after]
+    spans = _align(text, cleaned, consumed)
+    runs: List[List[int]] = []
+    split = False
+    for i, (before, after) in enumerate(zip(cleaned, words)):
+        if after and after == joiner:
+            split = bool(runs)
+        elif before and not after and spans[i] is not None:
+            start, end = spans[i]
+            if runs and not split:
+                runs[-1][0], runs[-1][1] = min(runs[-1][0], start), max(runs[-1][1], end)
+            else:
+                runs.append([start, end])
+            split = False
+    return [(start, end) for start, end in runs]
+
+
+def _consumed(text: str, words: List[str], cleaned: List[str]) -> Optional[Tuple[int, int]]:
+    """Offsets in text of the words blanked by the parser, None if there are none"""
+    runs = _consumed_runs(text, words, cleaned)
+    if not runs:
+        return None
+    return runs[0][0], runs[-1][1]
+
+
+def _first_datetime(impl, text: str, anchorDate: datetime, default_time: Optional[time],
+                    joiner: str) -> Optional[tuple]:
+    """(value, words, start, end) of the first date of text, None if there is none"""
+    result = impl(text, anchorDate, default_time)
+    if result is None:
+        return None
+    value, words, cleaned = result
+    runs = _consumed_runs(text, words, cleaned, joiner)
+    if not runs:
+        # a date made up from no words, e.g. the anchor date
+        return None
+    if len(runs) > 1:
+        # the parser merged the dates of two clauses, keep the one before the joiner
+        between = re.search(rf"(?i)\b{re.escape(joiner)}\b", text[runs[0][1]:runs[1][0]])
+        end = runs[0][1] + between.start() if between else runs[1][0]
+        first = _first_datetime(impl, text[:end], anchorDate, default_time, joiner)
+        if first is not None:
+            return first
+    return value, words, runs[0][0], runs[-1][1]
+
+
+def _rewrite(sentence: str, start: int, end: int, clocks: List[tuple]) -> Tuple[str, List[int], List[int]]:
+    """sentence[start:end] with its clock times written as H:MM
+
+    Returns the text, and the sentence offsets every character of the text
+    starts and ends at.
+    """
+    pieces, starts, ends = [], [], []
+    pos = start
+    for _, value, clock_start, clock_end, _ in clocks:
+        if start <= clock_start and clock_end <= end:
+            pieces.append(sentence[pos:clock_start])
+            starts.extend(range(pos, clock_start))
+            ends.extend(range(pos + 1, clock_start + 1))
+            clock = f"{value.seconds // 3600}:{value.seconds // 60 % 60:02d}"
+            pieces.append(clock)
+            starts.extend(repeat(clock_start, len(clock)))
+            ends.extend(repeat(clock_end, len(clock)))
+            pos = clock_end
+    pieces.append(sentence[pos:end])
+    starts.extend(range(pos, end))
+    ends.extend(range(pos + 1, end + 1))
+    return "".join(pieces), starts, ends
+
+
+def _lead(sentence: str, start: int, end: int, rules: _DurationRules) -> Tuple[int, bool]:
+    """Where the words leading into a duration at the end of sentence[start:end] start
+
+    Returns the offset, and whether the words make the duration a date
+    relative to now.
+    """
+    words = list(re.finditer(r"\S+", sentence[start:end]))
+    relative = False
+    while words and _ascii(words[-1].group().lower()) in rules.lead + rules.relative:
+        relative = relative or _ascii(words[-1].group().lower()) in rules.relative
+        end = start + words.pop().start()
+    return end, relative
+
+
+def _datetimes(sentence: str, code: str, anchorDate: datetime, default_time: Optional[time],
+               durations: List[tuple], clocks: List[tuple]) -> Iterator[tuple]:
+    impl = get_implementation("extract_datetimes", code)
+    rules = _DURATIONS[code]
+    # the parsers add a duration to the date next to it ("tomorrow at 5 pm for
+    # 2 hours"), dates are only looked for in between the durations
+    bounds = [0] + [pos for _, _, start, end, _ in durations for pos in (start, end)] + [len(sentence)]
+    for segment_start, segment_end in zip(bounds[::2], bounds[1::2]):
+        segment_end, _ = _lead(sentence, segment_start, segment_end, rules)
+        text, starts, ends = _rewrite(sentence, segment_start, segment_end, clocks)
+        # parse the rest of the segment after each date until nothing is left,
+        # every pass runs the whole parser again, number normalization included
+        rest = 0
+        while rest < len(text):
+            chunk = text[rest:]
+            if not chunk.strip() or skip_extract("extract_datetime", chunk, code):
+                break
+            found = _first_datetime(impl, chunk, anchorDate, default_time, rules.joiner)
+            if found is None:
+                break
+            value, words, start, end = found
+            yield DateTimeMatch, value, starts[rest + start], ends[rest + end - 1], words
+            rest += end
+
+
+def _durations(sentence: str, code: str) -> Iterator[tuple]:
+    if not has_duration(sentence, code):
+        return
+    module = importlib.import_module(f"ovos_date_parser.dates_{code}")
+    rules = _DURATIONS[code]
+    scanner = getattr(module, rules.scanner)
+    normalized = getattr(module, rules.normalize)(sentence)
+    hits = [match.span() for match in scanner.regex.finditer(normalized)]
+    if not hits:
+        return
+    # units only apart by spaces, commas or the joiner are one duration
+    groups = [list(hits[0])]
+    for start, end in hits[1:]:
+        if normalized[groups[-1][1]:start].replace(",", " ").split() in ([], [rules.joiner]):
+            groups[-1][1] = end
+        else:
+            groups.append([start, end])
+
+    words = [(m.start(), m.end()) for m in re.finditer(r"\S+", normalized)]
+    inside = [[i for i, (s, e) in enumerate(words) if s < end and e > start] for start, end in groups]
+    spans = _align(sentence, normalized.split(), [i for group in inside for i in group])
+    for (start, end), indexes in zip(groups, inside):
+        time_units = defaultdict(float)
+        scanner.scan(normalized[start:end], time_units)
+        found = [spans[i] for i in indexes if spans[i] is not None]
+        if found:
+            yield (DurationMatch, timedelta(**time_units),
+                   min(s for s, _ in found), max(e for _, e in found), None)
+
+
+def _is_clock(sentence: str, duration: tuple, code: str) -> bool:
+    """Whether a duration is a time of day, "às 8 horas e 30 minutos" """
+    _, value, start, _, _ = duration
+    before = sentence[:start].split()[-1:]
+    return (value.days == 0 and value.seconds % 60 == 0 and value.microseconds == 0
+            and bool(before) and _ascii(before[0].lower()) in _DURATIONS[code].clock)
+
+
+def _classified(sentence: str, code: str) -> Iterator[Tuple[str, tuple, int]]:
+    """(kind, duration, start of its leading words) of the durations of a sentence
+
+    kind is "clock" for a time of day written as a duration, "relative"
+    for a date relative to now ("in 2 days") and "duration" otherwise.
+    """
+    rules = _DURATIONS[code]
+    pos = 0
+    for duration in _durations(sentence, code):
+        lead, relative = _lead(sentence, pos, duration[2], rules)
+        if _is_clock(sentence, duration, code):
+            yield "clock", duration, lead
+        else:
+            yield "relative" if relative else "duration", duration, lead
+        pos = duration[3]
+
+
+def _without_durations(sentence: str, code: str) -> Tuple[str, Optional[timedelta]]:
+    """The sentence without the durations that are not relative to now
+
+    The parsers add a duration to the date next to it, "for 20 minutes
+    tomorrow at 7" is not tomorrow at 7:20. Returns the sentence with those
+    durations and the words leading into them cut out, and their sum, None
+    if there are none. Durations such as "in 2 days" are part of the date
+    and left in.
+    """
+    pieces, total, pos = [], None, 0
+    for kind, duration, lead in _classified(sentence, code):
+        if kind != "duration":
+            continue
+        _, value, _, end, _ = duration
+        pieces.append(sentence[pos:lead])
+        total = value if total is None else total + value
+        # punctuation right after the duration would be left on its own
+        pos = _LEADING_PUNCTUATION.match(sentence, end).end()
+    pieces.append(sentence[pos:])
+    return " ".join(" ".join(pieces).split()), total
+
+
+def _extract_sentence(sentence: str, code: str, anchorDate: datetime,
+                      default_time: Optional[time]) -> List[tuple]:
+    """(match class, value, start, end, words) of everything found in a sentence
+
+    Plain tuples with offsets in the sentence, cheap to send back from a
+    worker process.
+    """
+    kinds = {"clock": [], "relative": [], "duration": []}
+    for kind, duration, _ in _classified(sentence, code):
+        kinds[kind].append(duration)
+    # relative durations are parsed as part of their date
+    found = list(_datetimes(sentence, code, anchorDate, default_time, kinds["duration"], kinds["clock"]))
+    # unless the parser did not read them
+    found.extend(duration for duration in kinds["relative"]
+                 if not any(match[2] < duration[3] and duration[2] < match[3] for match in found))
+    found.extend(kinds["duration"])
+    found.sort(key=lambda match: match[2:4])
+    return found
+
+
+def _continues_ordinal(before: str, after: str, months: Tuple[str, ...]) -> bool:
+    """Whether quebra_frases split a sentence after an ordinal, "am 3." "März 2020" """
+    if not _ORDINAL_END.search(before) or not after:
+        return False
+    word = _fold(after.split()[0].lower()).strip(".,")
+    return after[0].islower() or (len(word) >= 3 and any(month.startswith(word) for month in months))
+
+
+def _sentences(text: str, code: str) -> Iterator[Tuple[int, int]]:
+    """Offsets of the sentences of text, without their final punctuation"""
+    # quebra_frases pulls in the regex module, only paid for by callers of extract_datetimes
+    from quebra_frases import paragraph_tokenize, sentence_tokenize
+
+    months = tuple(_fold(month) for month in
+                   getattr(importlib.import_module(f"ovos_date_parser.dates_{code}"), f"_MONTHS_{code.upper()}"))
+    # paragraph_tokenize fails on leading blank lines
+    pos = len(text) - len(text.lstrip())
+    for paragraph in paragraph_tokenize(text[pos:]):
+        sentences = []
+        for sentence in sentence_tokenize(paragraph):
+            # the tokenizers drop the whitespace between sentences
+            start = text.find(sentence, pos)
+            pos = start + len(sentence)
+            if sentences and _continues_ordinal(text[sentences[-1][0]:sentences[-1][1]], sentence, months):
+                sentences[-1][1] = pos
+            else:
+                sentences.append([start, pos])
+        for offset, end in sentences:
+            for clause in _CLAUSE.finditer(text, offset, end):
+                # parsers do not strip punctuation from words, "noon." is not "noon"
+                stripped = _TRAILING_PUNCTUATION.sub("", clause.group())
+                start = clause.start() + len(stripped) - len(stripped.lstrip())
+                if start < clause.start() + len(stripped):
+                    yield start, clause.start() + len(stripped)
+
+
+def extract_datetimes(
+        text: str,
+        lang: str,
+        anchorDate: Optional[datetime] = None,
+        default_time: Optional[time] = None,
+        executor: Optional["Executor"] = None,
+        chunk_size: int = 32,
+) -> Iterator[Union[DateTimeMatch, DurationMatch]]:
+    """
+    Extract every date, time and duration of a document.
+
+    The text is split into sentences with quebra_frases and every sentence
+    is processed on its own, so the cost grows linearly with the length of
+    the text. A sentence is normalized once for durations. Dates are found
+    with the extract, take the remainder, extract again loop: the text in
+    between the durations is parsed with extract_datetime again after each
+    date found in it, so a sentence with n dates is normalized and parsed n
+    times, the cost grows quadratically with the number of dates of one
+    sentence.
+
+    Matches never overlap: a date relative to now, as in "in 2 days at 5
+    pm", is one DateTimeMatch including its duration, a time of day written
+    as a duration, as in "at 8 hours and 30 minutes", is a DateTimeMatch
+    and other durations, as in "for 2 hours", are DurationMatch objects
+    next to the date. Dates of two clauses joined by "and" are yielded
+    apart.
+
+    Matches are yielded in the order they appear in the text, the remainder
+    of a DateTimeMatch is the part of the text between durations after the
+    previous date.
+
+    Args:
+        text: The text to be interpreted.
+        lang: The BCP-47 code for the language to use.
+        anchorDate: Date to use for relative dating, shared by all matches.
+        default_time: Time to use if none was found for a date.
+        executor: Optional thread or process pool to process the sentences
+            in, results are still yielded in text order.
+        chunk_size: Number of sentences per process pool task.
+
+    Yields:
+        DateTimeMatch and DurationMatch objects.
+    """
+    if get_implementation("extract_datetimes", lang) is None:
+        raise NotImplementedError(f"Unsupported language: {lang}")
+    code = normalize_lang(lang)
+    anchorDate = anchorDate or now_local()
+    offsets = list(_sentences(text, code))
+    sentences = [text[start:end] for start, end in offsets]
+    args = (sentences, repeat(code), repeat(anchorDate), repeat(default_time))
+    if executor is None:
+        results = map(_extract_sentence, *args)
+    else:
+        results = executor.map(_extract_sentence, *args, chunksize=chunk_size)
+    for (offset, _), found in zip(offsets, results):
+        for cls, value, start, end, words in found:
+            if cls is DurationMatch:
+                yield DurationMatch(value, text, offset + start, offset + end)
+            else:
+                yield DateTimeMatch(value, text, offset + start, offset + end, words)
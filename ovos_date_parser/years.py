@@ -0,0 +1,111 @@
+"""Prebuilt nice_year tables
+
+    python -m ovos_date_parser.years
+
+Renders nice_year for the years 1 to 2200, with and without BC, for every
+language supporting it and stores the results as ``years.json`` next to the
+language resource files. This is an optional build step, the tables are not
+part of the repository.
+
+nice_year loads the table of a language the first time the language is
+used and returns the stored string for years in its range. Other years,
+and languages without a table, go through the formatters as before.
+"""
+import argparse
+import json
+import os
+import sys
+from collections import namedtuple
+from datetime import datetime
+from functools import lru_cache
+from typing import Iterable, List, Optional
+
+from ovos_date_parser.registry import RES_DIR, get_supported_langs, normalize_lang
+
+YEARS = range(1, 2201)
+TABLES_DIR = RES_DIR
+TABLE_FILE = "years.json"
+
+# the stored strings of one language, indexed by year - years.start
+_YearTable = namedtuple("_YearTable", ("years", "ad", "bc"))
+
+
+@lru_cache(maxsize=None)
+def _load_table(code: str) -> Optional[_YearTable]:
+    path = os.path.join(TABLES_DIR, code, TABLE_FILE)
+    if not os.path.isfile(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        table = json.load(f)
+    return _YearTable(range(table["start"], table["start"] + len(table["ad"])),
+                      tuple(table["ad"]), tuple(table["bc"]))
+
+
+def _stored_year(year: int, lang: str, bc: bool = False) -> Optional[str]:
+    """The prebuilt nice_year string, None if the year is not in a table"""
+    table = _load_table(normalize_lang(lang))
+    if table is None or year not in table.years:
+        return None
+    return (table.bc if bc else table.ad)[year - table.years.start]
+
+
+def _render(lang: str, year: int, bc: bool) -> Optional[str]:
+    from ovos_date_parser import _format_year
+    try:
+        return _format_year(datetime(year, 1, 1), lang, bc)
+    except Exception:
+        # kept out of the table, nice_year raises the same error at runtime
+        return None
+
+
+def build_year_tables(langs: Optional[Iterable[str]] = None, years: range = YEARS,
+                      directory: Optional[str] = None) -> List[str]:
+    """
+    Render and store the nice_year tables.
+
+    Args:
+        langs: BCP-47 language codes, defaults to every language supporting
+            nice_year.
+        years: The consecutive years to store.
+        directory: Where to write the tables, one subdirectory per language,
+            defaults to the package resources.
+
+    Returns:
+        The paths of the written tables.
+    """
+    if years.step != 1:
+        raise ValueError("years must be a range of consecutive years")
+    directory = directory or TABLES_DIR
+    codes = sorted({normalize_lang(lang) for lang in langs}) if langs is not None \
+        else sorted(get_supported_langs("nice_year"))
+    paths = []
+    for code in codes:
+        table = {"start": years.start,
+                 "ad": [_render(code, year, False) for year in years],
+                 "bc": [_render(code, year, True) for year in years]}
+        os.makedirs(os.path.join(directory, code), exist_ok=True)
+        path = os.path.join(directory, code, TABLE_FILE)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(table, f, ensure_ascii=False)
+        paths.append(path)
+    _load_table.cache_clear()
+    return paths
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(prog="python -m ovos_date_parser.years",
+                                     description=__doc__.split("\n")[0])
+    parser.add_argument("--lang", action="append", dest="langs",
+                        help="language to build, can be repeated (default: all)")
+    parser.add_argument("--first", type=int, default=YEARS.start,
+                        help=f"first year of the tables (default: {YEARS.start})")
+    parser.add_argument("--last", type=int, default=YEARS.stop - 1,
+                        help=f"last year of the tables (default: {YEARS.stop - 1})")
+    parser.add_argument("--output", "-o", help="directory to write to (default: the package resources)")
+    args = parser.parse_args(argv)
+    for path in build_year_tables(args.langs, range(args.first, args.last + 1), args.output):
+        print(path, file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
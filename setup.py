@@ -61,6 +61,7 @@ setup(
     package_data={'': extra_files},
     include_package_data=True,
     install_requires=required('requirements.txt'),
+    extras_require={'numpy': ['numpy']},
     author='Mycroft AI / OVOS',
     author_email='jarbasai@mailfence.com',
     description='OpenVoiceOS\'s multilingual text parsing and formatting library',
@@ -0,0 +1,44 @@
+"""Per call cost of extract_duration for every language with a native extractor
+
+    python test/benchmarks/bench_extract_duration.py
+"""
+import timeit
+
+from ovos_date_parser import extract_duration
+from ovos_date_parser.registry import get_supported_langs, preload
+
+N = 2000
+
+# one utterance per language, mixing a few units so every unit table is walked
+SAMPLES = {
+    "az": "3 gün 8 saat 10 dəqiqə 49 saniyə",
+    "ca": "3 dies 8 hores 10 minuts i 49 segons",
+    "cs": "3 dny 8 hodin 10 minut a 49 sekund",
+    "da": "3 dage 8 timer 10 minutter og 49 sekunder",
+    "de": "3 tage 8 stunden 10 minuten und 49 sekunden",
+    "en": "3 days 8 hours 10 minutes and 49 seconds",
+    "es": "3 días 8 horas 10 minutos y 49 segundos",
+    "fa": "سه روز و هشت ساعت و ده دقیقه و چهل و نه ثانیه",
+    "gl": "3 días 8 horas 10 minutos e 49 segundos",
+    "nl": "3 dagen 8 uur 10 minuten en 49 seconden",
+    "pl": "3 dni 8 godzin 10 minut i 49 sekund",
+    "pt": "3 dias 8 horas 10 minutos e 49 segundos",
+    "ru": "3 дня 8 часов 10 минут и 49 секунд",
+    "sv": "3 dagar 8 timmar 10 minuter och 49 sekunder",
+    "uk": "3 дні 8 годин 10 хвилин і 49 секунд",
+}
+
+
+def _report(name, stmt, number=N):
+    t = timeit.timeit(stmt, number=number)
+    print(f"{name:<45} {t / number * 1e6:8.2f} us/call")
+
+
+if __name__ == "__main__":
+    langs = sorted(get_supported_langs("extract_duration"))
+    missing = set(langs) - set(SAMPLES)
+    assert not missing, f"no benchmark sample for {missing}"
+    preload(langs)
+    for lang in langs:
+        text = SAMPLES[lang]
+        _report(f"extract_duration ({lang})", lambda: extract_duration(text, lang))
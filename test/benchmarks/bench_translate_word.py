@@ -0,0 +1,33 @@
+"""Per call cost of the date_words.json lookups used by the generic formatters
+
+    python test/benchmarks/bench_translate_word.py
+"""
+import timeit
+
+from ovos_date_parser.common import (
+    _translate_word, invalidate_date_words, nice_duration_generic, nice_relative_time_generic
+)
+from datetime import datetime, timedelta
+
+N = 20000
+
+
+def _uncached(keyword, lang):
+    # the behaviour before the cache, read the file on every lookup
+    invalidate_date_words(lang)
+    return _translate_word(keyword, lang)
+
+
+def _report(name, stmt, number=N):
+    t = timeit.timeit(stmt, number=number)
+    print(f"{name:<45} {t / number * 1e6:8.2f} us/call")
+
+
+if __name__ == "__main__":
+    now = datetime(2024, 1, 1)
+    _report("_translate_word (disk + json.load)", lambda: _uncached("minutes", "en"))
+    _report("_translate_word (cached)", lambda: _translate_word("minutes", "en"))
+    _report("nice_duration_generic (cached)",
+            lambda: nice_duration_generic("en", 93784), number=N // 10)
+    _report("nice_relative_time_generic (cached)",
+            lambda: nice_relative_time_generic("en", now + timedelta(hours=5), now), number=N // 10)
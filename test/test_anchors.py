@@ -0,0 +1,48 @@
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+
+from ovos_date_parser import extract_datetime, extract_datetime_many
+from ovos_date_parser.registry import _RESOLVED, get_implementation
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestExtractDatetimeMany(unittest.TestCase):
+    anchors = [datetime(2024, 3, 14, 13, 37) + timedelta(days=d * 17, hours=d * 5, minutes=d * 7, microseconds=d)
+               for d in range(40)]
+
+    def assertSameResults(self, text, lang):
+        self.assertEqual(extract_datetime_many(text, lang, self.anchors),
+                         [extract_datetime(text, lang, anchor) for anchor in self.anchors])
+
+    def test_same_results(self):
+        for text in ("in 5 minutes", "tomorrow at 9", "next monday morning", "march 3rd", "hello"):
+            self.assertSameResults(text, "en-us")
+        self.assertSameResults("amanhã às 9", "pt-pt")
+        self.assertSameResults("demain à 8 heures", "fr-fr")
+
+    def test_parsed_once_per_hour(self):
+        impl = Mock(wraps=get_implementation("extract_datetime", "en"))
+        anchors = [datetime(2024, 3, 14, 13, 37) + timedelta(days=d) for d in range(100)]
+        with patch.dict(_RESOLVED["extract_datetime"], {"en": impl}):
+            results = extract_datetime_many("in 5 minutes", "en", anchors)
+        self.assertEqual([result[0] for result in results], [anchor + timedelta(minutes=5) for anchor in anchors])
+        # once, and once more to check the offset does not depend on the anchor
+        self.assertEqual(impl.call_count, 2)
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_datetime64(self):
+        anchors = np.array(self.anchors + [None], dtype="datetime64[us]")
+        for text in ("in 5 minutes", "next monday morning", "hello"):
+            expected = [extract_datetime(text, "en", anchor) for anchor in self.anchors]
+            expected = np.array([result[0] if result else None for result in expected] + [None],
+                                dtype="datetime64[us]")
+            np.testing.assert_array_equal(extract_datetime_many(text, "en", anchors), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,30 @@
+import unittest
+from datetime import datetime, time
+from types import GeneratorType
+
+from ovos_date_parser import extract_datetime, extract_datetime_batch
+
+
+class TestExtractDatetimeBatch(unittest.TestCase):
+    anchor = datetime(2024, 3, 14, 13, 37)
+
+    def test_matches_single_calls(self):
+        for lang, utts in (("en-us", ["what is the weather tomorrow", "next tuesday at 4pm", "hello there"]),
+                           ("pt-pt", ["amanhã às 8 da manhã", "próxima segunda-feira", "olá mundo"]),
+                           ("es-es", ["mañana a las 8 de la mañana", "el próximo lunes", "hola mundo"])):
+            items = [(utt, self.anchor) for utt in utts]
+            expected = [extract_datetime(utt, lang, self.anchor, time(9)) for utt in utts]
+            self.assertEqual(list(extract_datetime_batch(items, lang, time(9))), expected)
+
+    def test_lazy(self):
+        def items():
+            yield "tomorrow", self.anchor
+            raise AssertionError("consumed ahead of time")
+
+        results = extract_datetime_batch(items(), "en")
+        self.assertIsInstance(results, GeneratorType)
+        self.assertEqual(next(results)[0], datetime(2024, 3, 15, 0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from ovos_date_parser import benchmark
+from ovos_date_parser.benchmark import DATETIME_CORPUS, DURATION_CORPUS, bench, main, run_benchmarks
+from ovos_date_parser.registry import get_supported_langs
+
+
+class TestBenchmark(unittest.TestCase):
+    def test_corpus_covers_dispatch(self):
+        self.assertEqual(set(DATETIME_CORPUS), get_supported_langs("extract_datetime"))
+        self.assertEqual(set(DURATION_CORPUS), get_supported_langs("extract_duration"))
+
+    def test_report(self):
+        report = run_benchmarks(["en", "pt"], ["nice_time", "extract_duration"], rounds=1)
+        self.assertEqual([(r["api"], r["lang"]) for r in report["results"]],
+                         [("nice_time", "en"), ("nice_time", "pt"),
+                          ("extract_duration", "en"), ("extract_duration", "pt")])
+        for result in report["results"]:
+            self.assertEqual(result["errors"], 0)
+            self.assertLessEqual(result["p50_us"], result["p99_us"])
+            self.assertGreater(result["throughput"], 0)
+        self.assertEqual(report["meta"]["rounds"], 1)
+
+    def test_failures_not_timed(self):
+        with patch.object(benchmark, "_cases", return_value=[lambda: None, lambda: 1 / 0]):
+            result = bench("nice_time", "en", rounds=3)
+        self.assertEqual((result["calls"], result["errors"]), (3, 1))
+        self.assertEqual(result["failures"], ["ZeroDivisionError: division by zero"])
+        with patch.object(benchmark, "_cases", return_value=[lambda: 1 / 0]):
+            result = bench("nice_time", "en", rounds=3)
+        self.assertEqual((result["calls"], result["p50_us"], result["throughput"]), (0, None, None))
+
+    def test_unknown_api(self):
+        with self.assertRaises(ValueError):
+            run_benchmarks(["en"], ["nice_weather"])
+
+    def test_main_writes_json(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "report.json")
+            main(["--lang", "en", "--api", "nice_year", "--rounds", "1", "--output", path])
+            with open(path) as f:
+                report = json.load(f)
+        self.assertEqual(report["results"][0]["api"], "nice_year")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from ovos_date_parser import nice_duration, nice_duration_batch, nice_relative_time, nice_relative_time_batch
+from ovos_date_parser import bulk
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DURATIONS = [0, 1, 59, 60, 61, 119.5, 3599, 3600, 3601, 86399, 86400, 86401, 90061, 1234567.89,
+             timedelta(seconds=59.6), timedelta(days=2, hours=3, minutes=4, seconds=5)]
+
+
+class TestNiceDurationBatch(unittest.TestCase):
+
+    def assertSameAsNiceDuration(self, durations, lang, speech):
+        self.assertEqual(nice_duration_batch(durations, lang, speech),
+                         [nice_duration(duration, lang, speech) for duration in durations])
+
+    def test_generic(self):
+        for lang in ("en-us", "pt-pt", "de-de", "fr-fr"):
+            for speech in (True, False):
+                self.assertSameAsNiceDuration(DURATIONS, lang, speech)
+
+    def test_language_specific(self):
+        seconds = [d.total_seconds() if isinstance(d, timedelta) else d for d in DURATIONS]
+        self.assertSameAsNiceDuration(seconds, "ru-ru", True)
+        self.assertSameAsNiceDuration(DURATIONS, "az-az", False)
+
+    def test_without_numpy(self):
+        with patch.object(bulk, "_numpy", return_value=None):
+            self.assertSameAsNiceDuration(DURATIONS, "en", True)
+            self.assertSameAsNiceDuration(DURATIONS, "en", False)
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_numpy(self):
+        seconds = np.array([0, 61, 3600, 90061.4])
+        self.assertEqual(nice_duration_batch(seconds, "en", False), ["0:00", "1:01", "1:00:00", "1d 1:01:01"])
+        deltas = np.array([61, 3600], dtype="timedelta64[s]")
+        self.assertEqual(nice_duration_batch(deltas, "en"), ["one minute one second", "one hour"])
+
+    def test_empty(self):
+        self.assertEqual(nice_duration_batch([], "en"), [])
+
+
+
+class TestNiceRelativeTimeBatch(unittest.TestCase):
+    relative_to = datetime(2024, 3, 14, 13, 37, 12, 345678)
+    seconds = (1, 2.5, 59, 89.9, 90, 5399, 5430, 3600 * 35.5, 3600 * 36, 129600, 10 ** 6)
+
+    def setUp(self):
+        self.whens = [self.relative_to + timedelta(seconds=seconds) for seconds in self.seconds]
+
+    def assertSameAsNiceRelativeTime(self, whens, lang):
+        self.assertEqual(nice_relative_time_batch(whens, self.relative_to, lang),
+                         [nice_relative_time(when, self.relative_to, lang) for when in whens])
+
+    def test_same_results(self):
+        self.assertSameAsNiceRelativeTime(self.whens + [self.relative_to], "en-us")
+        for lang in ("pt-pt", "eu-eu", "de-de"):
+            self.assertSameAsNiceRelativeTime(self.whens, lang)
+
+    def test_without_numpy(self):
+        with patch.object(bulk, "_numpy", return_value=None):
+            self.assertSameAsNiceRelativeTime(self.whens, "en")
+            self.assertSameAsNiceRelativeTime(self.whens, "eu")
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_numpy(self):
+        whens = np.array(self.whens[:3] + [None], dtype="datetime64[us]")
+        self.assertEqual(nice_relative_time_batch(whens, self.relative_to, "en"),
+                         ["one second", "two point five seconds", "fifty nine seconds", None])
+
+
+if __name__ == "__main__":
+    unittest.main()
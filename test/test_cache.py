@@ -0,0 +1,121 @@
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from ovos_date_parser import (
+    disable_extract_cache, disable_format_cache, enable_extract_cache, enable_format_cache, extract_cache_info,
+    extract_datetime, extract_duration, format_cache_info, nice_duration, nice_time, prewarm_nice_time
+)
+from ovos_date_parser.cache import LRUCache
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_eviction(self):
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        cache.put("c", 3)  # "b" is the least recently used
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(tuple(cache.info()), (2, 1, 1, 2, 2))
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            LRUCache(0)
+
+
+class TestExtractCache(unittest.TestCase):
+    anchor = datetime(2024, 3, 14, 13, 37, 0, 250000)
+
+    def setUp(self):
+        enable_extract_cache(16)
+
+    def tearDown(self):
+        disable_extract_cache()
+
+    def test_disabled_by_default(self):
+        disable_extract_cache()
+        self.assertIsNone(extract_cache_info())
+
+    def test_relative_reused_across_dates(self):
+        expected = [extract_datetime("in 5 minutes", "en", self.anchor + timedelta(days=d))
+                    for d in range(3)]
+        info = extract_cache_info()
+        self.assertEqual((info.hits, info.misses), (2, 1))
+        # results are unchanged and keep the language return type
+        disable_extract_cache()
+        self.assertEqual(expected, [extract_datetime("in 5 minutes", "en", self.anchor + timedelta(days=d))
+                                    for d in range(3)])
+
+    def test_absolute_keyed_on_anchor(self):
+        first = extract_datetime("next tuesday at 4pm", "en", self.anchor)
+        self.assertEqual(extract_datetime("next tuesday at 4pm", "en", self.anchor), first)
+        other = extract_datetime("next tuesday at 4pm", "en", self.anchor + timedelta(days=1))
+        self.assertEqual(other[0], datetime(2024, 3, 19, 16, 0))
+        info = extract_cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 2))
+
+    def test_no_date(self):
+        self.assertIsNone(extract_datetime("give me 5 of them", "en", self.anchor))
+        self.assertIsNone(extract_datetime("give me 5 of them", "en", self.anchor + timedelta(days=5)))
+        self.assertEqual(extract_cache_info().hits, 1)
+
+    def test_prefiltered(self):
+        # rejected by has_datetime, never parsed nor cached
+        self.assertIsNone(extract_datetime("hello there", "en", self.anchor))
+        self.assertEqual(extract_cache_info().misses, 0)
+
+    def test_duration(self):
+        self.assertEqual(extract_duration("set a timer for 5 minutes", "en-us"),
+                         (timedelta(minutes=5), "set a timer for"))
+        self.assertEqual(extract_duration("set a timer for 5 minutes", "en-gb"),
+                         (timedelta(minutes=5), "set a timer for"))
+        info = extract_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 1, 1))
+
+    def test_size_from_config(self):
+        with patch("ovos_config.Configuration", return_value={"date_parser": {"cache_size": 3}}):
+            enable_extract_cache()
+        self.assertEqual(extract_cache_info().maxsize, 3)
+
+
+class TestFormatCache(unittest.TestCase):
+    def setUp(self):
+        enable_format_cache(4096)
+
+    def tearDown(self):
+        disable_format_cache()
+
+    def test_nice_time_keyed_on_minute(self):
+        self.assertEqual(nice_time(datetime(2024, 3, 14, 13, 37), "en-us"), "one thirty seven")
+        self.assertEqual(nice_time(datetime(2019, 1, 1, 13, 37, 59), "en-gb"), "one thirty seven")
+        self.assertEqual(nice_time(datetime(2024, 3, 14, 13, 37), "en", use_24hour=True), "thirteen thirty seven")
+        info = format_cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 2))
+
+    def test_prewarm(self):
+        prewarm_nice_time("pt-pt", speech=False)
+        self.assertEqual(format_cache_info().currsize, 24 * 60)
+        memoized = [nice_time(datetime(2024, 3, 14, h, 30), "pt", speech=False) for h in range(24)]
+        self.assertEqual(format_cache_info().misses, 24 * 60)
+        disable_format_cache()
+        self.assertEqual(memoized, [nice_time(datetime(2024, 3, 14, h, 30), "pt", speech=False)
+                                    for h in range(24)])
+
+    def test_nice_duration_whole_seconds(self):
+        self.assertEqual(nice_duration(93784, "en"), nice_duration(timedelta(seconds=93784), "en"))
+        nice_duration(93784, "en")
+        nice_duration(1.5, "en")
+        info = format_cache_info()
+        self.assertEqual((info.hits, info.currsize), (1, 2))
+
+    def test_nice_duration_lang_tag(self):
+        self.assertEqual(nice_duration(16, "en-US"), nice_duration(16, "en_us"))
+        self.assertEqual(format_cache_info().hits, 1)
+        # the region changes the number words
+        self.assertNotEqual(nice_duration(16, "pt-pt"), nice_duration(16, "pt-BR"))
+
+
+if __name__ == "__main__":
+    unittest.main()
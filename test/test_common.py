@@ -0,0 +1,60 @@
+import unittest
+from unittest.mock import patch
+
+from ovos_date_parser import common
+from ovos_date_parser.common import DurationScanner, _translate_word, invalidate_date_words
+
+
+class TestDateWordsCache(unittest.TestCase):
+    def setUp(self):
+        invalidate_date_words()
+
+    def test_loaded_once(self):
+        with patch("json.load", wraps=common.json.load) as load:
+            self.assertEqual(_translate_word("minutes", "en-us"), "minutes")
+            self.assertEqual(_translate_word("hours", "en"), "hours")
+            self.assertEqual(load.call_count, 1)
+
+    def test_invalidate(self):
+        _translate_word("minutes", "en")
+        invalidate_date_words("en-us")
+        self.assertNotIn("en", common._DATE_WORDS)
+        self.assertEqual(_translate_word("minutes", "en"), "minutes")
+
+    def test_unsupported(self):
+        with self.assertRaises(NotImplementedError):
+            _translate_word("minutes", "xx")
+
+
+class TestDurationScanner(unittest.TestCase):
+    scanner = DurationScanner(r"(?P<value>\d+(?:\.?\d+)?)\s+{unit}s?", [
+        ('days', 30, 'month'),
+        ('minutes', 1, 'minute'),
+        ('hours', 1, 'hour'),
+        ('days', 1, 'day'),
+    ])
+
+    def scan(self, text):
+        time_units = {'minutes': 0, 'hours': 0, 'days': 0}
+        return self.scanner.scan(text, time_units), time_units
+
+    def test_single_pass(self):
+        self.assertEqual(self.scan("timer for 2 days 1.5 hours and 10 minutes please"),
+                         ("timer for   and  please", {'minutes': 10, 'hours': 1.5, 'days': 2}))
+
+    def test_multiplier(self):
+        self.assertEqual(self.scan("1 month and 3 days"),
+                         (" and ", {'minutes': 0, 'hours': 0, 'days': 33}))
+
+    def test_no_match(self):
+        self.assertEqual(self.scan("what time is it"),
+                         ("what time is it", {'minutes': 0, 'hours': 0, 'days': 0}))
+
+    def test_joined_after_removal(self):
+        # removing "10 minutes" joins "2" and "hours", same as one regex per unit
+        self.assertEqual(self.scan("2 10 minutes hours"),
+                         ("", {'minutes': 10, 'hours': 2, 'days': 0}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import ovos_date_parser
+from ovos_date_parser import DateStringsFormatter, get_date_strings
+
+
+class TestDateStringsFormatter(unittest.TestCase):
+
+    def test_get_date_strings(self):
+        self.assertEqual(get_date_strings(datetime(2024, 3, 4, 13, 7), "en-us", "MDY", "half"), {
+            "date_string": "3/4/2024",
+            "time_string": "1:07",
+            "month_string": "March",
+            "day_string": "04",
+            "year_string": "2024",
+            "weekday_string": "Monday",
+        })
+        self.assertEqual(get_date_strings(datetime(2024, 3, 4, 13, 7), "en-us")["time_string"], "13:07")
+
+    def test_incremental(self):
+        formatter = DateStringsFormatter("en-us", "DMY", "full")
+        ticks = [datetime(2023, 12, 31, 23, 58, 30) + timedelta(seconds=second) for second in range(0, 240, 10)]
+        expected = [get_date_strings(now, "en", "DMY", "full") for now in ticks]
+        with patch.object(ovos_date_parser, "nice_weekday", wraps=ovos_date_parser.nice_weekday) as weekday, \
+                patch.object(ovos_date_parser, "nice_time", wraps=ovos_date_parser.nice_time) as time:
+            self.assertEqual([formatter.format(now) for now in ticks], expected)
+        # new year's eve and day, 23:58 to 00:02
+        self.assertEqual(weekday.call_count, 2)
+        self.assertEqual(time.call_count, 5)
+
+    def test_new_dict(self):
+        formatter = DateStringsFormatter("en")
+        first = formatter.format(datetime(2024, 3, 4, 13, 7))
+        first["time_string"] = "changed"
+        self.assertEqual(formatter.format(datetime(2024, 3, 4, 13, 7))["time_string"], "13:07")
+
+    def test_invalid_format(self):
+        with self.assertRaises(ValueError):
+            DateStringsFormatter("en", "DYM")
+
+
+if __name__ == "__main__":
+    unittest.main()
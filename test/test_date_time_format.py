@@ -0,0 +1,103 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from threading import Barrier
+from unittest.mock import patch
+
+import ovos_date_parser
+from ovos_date_parser import DateTimeFormat, date_time_format, nice_date, nice_month, nice_weekday, nice_year
+
+
+class TestDateTimeFormat(unittest.TestCase):
+    def test_nice_year(self):
+        for year, expected in [(1984, "nineteen eighty four"), (2005, "two thousand five"),
+                               (1900, "nineteen hundred"), (100, "one hundred"), (7, "seven")]:
+            self.assertEqual(nice_year(datetime(year, 1, 1), "en-us"), expected)
+        self.assertEqual(nice_year(datetime(1984, 1, 1), "en", bc=True), "nineteen eighty four b.c.")
+        # number words above 99 in the resource file
+        self.assertEqual(nice_year(datetime(1984, 1, 1), "da"), "nitten hundred og fire og firs")
+
+    def test_nice_date(self):
+        dt = datetime(2018, 6, 5)
+        self.assertEqual(nice_date(dt, "en-us"), "tuesday, june fifth, twenty eighteen")
+        self.assertEqual(nice_date(dt, "en", include_weekday=False), "june fifth, twenty eighteen")
+        self.assertEqual(nice_weekday(dt, "de"), "Dienstag")
+        self.assertEqual(nice_month(dt, "de"), "Juni")
+
+    def test_compiled(self):
+        formats = date_time_format.cache("en-us")
+        self.assertIs(date_time_format.cache("en"), formats)
+        self.assertIsInstance(formats.year_format.rules, tuple)
+        self.assertEqual(formats.weekday[0], "monday")
+        self.assertEqual((formats.month[0], formats.month[12]), (None, "december"))
+        with self.assertRaises(TypeError):
+            formats.date_format["today"] = "now"
+
+    def test_lazy_number_strings(self):
+        strings = date_time_format._number_strings(1984, date_time_format.cache("en"))
+        self.assertEqual("{x0} {x}".format_map(strings), "eighty four")
+        self.assertEqual(sorted(strings), ["x", "x0"])
+
+    def test_year_tables(self):
+        formatter = DateTimeFormat(date_time_format.config_path, year_range=range(1990, 2000))
+        formatter.cache("en")
+        self.assertEqual(formatter.year_format(datetime(1995, 1, 1), "en", True), "nineteen ninety five b.c.")
+        self.assertEqual(len(formatter.year_tables["en"][1]), 10)
+        self.assertEqual(formatter.year_format(datetime(2000, 1, 1), "en", False), "two thousand")
+        formatter.set_year_range(range(0))
+        self.assertEqual(formatter.year_tables, {})
+        self.assertEqual(formatter.year_format(datetime(1995, 1, 1), "en", False), "nineteen ninety five")
+        self.assertEqual(formatter.year_tables["en"], (range(0), (), ()))
+
+    def test_missing_lang(self):
+        self.assertIsNone(date_time_format.cache("xx"))
+        with self.assertRaises(NotImplementedError):
+            nice_date(datetime(2018, 6, 5), "tr")
+        with self.assertRaises(NotImplementedError):
+            date_time_format.year_format(datetime(2018, 6, 5), "xx-YY", False)
+        date_time_format.cache("xx-ZZ")
+        self.assertIn("xx", date_time_format._missing)
+        self.assertNotIn("xx-ZZ", date_time_format._missing)
+
+
+class TestConcurrentLoading(unittest.TestCase):
+    langs = ["en", "de", "fr", "it", "da", "nl", "sv", "ca"]
+    workers = 16
+
+    def test_single_flight(self):
+        formatter = DateTimeFormat(date_time_format.config_path)
+        barrier = Barrier(self.workers)
+
+        def work(i):
+            lang = self.langs[i % len(self.langs)]
+            barrier.wait(timeout=10)
+            return lang, formatter.cache(lang), formatter.year_format(datetime(1984, 1, 1), lang, False)
+
+        compile_formats = ovos_date_parser._compile_formats
+        with patch.object(ovos_date_parser, "_compile_formats", wraps=compile_formats) as compiled:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                results = list(executor.map(work, range(self.workers * 8)))
+        self.assertEqual(compiled.call_count, len(self.langs))
+        for lang, formats, year in results:
+            self.assertIs(formats, formatter.formats[lang])
+            date_time_format.cache(lang)
+            self.assertEqual(year, date_time_format.year_format(datetime(1984, 1, 1), lang, False))
+
+    def test_year_range_changes(self):
+        formatter = DateTimeFormat(date_time_format.config_path)
+        formatter.cache("en")
+        dates = [datetime(year, 1, 1) for year in range(1890, 2030, 7)]
+        expected = [date_time_format.year_format(dt, "en", False) for dt in dates]
+
+        def work(i):
+            if i % 4 == 0:
+                formatter.set_year_range(range(1900 + i, 2000 + i))
+            return [formatter.year_format(dt, "en", False) for dt in dates]
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for found in executor.map(work, range(200)):
+                self.assertEqual(found, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
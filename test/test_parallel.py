@@ -0,0 +1,36 @@
+import unittest
+from datetime import datetime, timedelta
+
+from ovos_date_parser import extract_datetime, parallel_extract
+
+
+class TestParallelExtract(unittest.TestCase):
+    anchor = datetime(2024, 3, 14, 13, 37)
+
+    def test_datetime_order_preserved(self):
+        utts = ["tomorrow", "hello there", "next tuesday at 4pm", "in 5 minutes"] * 5
+        expected = [extract_datetime(u, "en", self.anchor) for u in utts]
+        results = list(parallel_extract(utts, "en", anchorDate=self.anchor,
+                                        chunk_size=3, max_workers=2))
+        self.assertEqual(results, expected)
+
+    def test_per_item_anchor(self):
+        other = self.anchor + timedelta(days=10)
+        results = list(parallel_extract([("tomorrow", other), "tomorrow"], "en",
+                                        anchorDate=self.anchor, max_workers=1))
+        self.assertEqual(results[0][0].date(), (other + timedelta(days=1)).date())
+        self.assertEqual(results[1][0].date(), (self.anchor + timedelta(days=1)).date())
+
+    def test_duration(self):
+        results = list(parallel_extract(["5 minutos", "olá"], "pt-pt",
+                                        extractor="duration", max_workers=1))
+        self.assertEqual(results[0][0], timedelta(minutes=5))
+        self.assertIsNone(results[1][0])
+
+    def test_invalid_args(self):
+        with self.assertRaises(ValueError):
+            list(parallel_extract(["x"], "en", extractor="numbers"))
+
+
+if __name__ == "__main__":
+    unittest.main()
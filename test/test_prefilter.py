@@ -0,0 +1,52 @@
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+
+from ovos_date_parser import extract_datetime, extract_datetime_batch, extract_duration, has_datetime, has_duration
+from ovos_date_parser.registry import _RESOLVED
+
+
+class TestPrefilter(unittest.TestCase):
+    anchor = datetime(2024, 3, 14, 13, 37)
+
+    def test_has_datetime(self):
+        self.assertFalse(has_datetime("what is the weather like at the beach", "en-us"))
+        self.assertTrue(has_datetime("what is the weather like on Tuesdays", "en-us"))
+        self.assertTrue(has_datetime("remind me in 5 minutes", "en"))
+        # number words, ordinals and accents
+        self.assertTrue(has_datetime("in twenty minutes", "en"))
+        self.assertTrue(has_datetime("am dritten", "de"))
+        self.assertTrue(has_datetime("el miercoles", "es"))
+        self.assertTrue(has_datetime("nächsten Montagabend", "de"))
+        self.assertFalse(has_datetime("hola mundo", "es"))
+
+    def test_has_duration(self):
+        self.assertFalse(has_duration("set a timer", "en"))
+        self.assertTrue(has_duration("set a timer for a day", "en"))
+        self.assertTrue(has_duration("3 Tagen", "de"))
+        self.assertTrue(has_duration("um mês", "pt"))
+        self.assertTrue(has_duration("en kvart", "sv"))
+        self.assertFalse(has_duration("hej världen", "sv"))
+
+    def test_no_index(self):
+        self.assertTrue(has_datetime("bonjour le monde", "fr"))
+        self.assertTrue(has_duration("hola món", "ca"))
+
+    def test_early_exit(self):
+        parse = Mock()
+        with patch.dict(_RESOLVED["extract_datetime"], {"en": parse}):
+            self.assertIsNone(extract_datetime("hello there", "en", self.anchor))
+            self.assertEqual(list(extract_datetime_batch([("hello there", None)], "en")), [None])
+        parse.assert_not_called()
+        self.assertIsNone(extract_duration("hej världen", "sv"))
+        # parsers returning a remainder are always called
+        self.assertEqual(extract_duration("hello there", "en"), (None, "hello there"))
+
+    def test_results_unchanged(self):
+        self.assertEqual(extract_datetime("next tuesday at 4pm", "en", self.anchor)[0],
+                         datetime(2024, 3, 19, 16, 0))
+        self.assertEqual(extract_duration("om fem minuter", "sv")[0], timedelta(minutes=5))
+
+
+if __name__ == "__main__":
+    unittest.main()
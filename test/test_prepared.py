@@ -0,0 +1,57 @@
+import pickle
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+from ovos_date_parser import PreparedText, extract_datetime, extract_datetime_span, extract_duration, prepare
+from ovos_date_parser import dates_de
+
+
+class TestPrepare(unittest.TestCase):
+    anchor = datetime(2024, 3, 14, 13, 37)
+
+    def test_same_results(self):
+        for lang, text in [("en-us", "set a timer for twenty minutes and wake me tomorrow at seven"),
+                           ("pt-pt", "lembra-me daqui a vinte minutos"),
+                           ("es-es", "recuérdame el miércoles en veinte minutos"),
+                           ("de-de", "erinnere mich morgen um sieben für fünf Minuten"),
+                           ("nl-nl", "herinner me morgen over twintig minuten")]:
+            prepared = prepare(text, lang)
+            self.assertIsInstance(prepared, str)
+            self.assertEqual(prepared, text)
+            self.assertEqual(extract_duration(prepared, lang), extract_duration(text, lang))
+            self.assertEqual(extract_datetime(prepared, lang, self.anchor),
+                             extract_datetime(text, lang, self.anchor))
+
+    def test_normalized_once(self):
+        prepared = prepare("erinnere mich morgen um sieben für fünf Minuten", "de")
+        with patch.object(dates_de, "numbers_to_digits_de", wraps=dates_de.numbers_to_digits_de) as convert:
+            extract_duration(prepared, "de")
+            extract_datetime(prepared, "de", self.anchor)
+            extract_datetime(prepared, "de", datetime(2025, 1, 1))
+            extract_datetime_span(prepared, "de", self.anchor)
+        # once for durations, once for dates
+        self.assertEqual(convert.call_count, 2)
+
+    def test_words_not_shared(self):
+        # parsers blank the words they consume, the cached form must not change
+        prepared = prepare("what is Tuesday's weather forecast", "en")
+        first = extract_datetime(prepared, "en", self.anchor)
+        self.assertEqual(extract_datetime(prepared, "en", self.anchor), first)
+        self.assertEqual(extract_datetime_span(prepared, "en", self.anchor).remainder, first[1])
+
+    def test_prepare_twice(self):
+        prepared = prepare("in 5 minutes", "en")
+        self.assertIs(prepare(prepared, "en"), prepared)
+        self.assertIsNot(prepare(prepared, "pt"), prepared)
+
+    def test_pickle(self):
+        prepared = prepare("in 5 minutes", "en")
+        extract_duration(prepared, "en")
+        restored = pickle.loads(pickle.dumps(prepared))
+        self.assertIsInstance(restored, PreparedText)
+        self.assertEqual((restored, restored.lang, restored._forms), ("in 5 minutes", "en", {}))
+
+
+if __name__ == "__main__":
+    unittest.main()
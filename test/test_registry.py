@@ -0,0 +1,97 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+from ovos_date_parser import (
+    extract_duration, get_capabilities, get_supported_langs, is_supported, nice_time
+)
+from ovos_date_parser.dates_en import extract_duration_en
+from ovos_date_parser.registry import closest_resource_lang, get_implementation, normalize_lang
+
+
+class TestLanguageRegistry(unittest.TestCase):
+    def test_normalize_lang(self):
+        self.assertEqual(normalize_lang("en-US"), "en")
+        self.assertEqual(normalize_lang("pt_BR"), "pt")
+        self.assertEqual(normalize_lang("DE-de"), "de")
+        self.assertEqual(normalize_lang("xx-yy"), "xx")
+
+    def test_closest_resource_lang(self):
+        self.assertEqual(closest_resource_lang("en-US", "date_time.json"), "en")
+        self.assertEqual(closest_resource_lang("pt_BR", "date_words.json"), "pt")
+        # only date_words.json
+        self.assertEqual(closest_resource_lang("tr-TR", "date_words.json"), "tr")
+        self.assertIsNone(closest_resource_lang("tr-TR", "date_time.json"))
+        self.assertIsNone(closest_resource_lang("../en", "date_time.json"))
+
+    def test_closest_resource_lang_regional(self):
+        with tempfile.TemporaryDirectory() as res_dir:
+            for code in ("pt", "pt-br"):
+                os.makedirs(os.path.join(res_dir, code))
+                open(os.path.join(res_dir, code, "date_time.json"), "w").close()
+            self.assertEqual(closest_resource_lang("pt-BR", "date_time.json", res_dir), "pt-br")
+            self.assertEqual(closest_resource_lang("pt-PT", "date_time.json", res_dir), "pt")
+            self.assertEqual(closest_resource_lang("pt-BR-x-test", "date_time.json", res_dir), "pt-br")
+
+    def test_missing_language_memoized(self):
+        closest_resource_lang("xx-YY", "date_time.json")
+        with patch("os.path.isfile") as isfile:
+            self.assertIsNone(closest_resource_lang("xx-YY", "date_time.json"))
+            self.assertFalse(is_supported("nice_date", "xx-YY"))
+            isfile.assert_not_called()
+
+    def test_dispatch(self):
+        self.assertIs(get_implementation("extract_duration", "en-gb"), extract_duration_en)
+        self.assertIsNone(get_implementation("extract_duration", "fr-fr"))
+        self.assertEqual(nice_time(datetime(2020, 1, 1, 13, 22), "EN-US", speech=False), "1:22")
+        with self.assertRaises(NotImplementedError):
+            extract_duration("vingt minutes", "fr-fr")
+
+    def test_capabilities(self):
+        caps = get_capabilities("pt-pt")
+        self.assertIn("extract_datetime", caps)
+        self.assertIn("nice_year", caps)
+        self.assertNotIn("extract_duration", get_capabilities("fr-fr"))
+        # generic implementation backed by date_words.json
+        self.assertTrue(is_supported("nice_duration", "tr-tr"))
+        self.assertFalse(is_supported("nice_time", "tr-tr"))
+        self.assertIn("en", get_supported_langs("extract_datetime"))
+        self.assertNotIn("gl", get_supported_langs("extract_datetime"))
+
+
+class TestLazyLoading(unittest.TestCase):
+    @staticmethod
+    def _loaded_after(code):
+        # fresh interpreter, other tests already imported language modules
+        out = subprocess.check_output([sys.executable, "-c", code + """
+import sys
+print(sorted(m for m in sys.modules if m.startswith(("ovos_date_parser.dates_", "dateparser"))))
+"""], text=True)
+        return eval(out.strip().splitlines()[-1])
+
+    def test_import_loads_no_language(self):
+        self.assertEqual(self._loaded_after("import ovos_date_parser"), [])
+
+    def test_language_loaded_on_first_use(self):
+        loaded = self._loaded_after("from ovos_date_parser import extract_duration\n"
+                                    "extract_duration('5 minutes', 'en-us')")
+        self.assertEqual(loaded, ["ovos_date_parser.dates_en"])
+
+    def test_preload(self):
+        loaded = self._loaded_after("from ovos_date_parser import preload\n"
+                                    "preload(['pt-pt', 'es'])")
+        self.assertEqual(loaded, ["ovos_date_parser.dates_es", "ovos_date_parser.dates_pt"])
+
+    def test_legacy_names(self):
+        from ovos_date_parser import extract_datetime_en, TimeVariantCA
+        from ovos_date_parser.dates_en import extract_datetime_en as impl
+        self.assertIs(extract_datetime_en, impl)
+        self.assertTrue(TimeVariantCA)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from ovos_date_parser import DateTimeMatch, DurationMatch, extract_datetime, extract_datetime_span, \
+    extract_datetimes, is_supported
+
+
+class TestDateTimeSpan(unittest.TestCase):
+    anchor = datetime(2024, 3, 14, 13, 37)
+
+    def assertSpan(self, text, surface):
+        match = extract_datetime_span(text, "en-us", self.anchor)
+        self.assertIsInstance(match, DateTimeMatch)
+        self.assertEqual(match.surface, surface)
+        self.assertEqual(text[match.start:match.end], surface)
+        # same date and remainder as extract_datetime
+        self.assertEqual([match.value, match.remainder], extract_datetime(text, "en", self.anchor))
+
+    def test_offsets(self):
+        self.assertSpan("Next Friday at noon I have a meeting", "Next Friday at noon")
+        self.assertSpan("the meeting in 5 minutes", "in 5 minutes")
+        self.assertSpan("what is Tuesday's weather forecast", "Tuesday's")
+        self.assertSpan("meet me at 4:30pm tomorrow, ok?", "at 4:30pm tomorrow")
+
+    def test_normalized_words(self):
+        # number words and "o clock" are rewritten before parsing
+        self.assertSpan("remind me in twenty five minutes please", "in twenty five minutes")
+        self.assertSpan("wake me up at 7 o clock", "at 7 o clock")
+
+    def test_lazy_remainder(self):
+        match = extract_datetime_span("set a timer for the day after tomorrow", "en", self.anchor)
+        self.assertIsNone(match._remainder)
+        self.assertEqual(match.remainder, "set timer")
+        self.assertEqual(match.span, (12, 38))
+
+    def test_no_date(self):
+        self.assertIsNone(extract_datetime_span("hello there", "en", self.anchor))
+
+    def test_accents(self):
+        self.assertEqual(extract_datetime_span("jantar amanhã às 8 da noite", "pt", self.anchor).surface,
+                         "amanhã às 8 da noite")
+
+    def test_unsupported(self):
+        self.assertTrue(is_supported("extract_datetime_span", "en-gb"))
+        with self.assertRaises(NotImplementedError):
+            extract_datetime_span("demain à 8 heures", "fr-fr")
+
+
+class TestDateTimes(unittest.TestCase):
+    anchor = datetime(2024, 3, 14, 13, 37)
+
+    def extract(self, text, lang):
+        return [(type(match), match.value, match.surface)
+                for match in extract_datetimes(text, lang, self.anchor)]
+
+    def test_document(self):
+        text = "Meet me next Friday at noon. The talk lasts 2 hours and 30 minutes! Bye"
+        self.assertEqual(self.extract(text, "en-us"), [
+            (DateTimeMatch, datetime(2024, 3, 22, 12, 0), "next Friday at noon"),
+            (DurationMatch, timedelta(hours=2, minutes=30), "2 hours and 30 minutes"),
+        ])
+
+    def test_sentences(self):
+        # one date per sentence, the parser would merge them into one
+        matches = list(extract_datetimes("monday at 5pm works. so does tuesday", "en", self.anchor))
+        self.assertEqual([match.value for match in matches],
+                         [datetime(2024, 3, 18, 17, 0), datetime(2024, 3, 19, 0, 0)])
+        self.assertEqual(matches[1].span, (29, 36))
+
+    def test_paragraphs(self):
+        text = "Hi all,\n\nDr. Smith arrives at 4:30 pm tomorrow!  The visit takes 3 days."
+        matches = list(extract_datetimes(text, "en", self.anchor))
+        self.assertEqual([match.surface for match in matches],
+                         ["at 4:30 pm tomorrow", "3 days"])
+        self.assertEqual(matches[0].value, datetime(2024, 3, 15, 16, 30))
+
+    def test_executor(self):
+        text = " ".join(["Meet me next Friday at noon. The talk lasts 2 hours."] * 20)
+        expected = [(match.value, match.span) for match in extract_datetimes(text, "en", self.anchor)]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            matches = extract_datetimes(text, "en", self.anchor, executor=executor)
+            self.assertEqual([(match.value, match.span) for match in matches], expected)
+        self.assertEqual(len(expected), 40)
+
+    def test_languages(self):
+        self.assertEqual(self.extract("Vamos jantar amanhã às 8 da noite. Olá", "pt"), [
+            (DateTimeMatch, datetime(2024, 3, 15, 22, 0), "amanhã às 8 da noite"),
+        ])
+        self.assertEqual(self.extract("Wir treffen uns am Montag um 10 Uhr.", "de"), [
+            (DateTimeMatch, datetime(2024, 3, 18, 10, 0), "Montag um 10 Uhr"),
+        ])
+        self.assertIn((DurationMatch, timedelta(hours=3, minutes=20), "3 horas y 20 minutos"),
+                      self.extract("La reunión dura 3 horas y 20 minutos.", "es"))
+
+    def test_overlapping(self):
+        # a duration is not a date from now
+        self.assertEqual(self.extract("set a timer for 10 minutes", "en"), [
+            (DurationMatch, timedelta(minutes=10), "10 minutes"),
+        ])
+        # a relative date is one match
+        self.assertEqual(self.extract("remind me in 5 minutes", "en"), [
+            (DateTimeMatch, datetime(2024, 3, 14, 13, 42), "in 5 minutes"),
+        ])
+        self.assertEqual(self.extract("remind me in 2 days at 5 pm", "en"), [
+            (DateTimeMatch, datetime(2024, 3, 16, 17, 0), "in 2 days at 5 pm"),
+        ])
+        # the pt parser does not read "daqui a 2 horas"
+        self.assertEqual(self.extract("daqui a 2 horas", "pt"), [
+            (DurationMatch, timedelta(hours=2), "2 horas"),
+        ])
+        # the parser would add the duration to the date
+        self.assertEqual(self.extract("meeting tomorrow at 5 pm for 2 hours", "en"), [
+            (DateTimeMatch, datetime(2024, 3, 15, 17, 0), "tomorrow at 5 pm"),
+            (DurationMatch, timedelta(hours=2), "2 hours"),
+        ])
+        self.assertEqual(self.extract("amanhã às 7 por 20 minutos", "pt"), [
+            (DateTimeMatch, datetime(2024, 3, 15, 7, 0), "amanhã às 7"),
+            (DurationMatch, timedelta(minutes=20), "20 minutos"),
+        ])
+        # a time of day written as a duration
+        self.assertEqual(self.extract("amanhã às 8 horas e 30 minutos", "pt"), [
+            (DateTimeMatch, datetime(2024, 3, 15, 8, 30), "amanhã às 8 horas e 30 minutos"),
+        ])
+
+    def test_clauses(self):
+        self.assertEqual(self.extract("call mom in 2 hours and dad on friday", "en"), [
+            (DateTimeMatch, datetime(2024, 3, 14, 15, 37), "in 2 hours"),
+            (DateTimeMatch, datetime(2024, 3, 15, 0, 0), "on friday"),
+        ])
+        self.assertEqual(self.extract("call mom tomorrow at 9 and dad on monday", "en"), [
+            (DateTimeMatch, datetime(2024, 3, 15, 9, 0), "tomorrow at 9"),
+            (DateTimeMatch, datetime(2024, 3, 18, 0, 0), "on monday"),
+        ])
+        # date words apart without a joiner are still one date
+        self.assertEqual(self.extract("tomorrow I am free at 5", "en"), [
+            (DateTimeMatch, datetime(2024, 3, 15, 5, 0), "tomorrow I am free at 5"),
+        ])
+
+    def test_ordinal_dates(self):
+        # quebra_frases ends a sentence after "3."
+        self.assertEqual(self.extract("Wir treffen uns am 3. märz 2020", "de"), [
+            (DateTimeMatch, datetime(2020, 3, 3, 0, 0), "3. märz 2020"),
+        ])
+        self.assertEqual(self.extract("Am 3. März 2020 um 10 Uhr. Danach essen wir", "de"), [
+            (DateTimeMatch, datetime(2020, 3, 3, 10, 0), "Am 3. März 2020 um 10 Uhr"),
+        ])
+        self.assertEqual(self.extract("Es gibt 3. Dann gehen wir", "de"), [])
+
+    def test_nothing_found(self):
+        self.assertEqual(self.extract("hello there. how are you?", "en"), [])
+        self.assertEqual(self.extract("", "pt"), [])
+        self.assertEqual(self.extract("\n\n", "pt"), [])
+
+    def test_unsupported(self):
+        self.assertTrue(is_supported("extract_datetimes", "pt-br"))
+        with self.assertRaises(NotImplementedError):
+            list(extract_datetimes("demain à 8 heures", "fr-fr"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+from datetime import datetime, timedelta
+
+from ovos_date_parser import Temporal, extract_temporal, prepare
+
+
+class TestExtractTemporal(unittest.TestCase):
+    anchor = datetime(2024, 3, 14, 13, 37)
+
+    def test_both(self):
+        self.assertEqual(extract_temporal("set an alarm for 20 minutes tomorrow at 7", "en-us", self.anchor),
+                         Temporal(timedelta(minutes=20), datetime(2024, 3, 15, 7, 0), "set alarm"))
+        self.assertEqual(extract_temporal("alarme de 20 minutos amanhã às 7", "pt-pt", self.anchor),
+                         Temporal(timedelta(minutes=20), datetime(2024, 3, 15, 7, 0), "alarme"))
+
+    def test_duration_not_a_date(self):
+        # extract_datetime alone reads "5 Minuten" as a time
+        result = extract_temporal("Timer für 5 Minuten morgen", "de", self.anchor)
+        self.assertEqual(result.duration, timedelta(minutes=5))
+        self.assertEqual(result.datetime, datetime(2024, 3, 15, 0, 0))
+        self.assertEqual(extract_temporal("amanhã às 7 por 20 minutos", "pt", self.anchor),
+                         Temporal(timedelta(minutes=20), datetime(2024, 3, 15, 7, 0), ""))
+
+    def test_punctuation(self):
+        self.assertEqual(extract_temporal("tomorrow at 7 for 20 minutes.", "en", self.anchor),
+                         Temporal(timedelta(minutes=20), datetime(2024, 3, 15, 7, 0), ""))
+        self.assertEqual(extract_temporal("amanhã às 7 por 20 minutos!", "pt", self.anchor),
+                         Temporal(timedelta(minutes=20), datetime(2024, 3, 15, 7, 0), ""))
+        # "años." is part of the duration, nothing of it is left for the date
+        result = extract_temporal("cinco años. ayer. a mediodía.", "es", self.anchor)
+        self.assertEqual(result[:2], (timedelta(days=1826, hours=5, minutes=6), datetime(2024, 3, 13, 0, 0)))
+
+    def test_relative_date(self):
+        # parsed as a date first, "in 2 days" is not a duration
+        self.assertEqual(extract_temporal("in 2 days at 5 pm", "en", self.anchor),
+                         Temporal(None, datetime(2024, 3, 16, 17, 0), ""))
+        self.assertEqual(extract_temporal("remind me in 20 minutes", "en", self.anchor),
+                         Temporal(None, datetime(2024, 3, 14, 13, 57), "remind me"))
+        self.assertEqual(extract_temporal("in 2 hours for 30 minutes", "en", self.anchor),
+                         Temporal(timedelta(minutes=30), datetime(2024, 3, 14, 15, 37), ""))
+        self.assertEqual(extract_temporal("daqui a 2 dias por 30 minutos", "pt", self.anchor)[:2],
+                         (timedelta(minutes=30), datetime(2024, 3, 16, 0, 0)))
+
+    def test_nothing_found(self):
+        self.assertEqual(extract_temporal("hello there", "en", self.anchor), (None, None, "hello there"))
+        self.assertEqual(extract_temporal(prepare("hello there", "en"), "en", self.anchor).remainder,
+                         "hello there")
+
+    def test_no_duration_support(self):
+        result = extract_temporal("demain à 8 heures", "fr-fr", self.anchor)
+        self.assertIsNone(result.duration)
+        self.assertEqual(result.datetime, datetime(2024, 3, 15, 8, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
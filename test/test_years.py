@@ -0,0 +1,56 @@
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+from ovos_date_parser import nice_year, years
+from ovos_date_parser.registry import _RESOLVED
+from ovos_date_parser.years import build_year_tables, main
+
+
+class TestYearTables(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = tmp.name
+        patcher = patch.object(years, "TABLES_DIR", self.dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(years._load_table.cache_clear)
+        years._load_table.cache_clear()
+
+    def test_same_results(self):
+        expected = {(lang, year, bc): nice_year(datetime(year, 1, 1), lang, bc)
+                    for lang in ("en", "es", "pt") for year in range(1, 120) for bc in (False, True)}
+        build_year_tables(["en-us", "es", "pt-br"], range(1, 100))
+        for (lang, year, bc), value in expected.items():
+            self.assertEqual(nice_year(datetime(year, 1, 1), lang, bc), value)
+
+    def test_lookup(self):
+        paths = build_year_tables(["es"], range(1900, 2001))
+        self.assertEqual(paths, [os.path.join(self.dir, "es", "years.json")])
+        live = {"es": lambda dt, bc: "live", "pt": lambda dt, bc: "live"}
+        with patch.dict(_RESOLVED["nice_year"], live):
+            self.assertNotEqual(nice_year(datetime(1984, 1, 1), "es-es"), "live")
+            # outside the table
+            self.assertEqual(nice_year(datetime(2024, 1, 1), "es"), "live")
+            # no table
+            self.assertEqual(nice_year(datetime(1984, 1, 1), "pt"), "live")
+
+    def test_consecutive_years(self):
+        with self.assertRaises(ValueError):
+            build_year_tables(["en"], range(1900, 2000, 10))
+
+    def test_main(self):
+        main(["--lang", "en", "--first", "1990", "--last", "1999"])
+        with open(os.path.join(self.dir, "en", "years.json"), encoding="utf-8") as f:
+            table = json.load(f)
+        self.assertEqual(table["start"], 1990)
+        self.assertEqual(table["ad"][-1], "nineteen ninety nine")
+        self.assertEqual(table["bc"][0], "nineteen ninety b.c.")
+
+
+if __name__ == "__main__":
+    unittest.main()